@@ -0,0 +1,342 @@
+"""Negotiated response compression middleware"""
+import logging
+import time
+import zlib
+
+try:
+    import brotli
+except ImportError:  # optional: br is not offered
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: zstd is not offered
+    zstandard = None
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from llm_mcp_hub.core.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Content types worth compressing (prefix match)
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+)
+
+_BYTES = REGISTRY.counter(
+    "llm_hub_response_compression_bytes_total",
+    "Response body bytes before (in) and after (out) compression",
+    ("encoding", "direction"),
+)
+_RATIO = REGISTRY.histogram(
+    "llm_hub_response_compression_ratio",
+    "Uncompressed to compressed size per response",
+    ("encoding",),
+    buckets=(1.0, 1.5, 2.0, 3.0, 4.0, 6.0, 8.0, 12.0, 16.0, 32.0),
+)
+_SECONDS = REGISTRY.histogram(
+    "llm_hub_response_compression_seconds",
+    "Time spent compressing per response",
+    ("encoding",),
+    buckets=(0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+_SKIPPED = REGISTRY.counter(
+    "llm_hub_response_compression_skipped_total",
+    "Compressible responses sent uncompressed",
+    ("reason",),
+)
+
+
+class _GzipEncoder:
+    __slots__ = ("_z",)
+
+    def __init__(self, level: int = 6):
+        self._z = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._z.compress(data)
+
+    def flush(self) -> bytes:
+        return self._z.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._z.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    __slots__ = ("_c",)
+
+    def __init__(self, quality: int = 4):
+        self._c = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._c.process(data)
+
+    def flush(self) -> bytes:
+        return self._c.flush()
+
+    def finish(self) -> bytes:
+        return self._c.finish()
+
+
+class _ZstdEncoder:
+    __slots__ = ("_c",)
+
+    def __init__(self, level: int = 3):
+        self._c = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._c.compress(data)
+
+    def flush(self) -> bytes:
+        return self._c.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._c.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+# Available encodings in server preference order
+ENCODERS: dict[str, type] = {}
+if zstandard is not None:
+    ENCODERS["zstd"] = _ZstdEncoder
+if brotli is not None:
+    ENCODERS["br"] = _BrotliEncoder
+ENCODERS["gzip"] = _GzipEncoder
+
+
+def negotiate(accept_encoding: str, available=ENCODERS) -> str | None:
+    """Pick the preferred available encoding the client accepts (q > 0)"""
+    if not accept_encoding:
+        return None
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token.strip().lower()] = q
+    wildcard = accepted.get("*", 0.0)
+    for encoding in available:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class CpuBudget:
+    """
+    Share of one CPU core that compression may use.
+
+    Compression runs on the event loop, so time spent there delays every
+    other request. Time is accounted in fixed windows; once the window's
+    budget is spent, new responses go out uncompressed until the next one.
+    """
+
+    def __init__(self, fraction: float = 0.5, window: float = 1.0):
+        self._limit = fraction * window
+        self._window = window
+        self._window_start = time.monotonic()
+        self._spent = 0.0
+
+    def _roll(self) -> None:
+        now = time.monotonic()
+        if now - self._window_start >= self._window:
+            self._window_start = now
+            self._spent = 0.0
+
+    def available(self) -> bool:
+        """Check whether a new response may be compressed"""
+        self._roll()
+        return self._spent < self._limit
+
+    def spend(self, seconds: float) -> None:
+        """Account compression time"""
+        self._roll()
+        self._spent += seconds
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with the best encoding the client accepts.
+
+    Whole responses are compressed when they reach minimum_size. Streamed
+    responses (no Content-Length: SSE, NDJSON exports) are compressed
+    message by message with a flush after each, and their headers go out
+    immediately, so every frame reaches the client as soon as it is sent.
+    When the CPU budget is used up, responses go out uncompressed. Every
+    compressible response carries Vary: Accept-Encoding, compressed or not.
+    Bytes, ratio and time per response are recorded in metrics.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        cpu_budget: float = 0.5,
+        compress_streams: bool = True,
+        encodings: dict[str, type] | None = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.budget = CpuBudget(cpu_budget)
+        self.compress_streams = compress_streams
+        self.encodings = ENCODERS if encodings is None else encodings
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressingResponder(self, encoding, send).send)
+
+
+class _CompressingResponder:
+    """Per-response compression state"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self._middleware = middleware
+        self._encoding = encoding
+        self._send = send
+        self._start: Message | None = None
+        # None: undecided, False: pass through, True: compressing
+        self._active: bool | None = None
+        self._is_stream = False
+        self._encoder = None
+        self._bytes_in = 0
+        self._bytes_out = 0
+        self._seconds = 0.0
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self._on_start(message)
+            if self._active is None and not self._is_stream:
+                # Wait for the first body message to see the size
+                self._start = message
+                return
+            if self._active:
+                self._begin(message)
+            await self._send(message)
+            return
+
+        if message_type != "http.response.body" or self._active is False:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._active is None:
+            # First body message of a buffered-start response
+            start, self._start = self._start, None
+            if not more_body:
+                await self._send_whole(start, body)
+                return
+            if not self._middleware.budget.available():
+                _SKIPPED.labels("cpu_budget").inc()
+                self._active = False
+                await self._send(start)
+                await self._send(message)
+                return
+            self._active = True
+            self._begin(start)
+            await self._send(start)
+
+        started = time.perf_counter()
+        data = self._encoder.compress(body)
+        data += self._encoder.flush() if more_body else self._encoder.finish()
+        self._account(len(body), len(data), time.perf_counter() - started)
+        if data or not more_body:
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+        if not more_body:
+            self._record()
+
+    def _on_start(self, message: Message) -> None:
+        """Decide from the response headers whether compression applies"""
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers:
+            self._active = False
+            return
+        status = message["status"]
+        compressible = headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+        if compressible or status == 304:
+            # The representation depends on Accept-Encoding even when sent uncompressed
+            MutableHeaders(scope=message).add_vary_header("Accept-Encoding")
+        if status < 200 or status in (204, 304) or not compressible:
+            self._active = False
+            return
+        if "content-length" not in headers:
+            # Streamed body: send the headers now, the first message may take a while
+            if not self._middleware.compress_streams:
+                self._active = False
+            elif not self._middleware.budget.available():
+                _SKIPPED.labels("cpu_budget").inc()
+                self._active = False
+            else:
+                self._is_stream = True
+                self._active = True
+
+    def _begin(self, start: Message) -> None:
+        """Set compression headers and create the encoder"""
+        headers = MutableHeaders(scope=start)
+        headers["Content-Encoding"] = self._encoding
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        self._encoder = self._middleware.encodings[self._encoding]()
+
+    async def _send_whole(self, start: Message, body: bytes) -> None:
+        """Send a single-message response, compressed if worthwhile"""
+        if len(body) < self._middleware.minimum_size:
+            if body:
+                _SKIPPED.labels("small").inc()
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+        if not self._middleware.budget.available():
+            _SKIPPED.labels("cpu_budget").inc()
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        started = time.perf_counter()
+        encoder = self._middleware.encodings[self._encoding]()
+        data = encoder.compress(body) + encoder.finish()
+        self._account(len(body), len(data), time.perf_counter() - started)
+        if len(data) >= len(body):
+            _SKIPPED.labels("incompressible").inc()
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        headers = MutableHeaders(scope=start)
+        headers["Content-Encoding"] = self._encoding
+        headers["Content-Length"] = str(len(data))
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": data})
+        self._record()
+
+    def _account(self, bytes_in: int, bytes_out: int, seconds: float) -> None:
+        self._bytes_in += bytes_in
+        self._bytes_out += bytes_out
+        self._seconds += seconds
+        self._middleware.budget.spend(seconds)
+
+    def _record(self) -> None:
+        """Record metrics for a finished compressed response"""
+        _BYTES.labels(self._encoding, "in").inc(self._bytes_in)
+        _BYTES.labels(self._encoding, "out").inc(self._bytes_out)
+        _SECONDS.labels(self._encoding).observe(self._seconds)
+        if self._bytes_out:
+            _RATIO.labels(self._encoding).observe(self._bytes_in / self._bytes_out)
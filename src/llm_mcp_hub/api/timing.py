@@ -0,0 +1,69 @@
+"""Server-Timing headers and structured access log"""
+import json
+import logging
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from llm_mcp_hub.core.timing import FIRST_BYTE, collect_timings
+
+access_logger = logging.getLogger("llm_mcp_hub.access")
+
+
+class TimingMiddleware:
+    """
+    Collect phase timings per request and report them.
+
+    Services record session load, validation, queue wait, spawn, first byte
+    and store write into the request's timings. The Server-Timing header
+    carries the phases finished when the response starts, which for a
+    stream is before the model runs; the SSE done event has the full
+    breakdown. Every request ends with one JSON line on the access logger.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True, access_log: bool = True):
+        self.app = app
+        self.server_timing = server_timing
+        self.access_log = access_log
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        request_id = request_headers.get("x-request-id")
+        status = 500
+        bytes_sent = 0
+
+        with collect_timings() as timings:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal request_id, status, bytes_sent
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    headers = MutableHeaders(scope=message)
+                    request_id = headers.get("x-request-id", request_id)
+                    if self.server_timing:
+                        headers.append("Server-Timing", timings.server_timing())
+                elif message["type"] == "http.response.body":
+                    body = message.get("body", b"")
+                    if body:
+                        timings.mark(FIRST_BYTE)
+                        bytes_sent += len(body)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                if self.access_log:
+                    access_logger.info(json.dumps({
+                        "request_id": request_id,
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status": status,
+                        "bytes": bytes_sent,
+                        "session_id": request_headers.get("x-session-id"),
+                        **timings.tags,
+                        "timings_ms": timings.as_dict(),
+                    }, separators=(",", ":")))
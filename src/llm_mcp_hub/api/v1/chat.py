@@ -1,30 +1,61 @@
 """Chat API endpoints"""
-import json
+import asyncio
 import logging
+from typing import Annotated, AsyncIterator
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
-from llm_mcp_hub.core.exceptions import LLMHubError
-from .dependencies import ChatServiceDep, SessionIdDep
-from .schemas import ChatCompletionRequest, ChatCompletionResponse
+from llm_mcp_hub.core.config import Settings
+from llm_mcp_hub.core.exceptions import LLMHubError, RequestCancelledError, RequestIdInUseError
+from llm_mcp_hub.core.timing import VALIDATION, current_timings, timed
+from llm_mcp_hub.services import InFlightRequest, ReplayLog, RequestRegistry
+from .dependencies import ChatServiceDep, RequestIdDep, RequestRegistryDep, SessionIdDep
+from .schemas import ChatCompletionRequest, ChatCompletionResponse, StreamOptions, json_request_body
+from .streaming import encode_event, encode_sse, stop_on_disconnect
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/chat", tags=["Chat"])
 
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
 
-@router.post("/completions", response_model=ChatCompletionResponse)
+
+@router.post(
+    "/completions",
+    response_model=ChatCompletionResponse,
+    openapi_extra=json_request_body(ChatCompletionRequest),
+)
 async def chat_completions(
-    request: ChatCompletionRequest,
     chat_service: ChatServiceDep,
     session_id: SessionIdDep,
+    registry: RequestRegistryDep,
+    request_id: RequestIdDep,
+    http_request: Request,
 ):
     """
     Chat completion endpoint.
 
     Supports both streaming and non-streaming responses.
     Use X-Session-ID header to maintain conversation context.
+    Every completion gets a request ID (X-Request-ID, client-chosen or
+    generated) that can be cancelled with DELETE /v1/requests/{id}.
+
+    Resumable streams (stream_options.resumable) keep running when the
+    client drops. Re-sending the request with the same X-Request-ID and a
+    Last-Event-ID header, or GET /v1/chat/streams/{id}, resumes after that
+    event.
+
+    The body is validated straight from bytes and the response is
+    serialized straight to bytes, which matters for long message lists.
     """
+    request = await _parse_request(http_request)
+
     # Validate messages
     if not request.messages:
         raise HTTPException(
@@ -32,67 +63,244 @@ async def chat_completions(
             detail={"code": "INVALID_REQUEST", "message": "Messages cannot be empty"},
         )
 
-    user_messages = [m for m in request.messages if m.role == "user"]
-    if not user_messages:
+    prompt, system_prompt = request.prompts()
+    if prompt is None:
         raise HTTPException(
             status_code=400,
             detail={"code": "INVALID_REQUEST", "message": "At least one user message is required"},
         )
 
+    settings: Settings = http_request.app.state.settings
+    last_event_id = http_request.headers.get("last-event-id")
+    if request.stream and request_id and last_event_id is not None:
+        return await _resume_stream(http_request, request_id, last_event_id, request.stream_options)
+
+    request_id = request_id or registry.new_request_id()
     try:
+        # Claimed atomically (across replicas with Redis) before anything runs
+        in_flight = await registry.register(request_id, request.provider, request.model, stream=request.stream)
+    except RequestIdInUseError as e:
+        raise HTTPException(status_code=409, detail=e.to_dict()["error"])
+
+    # Streams release the claim when they end; every other path does below
+    handed_off = False
+    try:
+        options = request.stream_options or StreamOptions()
+        resumable = options.resumable if options.resumable is not None else settings.sse_resumable
+        if request.stream and resumable:
+            replay_log: ReplayLog = http_request.app.state.replay_log
+            if not await replay_log.create(request_id):
+                raise HTTPException(
+                    status_code=409,
+                    detail={"code": "REQUEST_ID_IN_USE", "message": f"Request ID already used: {request_id}"},
+                )
+            recorder = asyncio.create_task(
+                _record_stream(
+                    registry,
+                    in_flight,
+                    replay_log,
+                    _stream_events(chat_service, request, prompt, system_prompt, session_id),
+                )
+            )
+            in_flight.task = recorder
+            handed_off = True
+            # Detached producers are kept on app state until they finish, so shutdown can stop them
+            recorders: set[asyncio.Task] = http_request.app.state.stream_recorders
+            recorders.add(recorder)
+            recorder.add_done_callback(recorders.discard)
+            return StreamingResponse(
+                stop_on_disconnect(http_request, _encode(_replay_events(replay_log, request_id, 0), options, settings)),
+                media_type="text/event-stream",
+                headers={**_SSE_HEADERS, "X-Request-ID": request_id},
+            )
+
         if request.stream:
+            handed_off = True
             return StreamingResponse(
-                _stream_response(chat_service, request, session_id),
+                _tracked_stream(
+                    registry,
+                    in_flight,
+                    http_request,
+                    _encode(_stream_events(chat_service, request, prompt, system_prompt, session_id), options, settings),
+                ),
                 media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "X-Accel-Buffering": "no",
-                },
+                headers={**_SSE_HEADERS, "X-Request-ID": request_id},
             )
 
-        # Non-streaming response
-        result = await chat_service.chat_with_messages(
-            messages=[m.model_dump() for m in request.messages],
-            provider=request.provider,
-            model=request.model,
-            session_id=session_id,
-            timeout=request.timeout,
+        # Non-streaming response, run as a task so it can be cancelled by ID
+        task = asyncio.create_task(
+            chat_service.chat(
+                prompt=prompt,
+                provider=request.provider,
+                model=request.model,
+                session_id=session_id,
+                system_prompt=system_prompt,
+                timeout=request.timeout,
+            )
         )
+        in_flight.task = task
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if not in_flight.cancelled.is_set():
+                raise
+            raise RequestCancelledError(request_id)
+        finally:
+            task.cancel()
 
-        return ChatCompletionResponse(
+        body = ChatCompletionResponse(
             response=result["response"],
             session_id=result["session_id"],
             provider=result["provider"],
             model=result["model"],
-        )
+        ).model_dump_json()
+        return Response(content=body, media_type="application/json", headers={"X-Request-ID": request_id})
 
+    except HTTPException:
+        raise
     except LLMHubError as e:
         logger.error(f"Chat error: {e.code} - {e.message}")
         raise HTTPException(
             status_code=_error_to_status(e.code),
             detail=e.to_dict()["error"],
+            headers={"X-Request-ID": request_id},
         )
     except Exception as e:
         logger.exception("Unexpected chat error")
-        raise HTTPException(status_code=500, detail={"code": "INTERNAL_ERROR", "message": str(e)})
+        raise HTTPException(
+            status_code=500,
+            detail={"code": "INTERNAL_ERROR", "message": str(e)},
+            headers={"X-Request-ID": request_id},
+        )
+    finally:
+        if not handed_off:
+            await registry.unregister(in_flight)
+
+
+async def _parse_request(http_request: Request) -> ChatCompletionRequest:
+    """Validate the request body from raw bytes, without an intermediate dict"""
+    body = await http_request.body()
+    try:
+        with timed(VALIDATION):
+            return ChatCompletionRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
 
+async def _tracked_stream(
+    registry: RequestRegistry,
+    in_flight: InFlightRequest,
+    http_request: Request,
+    frames: AsyncIterator[str],
+) -> AsyncIterator[str]:
+    """Relay SSE frames, then release the request's claim"""
+    try:
+        async for frame in stop_on_disconnect(http_request, frames, in_flight.cancelled):
+            yield frame
+        if in_flight.cancelled.is_set():
+            error = RequestCancelledError(in_flight.id)
+            yield encode_event({"type": "error", "error": error.message, "code": error.code})
+    finally:
+        await registry.unregister(in_flight)
+
+
+@router.get("/streams/{request_id}")
+async def resume_stream(
+    request_id: str,
+    http_request: Request,
+    last_event_id: Annotated[str | None, Header()] = None,
+):
+    """Replay a resumable stream after Last-Event-ID (from the start without it) and follow it"""
+    return await _resume_stream(http_request, request_id, last_event_id or "0", None)
 
-async def _stream_response(chat_service, request: ChatCompletionRequest, session_id: str | None):
-    """Generate SSE stream response"""
+
+async def _resume_stream(
+    http_request: Request,
+    request_id: str,
+    last_event_id: str,
+    options: StreamOptions | None,
+) -> StreamingResponse:
+    """Stream a recorded stream from after last_event_id"""
     try:
-        # Extract last user message as prompt
-        user_messages = [m for m in request.messages if m.role == "user"]
-        if not user_messages:
-            yield f"event: error\ndata: {json.dumps({'type': 'error', 'error': 'No user message found'})}\n\n"
-            return
+        after = int(last_event_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "INVALID_REQUEST", "message": f"Invalid Last-Event-ID: {last_event_id}"},
+        )
+
+    replay_log: ReplayLog = http_request.app.state.replay_log
+    try:
+        await replay_log.check(request_id, after)
+    except LLMHubError as e:
+        raise HTTPException(status_code=_error_to_status(e.code), detail=e.to_dict()["error"])
 
-        prompt = user_messages[-1].content
+    logger.info(f"Resuming stream {request_id} after event {after}")
+    return StreamingResponse(
+        stop_on_disconnect(
+            http_request,
+            _encode(
+                _replay_events(replay_log, request_id, after),
+                options or StreamOptions(),
+                http_request.app.state.settings,
+            ),
+        ),
+        media_type="text/event-stream",
+        headers={**_SSE_HEADERS, "X-Request-ID": request_id},
+    )
 
-        # Extract system prompt
-        system_messages = [m for m in request.messages if m.role == "system"]
-        system_prompt = system_messages[0].content if system_messages else None
 
+async def _replay_events(replay_log: ReplayLog, request_id: str, after: int) -> AsyncIterator[dict]:
+    """Read a recorded stream, reporting replay errors as error events"""
+    try:
+        async for event in replay_log.read(request_id, after):
+            yield event
+    except LLMHubError as e:
+        yield {"type": "error", "error": e.message, "code": e.code}
+
+
+async def _record_stream(
+    registry: RequestRegistry,
+    in_flight: InFlightRequest,
+    replay_log: ReplayLog,
+    events: AsyncIterator[dict],
+) -> None:
+    """Produce a resumable stream into the replay log, independent of any client"""
+    try:
+        await replay_log.record(in_flight.id, events)
+    finally:
+        await registry.unregister(in_flight)
+
+
+async def _encode(events: AsyncIterator[dict], options: StreamOptions, settings: Settings) -> AsyncIterator[str]:
+    """Encode events as SSE frames with per-request options over server defaults"""
+    flush_interval_ms = options.flush_interval_ms
+    if flush_interval_ms is None:
+        flush_interval_ms = settings.sse_flush_interval_ms
+    keepalive = options.keepalive_seconds
+    if keepalive is None:
+        keepalive = settings.sse_keepalive_seconds
+
+    async for frame in encode_sse(
+        events,
+        flush_interval=flush_interval_ms / 1000,
+        max_chunk_bytes=options.max_chunk_bytes or settings.sse_max_chunk_bytes,
+        keepalive=keepalive or None,
+    ):
+        yield frame
+
+
+async def _stream_events(
+    chat_service,
+    request: ChatCompletionRequest,
+    prompt: str,
+    system_prompt: str | None,
+    session_id: str | None,
+):
+    """Generate stream events, reporting errors as error events"""
+    try:
         async for event in chat_service.chat_stream(
             prompt=prompt,
             provider=request.provider,
@@ -101,28 +309,25 @@ async def _stream_response(chat_service, request: ChatCompletionRequest, session
             system_prompt=system_prompt,
         ):
             if event["type"] == "content":
-                data = {
-                    "type": "content",
-                    "text": event["text"],
-                }
-                yield f"event: message\ndata: {json.dumps(data)}\n\n"
+                yield {"type": "content", "text": event["text"]}
 
             elif event["type"] == "done":
-                data = {
+                done = {
                     "type": "done",
                     "session_id": event.get("session_id"),
                     "provider": event.get("provider"),
                     "model": event.get("model"),
                 }
-                yield f"event: done\ndata: {json.dumps(data)}\n\n"
+                timings = current_timings()
+                if timings is not None:
+                    done["timings_ms"] = timings.as_dict()
+                yield done
 
     except LLMHubError as e:
-        error_data = {"type": "error", "error": e.message, "code": e.code}
-        yield f"event: error\ndata: {json.dumps(error_data)}\n\n"
+        yield {"type": "error", "error": e.message, "code": e.code}
 
     except Exception as e:
-        error_data = {"type": "error", "error": str(e), "code": "INTERNAL_ERROR"}
-        yield f"event: error\ndata: {json.dumps(error_data)}\n\n"
+        yield {"type": "error", "error": str(e), "code": "INTERNAL_ERROR"}
 
 
 def _error_to_status(code: str) -> int:
@@ -135,5 +340,9 @@ def _error_to_status(code: str) -> int:
         "PROVIDER_ERROR": 502,
         "PROVIDER_TIMEOUT": 504,
         "TOKEN_EXPIRED": 401,
+        "CONTEXT_QUOTA_EXCEEDED": 413,
+        "REQUEST_CANCELLED": 409,
+        "REQUEST_ID_IN_USE": 409,
+        "STREAM_NOT_RESUMABLE": 410,
     }
     return status_map.get(code, 500)
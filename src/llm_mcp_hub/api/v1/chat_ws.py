@@ -0,0 +1,164 @@
+"""WebSocket chat endpoint"""
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+
+from llm_mcp_hub.core.exceptions import LLMHubError, RequestCancelledError, RequestIdInUseError
+from llm_mcp_hub.services import ChatService, Conversation, InFlightRequest, RequestRegistry
+from .streaming import encode_json
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/chat", tags=["Chat"])
+
+# Close code for connections that cannot be bound to a session
+_POLICY_VIOLATION = 1008
+
+
+def _error(code: str, message: str, request_id: str | None = None) -> str:
+    event: dict[str, Any] = {"type": "error", "error": message, "code": code}
+    if request_id is not None:
+        event["request_id"] = request_id
+    return encode_json(event)
+
+
+@router.websocket("/ws")
+async def chat_websocket(
+    websocket: WebSocket,
+    session_id: str | None = None,
+    provider: str | None = None,
+    model: str | None = None,
+):
+    """
+    Chat over a WebSocket bound to one session.
+
+    The session is given by the session_id query parameter or X-Session-ID
+    header and must already exist; provider/model are checked against it.
+    The session, adapter and model are resolved once and reused for every
+    turn.
+
+    Client frames:
+    - {"type": "message", "content": "...", "request_id": "..."} starts a turn
+      (request_id is optional)
+    - {"type": "cancel"} cancels the running turn
+
+    Server frames: a session frame on connect, then per turn content frames
+    with deltas and a done frame, or an error frame. Turns are also
+    registered as in-flight requests, so DELETE /v1/requests/{id} works too.
+    Frames from the receive loop and the running turn go through one lock,
+    so they are never written concurrently.
+    """
+    await websocket.accept()
+    state = websocket.app.state
+    chat_service: ChatService = state.chat_service
+    registry: RequestRegistry = state.request_registry
+
+    session_id = session_id or websocket.headers.get("x-session-id")
+    if session_id is None:
+        await websocket.send_text(_error("INVALID_REQUEST", "session_id or X-Session-ID is required"))
+        await websocket.close(code=_POLICY_VIOLATION)
+        return
+    try:
+        conversation = await chat_service.open_conversation(session_id, provider, model)
+    except LLMHubError as e:
+        await websocket.send_text(_error(e.code, e.message))
+        await websocket.close(code=_POLICY_VIOLATION)
+        return
+    except ValueError as e:
+        await websocket.send_text(_error("INVALID_REQUEST", str(e)))
+        await websocket.close(code=_POLICY_VIOLATION)
+        return
+
+    send_lock = asyncio.Lock()
+
+    async def send(frame: str) -> None:
+        async with send_lock:
+            await websocket.send_text(frame)
+
+    await send(encode_json({
+        "type": "session",
+        "session_id": conversation.session.id,
+        "provider": conversation.provider,
+        "model": conversation.model,
+    }))
+
+    turn: asyncio.Task | None = None
+    turn_id: str | None = None
+    in_flight: InFlightRequest | None = None
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+            except json.JSONDecodeError:
+                await send(_error("INVALID_REQUEST", "Frames must be JSON"))
+                continue
+
+            kind = message.get("type") if isinstance(message, dict) else None
+            if kind == "cancel":
+                if turn is not None and not turn.done():
+                    await registry.cancel(turn_id)
+                continue
+
+            content = message.get("content") if kind == "message" else None
+            if not isinstance(content, str) or not content:
+                await send(_error("INVALID_REQUEST", "Expected a message frame with content"))
+                continue
+            if turn is not None and not turn.done():
+                await send(_error("INVALID_REQUEST", "A turn is already in progress"))
+                continue
+
+            turn_id = message.get("request_id") or registry.new_request_id()
+            try:
+                in_flight = await registry.register(turn_id, conversation.provider, conversation.model, stream=True)
+            except RequestIdInUseError as e:
+                await send(_error(e.code, e.message))
+                continue
+            turn = asyncio.create_task(_run_turn(send, chat_service, registry, in_flight, conversation, content))
+            in_flight.task = turn
+    except WebSocketDisconnect:
+        logger.debug(f"WebSocket closed for session {conversation.session.id}")
+    finally:
+        if turn is not None:
+            turn.cancel()
+            await asyncio.gather(turn, return_exceptions=True)
+            # A turn cancelled before it started never released its id
+            await registry.unregister(in_flight)
+
+
+async def _run_turn(
+    send: Callable[[str], Awaitable[None]],
+    chat_service: ChatService,
+    registry: RequestRegistry,
+    in_flight: InFlightRequest,
+    conversation: Conversation,
+    prompt: str,
+) -> None:
+    """Stream one turn to the client, then release its request id"""
+    request_id = in_flight.id
+    try:
+        async for event in chat_service.stream_conversation(conversation, prompt):
+            if event["type"] == "content":
+                await send(encode_json({"type": "content", "text": event["text"]}))
+        await send(encode_json({
+            "type": "done",
+            "request_id": request_id,
+            "session_id": conversation.session.id,
+            "provider": conversation.provider,
+            "model": conversation.model,
+        }))
+    except asyncio.CancelledError:
+        if not in_flight.cancelled.is_set():
+            raise
+        # Cancelled by the client, not by the connection closing: keep serving
+        asyncio.current_task().uncancel()
+        error = RequestCancelledError(request_id)
+        await send(_error(error.code, error.message, request_id))
+    except LLMHubError as e:
+        await send(_error(e.code, e.message, request_id))
+    except Exception as e:
+        logger.exception("Unexpected WebSocket chat error")
+        await send(_error("INTERNAL_ERROR", str(e), request_id))
+    finally:
+        await registry.unregister(in_flight)
@@ -0,0 +1,41 @@
+"""Conditional GET support with ETags"""
+import hashlib
+
+from fastapi import Request, Response
+
+from llm_mcp_hub.core.metrics import CACHE_LOOKUPS
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Build a weak ETag from the values a representation depends on.
+
+    Weak because the same representation may be sent with different
+    content encodings.
+    """
+    digest = hashlib.blake2b("\x1f".join(map(str, parts)).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check If-None-Match against an ETag (weak comparison)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    opaque = etag.removeprefix("W/")
+    matched = header.strip() == "*" or any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in header.split(",")
+    )
+    CACHE_LOOKUPS.labels("etag", "hit" if matched else "miss").inc()
+    return matched
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the current ETag"""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach the ETag; no-cache makes clients revalidate on every poll"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
@@ -3,7 +3,7 @@ from typing import Annotated
 
 from fastapi import Depends, Header, Request
 
-from llm_mcp_hub.services import ChatService, SessionService, MemoryService
+from llm_mcp_hub.services import BulkExporter, ChatService, SessionService, MemoryService, RequestRegistry
 
 
 def get_session_service(request: Request) -> SessionService:
@@ -21,13 +21,31 @@ def get_memory_service(request: Request) -> MemoryService:
     return request.app.state.memory_service
 
 
+def get_bulk_exporter(request: Request) -> BulkExporter:
+    """Get bulk exporter from app state"""
+    return request.app.state.bulk_exporter
+
+
+def get_request_registry(request: Request) -> RequestRegistry:
+    """Get in-flight request registry from app state"""
+    return request.app.state.request_registry
+
+
 def get_session_id(x_session_id: Annotated[str | None, Header()] = None) -> str | None:
     """Get session ID from X-Session-ID header"""
     return x_session_id
 
 
+def get_request_id(x_request_id: Annotated[str | None, Header(max_length=128)] = None) -> str | None:
+    """Get client-chosen request ID from X-Request-ID header"""
+    return x_request_id
+
+
 # Type aliases for dependency injection
 SessionServiceDep = Annotated[SessionService, Depends(get_session_service)]
 ChatServiceDep = Annotated[ChatService, Depends(get_chat_service)]
 MemoryServiceDep = Annotated[MemoryService, Depends(get_memory_service)]
+BulkExporterDep = Annotated[BulkExporter, Depends(get_bulk_exporter)]
+RequestRegistryDep = Annotated[RequestRegistry, Depends(get_request_registry)]
 SessionIdDep = Annotated[str | None, Depends(get_session_id)]
+RequestIdDep = Annotated[str | None, Depends(get_request_id)]
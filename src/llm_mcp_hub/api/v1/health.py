@@ -5,6 +5,7 @@ from datetime import datetime
 from fastapi import APIRouter, Request
 
 from llm_mcp_hub.core.config import get_settings
+from llm_mcp_hub.services import HealthMonitor
 from .schemas import (
     HealthResponse,
     DetailedHealthResponse,
@@ -30,38 +31,23 @@ async def health_check():
 
 @router.get("/health/detailed", response_model=DetailedHealthResponse)
 async def detailed_health_check(request: Request):
-    """Detailed health check with component status"""
+    """Detailed health check with component status from the last background probe"""
     settings = get_settings()
-    components: dict[str, ComponentHealth] = {}
-
-    # Check Redis
-    try:
-        session_store = request.app.state.session_store
-        if hasattr(session_store, "health_check"):
-            redis_health = await session_store.health_check()
-            components["redis"] = ComponentHealth(
-                status=redis_health.get("status", "unknown"),
-                latency_ms=redis_health.get("latency_ms"),
-                error=redis_health.get("error"),
-            )
-        else:
-            components["redis"] = ComponentHealth(status="healthy")
-    except Exception as e:
-        components["redis"] = ComponentHealth(status="unhealthy", error=str(e))
-
-    # Check providers
-    providers = getattr(request.app.state, "providers", {})
-
-    for name, adapter in providers.items():
-        try:
-            health = await adapter.health_check()
-            components[name] = ComponentHealth(
-                status=health.get("status", "unknown"),
-                supported_models=health.get("supported_models"),
-                error=health.get("error"),
-            )
-        except Exception as e:
-            components[name] = ComponentHealth(status="unhealthy", error=str(e))
+    monitor: HealthMonitor = request.app.state.health_monitor
+
+    components = {
+        name: ComponentHealth(
+            status=c.status,
+            latency_ms=c.latency_ms,
+            error=c.error,
+            supported_models=c.supported_models,
+            last_success=c.last_success,
+            details=c.details,
+        )
+        for name, c in (await monitor.components()).items()
+    }
+    # Stores without a health check (in-memory) are always reachable
+    components.setdefault("redis", ComponentHealth(status="healthy"))
 
     # Determine overall status
     unhealthy_count = sum(1 for c in components.values() if c.status == "unhealthy")
@@ -81,28 +67,22 @@ async def detailed_health_check(request: Request):
 
 @router.get("/health/tokens", response_model=TokenHealthResponse)
 async def token_health_check(request: Request):
-    """Check OAuth token status"""
+    """Check OAuth token status from the last background probe"""
+    monitor: HealthMonitor = request.app.state.health_monitor
+    components = await monitor.components()
     result = {}
 
-    providers = getattr(request.app.state, "providers", {})
-
-    for name, adapter in providers.items():
-        try:
-            health = await adapter.health_check()
-            if health.get("status") == "healthy":
-                result[name] = {
-                    "valid": True,
-                    "status": "active",
-                }
-            else:
-                result[name] = {
-                    "valid": False,
-                    "error": health.get("error", "Unknown error"),
-                }
-        except Exception as e:
+    for name in getattr(request.app.state, "providers", {}):
+        component = components.get(name)
+        if component is not None and component.status == "healthy":
+            result[name] = {
+                "valid": True,
+                "status": "active",
+            }
+        else:
             result[name] = {
                 "valid": False,
-                "error": str(e),
+                "error": (component.error if component else None) or "Unknown error",
             }
 
     return TokenHealthResponse(**result)
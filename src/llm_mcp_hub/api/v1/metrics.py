@@ -0,0 +1,13 @@
+"""Prometheus metrics endpoint"""
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from llm_mcp_hub.core.metrics import REGISTRY
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Metrics in Prometheus text exposition format"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,8 +1,9 @@
 """Provider API endpoints"""
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
+from .conditional import etag_matches, make_etag, not_modified, set_etag
 from .dependencies import SessionServiceDep
 from .schemas import ProviderInfo, ProviderDetailResponse
 
@@ -11,9 +12,13 @@ router = APIRouter(prefix="/providers", tags=["Providers"])
 
 
 @router.get("", response_model=list[ProviderInfo])
-async def list_providers(session_service: SessionServiceDep):
+async def list_providers(request: Request, response: Response, session_service: SessionServiceDep):
     """List all available providers"""
     providers = session_service.get_available_providers()
+    etag = make_etag(*((p["name"], p["default_model"], *p["models"]) for p in providers))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
     return [
         ProviderInfo(
             name=p["name"],
@@ -25,7 +30,7 @@ async def list_providers(session_service: SessionServiceDep):
 
 
 @router.get("/{name}", response_model=ProviderDetailResponse)
-async def get_provider(name: str, session_service: SessionServiceDep):
+async def get_provider(name: str, request: Request, response: Response, session_service: SessionServiceDep):
     """Get provider details"""
     provider = session_service.get_provider(name)
     if not provider:
@@ -34,6 +39,10 @@ async def get_provider(name: str, session_service: SessionServiceDep):
             detail={"code": "PROVIDER_NOT_FOUND", "message": f"Provider not found: {name}"},
         )
 
+    etag = make_etag(provider.name, provider.default_model, *provider.supported_models)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
     return ProviderDetailResponse(
         name=provider.name,
         status="healthy",  # Basic status, detailed health via /health endpoint
@@ -0,0 +1,33 @@
+"""In-flight request API endpoints"""
+import logging
+
+from fastapi import APIRouter, HTTPException
+
+from .dependencies import RequestRegistryDep
+from .schemas import CancelRequestResponse, InFlightRequestResponse
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/requests", tags=["Requests"])
+
+
+@router.get("", response_model=list[InFlightRequestResponse])
+async def list_requests(registry: RequestRegistryDep):
+    """List in-flight completion requests"""
+    return await registry.list_requests()
+
+
+@router.delete("/{request_id}", response_model=CancelRequestResponse)
+async def cancel_request(request_id: str, registry: RequestRegistryDep):
+    """
+    Cancel an in-flight completion request.
+
+    The provider process is stopped and its admission slot freed. The
+    cancelled request fails with REQUEST_CANCELLED (streams end with an
+    error event).
+    """
+    if not await registry.cancel(request_id):
+        raise HTTPException(
+            status_code=404,
+            detail={"code": "REQUEST_NOT_FOUND", "message": f"Request not in flight: {request_id}"},
+        )
+    return CancelRequestResponse(request_id=request_id, cancelled=True)
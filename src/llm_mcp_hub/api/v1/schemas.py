@@ -5,6 +5,29 @@ from typing import Any, Literal
 from pydantic import BaseModel, Field
 
 
+def json_request_body(model: type[BaseModel]) -> dict[str, Any]:
+    """OpenAPI requestBody for endpoints that parse a model from the raw body themselves"""
+    schema = model.model_json_schema()
+    definitions = schema.pop("$defs", {})
+
+    def inline(node):
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref is not None:
+                return inline(definitions[ref.rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(item) for item in node]
+        return node
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}},
+        }
+    }
+
+
 # Chat Schemas
 class ChatMessage(BaseModel):
     """Chat message"""
@@ -13,6 +36,31 @@ class ChatMessage(BaseModel):
     content: str
 
 
+class StreamOptions(BaseModel):
+    """Per-request SSE framing options (server defaults when unset)"""
+
+    flush_interval_ms: float | None = Field(
+        default=None,
+        ge=0,
+        le=1000,
+        description="Max time content is buffered before a frame is sent; 0 sends every chunk",
+    )
+    max_chunk_bytes: int | None = Field(
+        default=None,
+        ge=1,
+        description="Buffered content size that forces a frame",
+    )
+    keepalive_seconds: float | None = Field(
+        default=None,
+        ge=0,
+        description="Idle time before a keep-alive comment is sent; 0 disables",
+    )
+    resumable: bool | None = Field(
+        default=None,
+        description="Buffer events for Last-Event-ID resume; the provider keeps running if the client drops",
+    )
+
+
 class ChatCompletionRequest(BaseModel):
     """Chat completion request"""
 
@@ -20,8 +68,19 @@ class ChatCompletionRequest(BaseModel):
     provider: str | None = Field(default=None, description="LLM provider (claude, gemini)")
     model: str | None = Field(default=None, description="Model name or alias")
     stream: bool = Field(default=False, description="Enable streaming response")
+    stream_options: StreamOptions | None = Field(default=None, description="SSE framing options")
     timeout: float = Field(default=120.0, description="Timeout in seconds")
 
+    def prompts(self) -> tuple[str | None, str | None]:
+        """Last user message and first system message, found in one pass"""
+        prompt = system_prompt = None
+        for message in self.messages:
+            if message.role == "user":
+                prompt = message.content
+            elif message.role == "system" and system_prompt is None:
+                system_prompt = message.content
+        return prompt, system_prompt
+
 
 class ChatCompletionResponse(BaseModel):
     """Chat completion response"""
@@ -32,6 +91,24 @@ class ChatCompletionResponse(BaseModel):
     model: str
 
 
+class InFlightRequestResponse(BaseModel):
+    """In-flight completion request"""
+
+    request_id: str
+    provider: str | None
+    model: str | None
+    stream: bool
+    replica: str
+    started_at: datetime
+
+
+class CancelRequestResponse(BaseModel):
+    """Cancel request response"""
+
+    request_id: str
+    cancelled: bool
+
+
 class StreamEvent(BaseModel):
     """SSE stream event"""
 
@@ -75,6 +152,16 @@ class SessionResponse(BaseModel):
     expires_at: datetime | None
 
 
+class SessionFileResponse(BaseModel):
+    """Uploaded reference file response"""
+
+    session_id: str
+    name: str
+    sha256: str | None = Field(default=None, description="Content hash (None when stored inline)")
+    size: int = Field(description="File size in bytes")
+    total_bytes: int = Field(description="Total reference file bytes in session")
+
+
 class CloseSessionRequest(BaseModel):
     """Close session request"""
 
@@ -88,6 +175,38 @@ class CloseSessionRequest(BaseModel):
     )
 
 
+class ExportFilterSchema(BaseModel):
+    """Session selection for bulk export"""
+
+    session_ids: list[str] | None = Field(default=None, description="Only these sessions")
+    provider: str | None = Field(default=None, description="Only sessions of this provider")
+    model: str | None = Field(default=None, description="Only sessions of this model")
+    status: Literal["active", "closed", "expired"] | None = Field(default=None, description="Only sessions in this status")
+    created_after: datetime | None = Field(default=None, description="Only sessions created at or after this time")
+    created_before: datetime | None = Field(default=None, description="Only sessions created before this time")
+    idle_seconds: float | None = Field(default=None, description="Only sessions idle at least this many seconds")
+    min_messages: int = Field(default=1, ge=0, description="Only sessions with at least this many messages")
+
+
+class BulkExportRequest(BaseModel):
+    """Bulk memory export request"""
+
+    filter: ExportFilterSchema = Field(default_factory=ExportFilterSchema)
+    compression: Literal["none", "low", "medium", "high"] = Field(
+        default="medium",
+        description="Compression level for memory export",
+    )
+    provider: str = Field(
+        default="claude",
+        description="Provider to use for compression",
+    )
+    concurrency: int = Field(default=4, ge=1, description="Sessions exported in parallel")
+    output: Literal["stream", "directory"] = Field(
+        default="stream",
+        description="Return content in the NDJSON stream, or write files under the configured export directory",
+    )
+
+
 class CloseSessionResponse(BaseModel):
     """Close session response"""
 
@@ -160,10 +279,11 @@ class ComponentHealth(BaseModel):
     """Component health status"""
 
     status: Literal["healthy", "unhealthy"]
-    latency_ms: int | None = None
+    latency_ms: float | None = None
     error: str | None = None
     supported_models: list[str] | None = None
     last_success: datetime | None = None
+    details: dict[str, Any] | None = None
 
 
 class DetailedHealthResponse(BaseModel):
@@ -1,17 +1,27 @@
 """Session API endpoints"""
+import json
 import logging
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Literal
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 from llm_mcp_hub.core.exceptions import LLMHubError
+from llm_mcp_hub.domain import SessionStatus
+from llm_mcp_hub.services import ExportFilter
 from llm_mcp_hub.services.memory import CompressionLevel
-from .dependencies import SessionServiceDep, MemoryServiceDep
+from .conditional import etag_matches, make_etag, not_modified, set_etag
+from .dependencies import BulkExporterDep, SessionServiceDep, MemoryServiceDep
 from .schemas import (
     CreateSessionRequest,
     SessionResponse,
+    SessionFileResponse,
     CloseSessionRequest,
     CloseSessionResponse,
+    BulkExportRequest,
     SessionMemoryResponse,
     SessionListItem,
     SessionListResponse,
@@ -23,6 +33,8 @@ router = APIRouter(prefix="/sessions", tags=["Sessions"])
 
 @router.get("", response_model=SessionListResponse)
 async def list_sessions(
+    request: Request,
+    response: Response,
     session_service: SessionServiceDep,
     limit: int = Query(default=50, le=100, ge=1),
     offset: int = Query(default=0, ge=0),
@@ -30,22 +42,33 @@ async def list_sessions(
     """
     List all active sessions.
 
-    Returns paginated list of sessions with basic information.
+    Returns paginated list of sessions with basic information. The ETag
+    covers the page's session headers; If-None-Match gets 304 when none
+    changed.
     """
     try:
-        sessions = await session_service.list_sessions(limit=limit, offset=offset)
+        headers = await session_service.list_session_headers(limit=limit, offset=offset)
+
+        etag = make_etag(
+            limit,
+            offset,
+            *((h.id, h.updated_at.isoformat(), h.status.value, h.expires_at, h.message_count) for h in headers),
+        )
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
 
         session_items = [
             SessionListItem(
-                session_id=s.id,
-                provider=s.provider,
-                model=s.model,
-                status=s.status.value,
-                created_at=s.created_at,
-                expires_at=s.expires_at,
-                message_count=len(s.messages),
+                session_id=h.id,
+                provider=h.provider,
+                model=h.model,
+                status=h.status.value,
+                created_at=h.created_at,
+                expires_at=h.expires_at,
+                message_count=h.message_count,
             )
-            for s in sessions
+            for h in headers
         ]
 
         return SessionListResponse(
@@ -118,23 +141,38 @@ async def create_session(
 @router.get("/{session_id}", response_model=SessionResponse)
 async def get_session(
     session_id: str,
+    request: Request,
+    response: Response,
     session_service: SessionServiceDep,
 ):
-    """Get session information"""
+    """
+    Get session information.
+
+    The ETag is derived from the session header's updated_at, so
+    If-None-Match is answered with 304 from a header-only read.
+    """
     try:
-        session = await session_service.get_session(session_id)
+        header = await session_service.get_session_header(session_id)
 
-        provider = session_service.get_provider(session.provider)
+        provider = session_service.get_provider(header.provider)
         supported_models = provider.supported_models if provider else []
 
+        etag = make_etag(
+            header.id, header.updated_at.isoformat(), header.status.value, header.expires_at, header.model,
+            *supported_models,
+        )
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+
         return SessionResponse(
-            session_id=session.id,
-            provider=session.provider,
-            model=session.model,
-            status=session.status.value,
+            session_id=header.id,
+            provider=header.provider,
+            model=header.model,
+            status=header.status.value,
             supported_models=supported_models,
-            created_at=session.created_at,
-            expires_at=session.expires_at,
+            created_at=header.created_at,
+            expires_at=header.expires_at,
         )
 
     except LLMHubError as e:
@@ -164,6 +202,44 @@ async def delete_session(
         raise HTTPException(status_code=500, detail={"code": "INTERNAL_ERROR", "message": str(e)})
 
 
+@router.put("/{session_id}/files/{name}", response_model=SessionFileResponse)
+async def upload_session_file(
+    session_id: str,
+    name: str,
+    request: Request,
+    session_service: SessionServiceDep,
+):
+    """
+    Attach a reference file to a session.
+
+    The request body is the raw UTF-8 file content and is streamed into the
+    blob store chunk by chunk, so large files are never buffered whole.
+    Uploading a file with an existing name replaces it. The per-session
+    reference file size quota is enforced while streaming (413).
+    """
+    try:
+        result = await session_service.attach_file(session_id, name, request.stream())
+
+        return SessionFileResponse(
+            session_id=session_id,
+            name=result["name"],
+            sha256=result["sha256"],
+            size=result["size"],
+            total_bytes=result["total_bytes"],
+        )
+
+    except LLMHubError as e:
+        raise HTTPException(
+            status_code=_error_to_status(e.code),
+            detail=e.to_dict()["error"],
+        )
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "INVALID_REQUEST", "message": "File content must be UTF-8 text"},
+        )
+
+
 @router.post("/{session_id}/close", response_model=CloseSessionResponse)
 async def close_session(
     session_id: str,
@@ -240,6 +316,80 @@ async def get_session_memory(
         )
 
 
+@router.get("/{session_id}/memory/stream")
+async def stream_session_memory(
+    session_id: str,
+    memory_service: MemoryServiceDep,
+    format: Literal["markdown", "ndjson"] = Query(default="markdown"),
+):
+    """
+    Stream the full (uncompressed) conversation.
+
+    Sent with chunked transfer encoding straight from the session store,
+    so large sessions are never assembled in memory. NDJSON output has a
+    session line followed by one line per message.
+    """
+    try:
+        chunks = await memory_service.stream_memory(session_id, format)
+    except LLMHubError as e:
+        raise HTTPException(
+            status_code=_error_to_status(e.code),
+            detail=e.to_dict()["error"],
+        )
+
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/markdown; charset=utf-8"
+    return StreamingResponse(chunks, media_type=media_type)
+
+
+@router.post("/export")
+async def bulk_export(
+    request: BulkExportRequest,
+    http_request: Request,
+    bulk_exporter: BulkExporterDep,
+):
+    """
+    Export memory for all sessions matching a filter.
+
+    Streams NDJSON progress events: one start event, one event per session
+    (status exported/duplicate/failed, timing, progress) and a final done
+    event. With output=directory, memories are written as files under the
+    server's configured export directory instead of being streamed.
+    """
+    settings = http_request.app.state.settings
+    output_dir = None
+    if request.output == "directory":
+        if not settings.export_dir:
+            raise HTTPException(
+                status_code=400,
+                detail={"code": "INVALID_REQUEST", "message": "Export directory is not configured"},
+            )
+        job_id = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        output_dir = Path(settings.export_dir) / job_id
+
+    filter_data = request.filter.model_dump()
+    if filter_data["status"]:
+        filter_data["status"] = SessionStatus(filter_data["status"])
+    for field in ("created_after", "created_before"):
+        value = filter_data[field]
+        if value is not None and value.tzinfo is not None:
+            # Session timestamps are naive UTC
+            filter_data[field] = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    events = bulk_exporter.run(
+        ExportFilter(**filter_data),
+        compression=CompressionLevel(request.compression),
+        provider=request.provider,
+        concurrency=min(request.concurrency, settings.export_max_concurrency),
+        output_dir=output_dir,
+    )
+
+    async def lines():
+        async for event in events:
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 def _error_to_status(code: str) -> int:
     """Map error code to HTTP status"""
     status_map = {
@@ -250,5 +400,8 @@ def _error_to_status(code: str) -> int:
         "PROVIDER_ERROR": 502,
         "PROVIDER_TIMEOUT": 504,
         "TOKEN_EXPIRED": 401,
+        "CONTEXT_QUOTA_EXCEEDED": 413,
+        "REQUEST_CANCELLED": 409,
+        "STREAM_NOT_RESUMABLE": 410,
     }
     return status_map.get(code, 500)
@@ -0,0 +1,195 @@
+"""Server-Sent Events encoding for streamed completions"""
+import asyncio
+import json
+import logging
+from json.encoder import encode_basestring
+from typing import Any, AsyncIterator
+
+from starlette.requests import Request
+
+logger = logging.getLogger(__name__)
+
+# Shared encoder for non-content events; compact and UTF-8 (SSE is always UTF-8)
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), check_circular=False)
+
+# SSE event name per event type
+_EVENT_NAMES = {"content": "message"}
+
+_CONTENT_PREFIX = 'event: message\ndata: {"type":"content","text":'
+_KEEPALIVE = ": keepalive\n\n"
+# Events read ahead of the writer; a slow client stops the pump beyond this
+_MAX_QUEUED = 64
+_END = object()
+_FLUSH = object()
+_TICK = object()
+
+
+def encode_json(event: dict[str, Any]) -> str:
+    """Encode one event as compact JSON"""
+    return _encoder.encode(event)
+
+
+def encode_event(event: dict[str, Any]) -> str:
+    """Encode one event as an SSE frame, with an id line if the event has an id"""
+    name = _EVENT_NAMES.get(event["type"], event["type"])
+    frame = f"event: {name}\ndata: {_encoder.encode(event)}\n\n"
+    event_id = event.get("id")
+    return frame if event_id is None else f"id: {event_id}\n{frame}"
+
+
+def _content_frame(chunks: list[str], event_id: int | None = None) -> str:
+    """Encode buffered content chunks as one SSE frame, id'd by the last chunk"""
+    frame = f"{_CONTENT_PREFIX}{encode_basestring(''.join(chunks))}}}\n\n"
+    return frame if event_id is None else f"id: {event_id}\n{frame}"
+
+
+async def encode_sse(
+    events: AsyncIterator[dict[str, Any]],
+    flush_interval: float = 0.02,
+    max_chunk_bytes: int = 4096,
+    keepalive: float | None = 15.0,
+) -> AsyncIterator[str]:
+    """
+    Encode an event stream as SSE frames, coalescing content chunks.
+
+    Events are pulled by a pump task into a bounded queue, so content that
+    arrives while a frame is being written is merged into the next frame
+    and a slow client backpressures the event source. Content is held for
+    at most flush_interval seconds or until max_chunk_bytes bytes of UTF-8
+    text are buffered; other events flush pending content and are sent
+    immediately. A keepalive comment is sent when nothing was written for
+    `keepalive` seconds. Timers are armed once per frame, not per chunk.
+
+    Events carrying an "id" (replayed streams) get an SSE id line; a
+    coalesced content frame takes the id of its last chunk, so a client
+    resuming with Last-Event-ID gets exactly the chunks it missed.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_MAX_QUEUED)
+    loop = asyncio.get_running_loop()
+
+    async def pump() -> None:
+        try:
+            async for event in events:
+                await queue.put(event)
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(_END)
+
+    async def tick() -> None:
+        while True:
+            await asyncio.sleep(keepalive)
+            await queue.put(_TICK)
+
+    async def flush_later() -> None:
+        await asyncio.sleep(flush_interval)
+        await queue.put(_FLUSH)
+
+    tasks = [asyncio.create_task(pump())]
+    if keepalive:
+        tasks.append(asyncio.create_task(tick()))
+
+    pending: list[str] = []
+    pending_size = 0
+    pending_id: int | None = None
+    flush_timer: asyncio.Task | None = None
+    last_write = loop.time()
+
+    try:
+        while True:
+            item = queue.get_nowait() if not queue.empty() else await queue.get()
+
+            if item is _FLUSH or item is _END or isinstance(item, Exception) or (
+                item is not _TICK and item["type"] != "content"
+            ):
+                if pending:
+                    yield _content_frame(pending, pending_id)
+                    pending, pending_size = [], 0
+                    last_write = loop.time()
+                if flush_timer is not None:
+                    flush_timer.cancel()
+                    flush_timer = None
+                if item is _FLUSH:
+                    continue
+                if item is _END:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield encode_event(item)
+                last_write = loop.time()
+                continue
+
+            if item is _TICK:
+                if not pending and loop.time() - last_write >= keepalive:
+                    yield _KEEPALIVE
+                    last_write = loop.time()
+                continue
+
+            text = item["text"]
+            pending.append(text)
+            pending_size += len(text) if text.isascii() else len(text.encode("utf-8"))
+            pending_id = item.get("id")
+            if pending_size >= max_chunk_bytes or flush_interval <= 0:
+                yield _content_frame(pending, pending_id)
+                pending, pending_size = [], 0
+                last_write = loop.time()
+                if flush_timer is not None:
+                    flush_timer.cancel()
+                    flush_timer = None
+            elif flush_timer is None:
+                flush_timer = asyncio.create_task(flush_later())
+    finally:
+        if flush_timer is not None:
+            flush_timer.cancel()
+            tasks.append(flush_timer)
+        for task in tasks:
+            task.cancel()
+        # Let the event source run its cleanup (e.g. stopping the provider process)
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _wait_disconnect(request: Request) -> None:
+    """Return once the client has disconnected"""
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def stop_on_disconnect(
+    request: Request,
+    frames: AsyncIterator[str],
+    stop: asyncio.Event | None = None,
+) -> AsyncIterator[str]:
+    """
+    Relay frames until the client disconnects or stop is set.
+
+    The server only notices a gone client when a write fails, which may be
+    long after the fact while a provider is thinking. Waiting for the ASGI
+    http.disconnect message instead lets the frame generator be cancelled
+    right away, which propagates down to the provider call.
+    """
+    watchers = [asyncio.create_task(_wait_disconnect(request))]
+    if stop is not None:
+        watchers.append(asyncio.create_task(stop.wait()))
+    try:
+        while True:
+            next_frame = asyncio.ensure_future(anext(frames))
+            await asyncio.wait((next_frame, *watchers), return_when=asyncio.FIRST_COMPLETED)
+            if not next_frame.done():
+                if stop is not None and stop.is_set():
+                    logger.info("Stream stopped, aborting")
+                else:
+                    logger.info("Client disconnected, aborting stream")
+                next_frame.cancel()
+                await asyncio.gather(next_frame, return_exceptions=True)
+                return
+            try:
+                frame = next_frame.result()
+            except StopAsyncIteration:
+                return
+            yield frame
+    finally:
+        for watcher in watchers:
+            watcher.cancel()
+        await frames.aclose()
@@ -9,6 +9,10 @@ from .exceptions import (
     SessionExpiredError,
     ProviderMismatchError,
     TokenExpiredError,
+    ContextQuotaExceededError,
+    RequestCancelledError,
+    RequestIdInUseError,
+    StreamNotResumableError,
 )
 from .secrets import SecretProvider, create_secret_provider
 
@@ -23,6 +27,10 @@ __all__ = [
     "SessionExpiredError",
     "ProviderMismatchError",
     "TokenExpiredError",
+    "ContextQuotaExceededError",
+    "RequestCancelledError",
+    "RequestIdInUseError",
+    "StreamNotResumableError",
     "SecretProvider",
     "create_secret_provider",
 ]
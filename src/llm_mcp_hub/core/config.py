@@ -25,9 +25,42 @@ class Settings(BaseSettings):
 
     # Redis
     redis_url: str = Field(default="redis://localhost:6379", description="Redis connection URL")
+    redis_max_connections: int = Field(default=50, description="Max connections in the session store pool")
+    redis_pool_timeout: float = Field(
+        default=5.0,
+        description="Seconds to wait for a free pool connection before failing",
+    )
+    redis_socket_timeout: float = Field(default=5.0, description="Redis command timeout in seconds")
+    redis_connect_timeout: float = Field(default=5.0, description="Redis connect timeout in seconds")
 
     # Session
     session_ttl: int = Field(default=3600, description="Session TTL in seconds (default: 1 hour)")
+    session_cleanup_interval: float = Field(
+        default=60.0,
+        description="Interval in seconds between expired session sweeps, which also release their file blobs",
+    )
+    session_max_count: int | None = Field(
+        default=None,
+        description="Max sessions kept by the in-memory store before LRU eviction",
+    )
+    session_max_message_bytes: int | None = Field(
+        default=None,
+        description="Max total message bytes kept by the in-memory store before LRU eviction",
+    )
+
+    # Reference file blobs
+    blob_store_path: str | None = Field(
+        default=None,
+        description="Directory for reference file blobs (default: Redis when used for sessions, else memory)",
+    )
+    session_max_context_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        description="Max total size of reference files per session in bytes",
+    )
+    blob_ttl: int = Field(
+        default=604800,
+        description="Minimum Redis blob TTL in seconds, extended on reuse and to outlive referencing sessions (default: 7 days)",
+    )
 
     # Claude Provider
     claude_oauth_token: str | None = Field(default=None, description="Claude OAuth token")
@@ -46,6 +79,126 @@ class Settings(BaseSettings):
     # Timeouts
     provider_timeout: float = Field(default=120.0, description="Provider timeout in seconds")
 
+    # Streaming
+    sse_flush_interval_ms: float = Field(
+        default=20.0,
+        description="Default max time streamed content is buffered before an SSE frame is sent",
+    )
+    sse_max_chunk_bytes: int = Field(
+        default=4096,
+        description="Default buffered content size that forces an SSE frame",
+    )
+    sse_keepalive_seconds: float = Field(
+        default=15.0,
+        description="Default idle time before an SSE keep-alive comment (0 disables)",
+    )
+    sse_resumable: bool = Field(
+        default=False,
+        description="Make streams resumable by default (provider keeps running when the client drops)",
+    )
+    stream_replay_max_events: int = Field(
+        default=10000,
+        description="Max events kept per resumable stream for Last-Event-ID replay",
+    )
+    stream_replay_ttl: int = Field(
+        default=300,
+        description="Seconds a resumable stream stays replayable after its last event",
+    )
+
+    # Response compression
+    compression_enabled: bool = Field(
+        default=True,
+        description="Compress responses (zstd/br/gzip, negotiated via Accept-Encoding)",
+    )
+    compression_min_size: int = Field(
+        default=1024,
+        description="Smallest response body in bytes that is compressed",
+    )
+    compression_cpu_budget: float = Field(
+        default=0.5,
+        description="Max share of one CPU core spent compressing; over budget responses go out uncompressed",
+    )
+    compression_streams: bool = Field(
+        default=True,
+        description="Compress streamed responses (SSE, NDJSON), flushing after every message",
+    )
+
+    # Request timing
+    server_timing_enabled: bool = Field(
+        default=True,
+        description="Send a Server-Timing header with per-request phase durations",
+    )
+    access_log_enabled: bool = Field(
+        default=True,
+        description="Write one JSON access log line per request with phase timings",
+    )
+
+    # Health probing
+    health_check_interval: float = Field(
+        default=30.0,
+        description="Seconds between background health probes of Redis and providers",
+    )
+    health_check_timeout: float = Field(
+        default=10.0,
+        description="Timeout in seconds for each component health probe",
+    )
+
+    # Provider concurrency
+    provider_max_concurrency: int | None = Field(
+        default=None,
+        description="Max concurrent provider calls (CLI processes) per provider; unset means unlimited",
+    )
+    provider_low_priority_reserve: int = Field(
+        default=1,
+        description="Provider slots kept free from background work when provider_max_concurrency is set",
+    )
+    provider_low_priority_concurrency: int = Field(
+        default=2,
+        description="Max concurrent provider calls before background work waits, when provider_max_concurrency is unset",
+    )
+
+    # Memory compression
+    memory_summary_timeout: float = Field(
+        default=120.0,
+        description="Timeout in seconds for each summarization call",
+    )
+    memory_chunk_tokens: int = Field(
+        default=8000,
+        description="Approximate token budget per summarization prompt; longer conversations are chunked",
+    )
+    memory_max_parallel_chunks: int = Field(
+        default=4,
+        description="Max chunk summaries in flight per export",
+    )
+    memory_chunk_cache_size: int = Field(
+        default=1024,
+        description="Number of chunk summaries kept in memory for reuse",
+    )
+    export_dir: str | None = Field(
+        default=None,
+        description="Directory for bulk export jobs writing to disk (disabled when unset)",
+    )
+    export_max_concurrency: int = Field(
+        default=8,
+        description="Upper bound on the concurrency a bulk export job may request",
+    )
+    memory_precompute_idle: float | None = Field(
+        default=None,
+        description="Precompute memory for sessions idle this many seconds (disabled when unset)",
+    )
+    memory_precompute_interval: float = Field(
+        default=60.0,
+        description="Interval in seconds between idle session precompute sweeps",
+    )
+    memory_precompute_compression: Literal["low", "medium"] = Field(
+        default="medium",
+        description="Compression level precomputed for idle sessions",
+    )
+    memory_precompute_provider: str = Field(
+        default="claude",
+        description="Provider used to precompute idle session memory",
+    )
+
     def model_post_init(self, __context) -> None:
         """Load secrets after initialization"""
         secret_provider = create_secret_provider()
@@ -103,3 +103,47 @@ class TokenExpiredError(LLMHubError):
             code="TOKEN_EXPIRED",
             details={"provider": provider},
         )
+
+
+class ContextQuotaExceededError(LLMHubError):
+    """Session context size quota exceeded"""
+
+    def __init__(self, session_id: str, limit: int):
+        super().__init__(
+            message=f"Session context size limit of {limit} bytes exceeded: {session_id}",
+            code="CONTEXT_QUOTA_EXCEEDED",
+            details={"session_id": session_id, "limit_bytes": limit},
+        )
+
+
+class RequestCancelledError(LLMHubError):
+    """In-flight request was cancelled through the API"""
+
+    def __init__(self, request_id: str):
+        super().__init__(
+            message=f"Request cancelled: {request_id}",
+            code="REQUEST_CANCELLED",
+            details={"request_id": request_id},
+        )
+
+
+class RequestIdInUseError(LLMHubError):
+    """Request ID is already taken by an in-flight request"""
+
+    def __init__(self, request_id: str):
+        super().__init__(
+            message=f"Request ID already in flight: {request_id}",
+            code="REQUEST_ID_IN_USE",
+            details={"request_id": request_id},
+        )
+
+
+class StreamNotResumableError(LLMHubError):
+    """Stream cannot be replayed from the requested event"""
+
+    def __init__(self, request_id: str, reason: str):
+        super().__init__(
+            message=f"Stream cannot be resumed: {request_id} ({reason})",
+            code="STREAM_NOT_RESUMABLE",
+            details={"request_id": request_id, "reason": reason},
+        )
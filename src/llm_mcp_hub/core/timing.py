@@ -0,0 +1,101 @@
+"""Per-request phase timings"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+# Phase names, in the order they are reported
+SESSION_LOAD = "session_load"
+VALIDATION = "validation"
+QUEUE_WAIT = "queue_wait"
+SPAWN = "spawn"
+FIRST_BYTE = "first_byte"
+STORE_WRITE = "store_write"
+TOTAL = "total"
+
+
+class RequestTimings:
+    """
+    Phase durations of one request, in milliseconds.
+
+    Durations of a phase that happens more than once (e.g. two store reads)
+    add up. first_byte and total are offsets from the request start rather
+    than durations. Tags carry context for the access log (provider, model).
+    """
+
+    __slots__ = ("started", "phases", "tags")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.tags: dict[str, Any] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add a duration to a phase"""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds * 1000
+
+    def mark(self, phase: str) -> None:
+        """Record the time since the request start, once"""
+        if phase not in self.phases:
+            self.phases[phase] = (time.perf_counter() - self.started) * 1000
+
+    def as_dict(self) -> dict[str, float]:
+        """Phases in milliseconds, with total up to now"""
+        return {
+            **{phase: round(ms, 3) for phase, ms in self.phases.items()},
+            TOTAL: round((time.perf_counter() - self.started) * 1000, 3),
+        }
+
+    def server_timing(self) -> str:
+        """Server-Timing header value"""
+        return ", ".join(f"{phase};dur={ms}" for phase, ms in self.as_dict().items())
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def collect_timings() -> Iterator[RequestTimings]:
+    """Collect timings for the block, including tasks started in it"""
+    timings = RequestTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def current_timings() -> RequestTimings | None:
+    """Timings of the current request, None outside of one"""
+    return _current.get()
+
+
+def record(phase: str, seconds: float) -> None:
+    """Add a duration to a phase of the current request, if any"""
+    timings = _current.get()
+    if timings is not None:
+        timings.add(phase, seconds)
+
+
+def mark(phase: str) -> None:
+    """Record the time since the start of the current request, if any"""
+    timings = _current.get()
+    if timings is not None:
+        timings.mark(phase)
+
+
+def tag(**tags: Any) -> None:
+    """Attach context to the current request's access log line"""
+    timings = _current.get()
+    if timings is not None:
+        timings.tags.update(tags)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Time the block into a phase of the current request"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, time.perf_counter() - started)
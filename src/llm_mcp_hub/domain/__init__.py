@@ -1,11 +1,12 @@
 """Domain models"""
 from .message import Message, MessageRole
-from .session import Session, SessionContext, SessionStatus
+from .session import Session, SessionContext, SessionHeader, SessionStatus
 
 __all__ = [
     "Message",
     "MessageRole",
     "Session",
     "SessionContext",
+    "SessionHeader",
     "SessionStatus",
 ]
@@ -3,8 +3,6 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 
 class MessageRole(str, Enum):
     """Message role enum"""
@@ -14,32 +12,92 @@ class MessageRole(str, Enum):
     SYSTEM = "system"
 
 
-class Message(BaseModel):
-    """Chat message model"""
+_ROLES = {role.value: role for role in MessageRole}
+
+
+class Message:
+    """
+    Chat message model.
+
+    A slotted plain class rather than a pydantic model: sessions hold many
+    messages and stores decode all of them on every load. Timestamps read
+    from storage are kept as ISO strings until first accessed.
+    """
+
+    __slots__ = ("role", "content", "metadata", "_timestamp", "_timestamp_raw")
+
+    def __init__(
+        self,
+        role: MessageRole | str,
+        content: str,
+        timestamp: datetime | str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ):
+        self.role = MessageRole(role)
+        self.content = content
+        self.metadata = metadata if metadata is not None else {}
+        if isinstance(timestamp, str):
+            self._timestamp = None
+            self._timestamp_raw = timestamp
+        else:
+            self._timestamp = timestamp or datetime.utcnow()
+            self._timestamp_raw = None
 
-    role: MessageRole
-    content: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    @property
+    def timestamp(self) -> datetime:
+        """Message timestamp, parsed on first access"""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromisoformat(self._timestamp_raw)  # type: ignore[arg-type]
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
+        self._timestamp_raw = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Message):
+            return NotImplemented
+        return (
+            self.role == other.role
+            and self.content == other.content
+            and self.timestamp == other.timestamp
+            and self.metadata == other.metadata
+        )
+
+    def __repr__(self) -> str:
+        return f"Message(role={self.role.value!r}, content={self.content[:40]!r}, timestamp={self.timestamp!r})"
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
             "role": self.role.value,
             "content": self.content,
-            "timestamp": self.timestamp.isoformat(),
+            # Unparsed timestamps are written back as loaded
+            "timestamp": self._timestamp.isoformat() if self._timestamp is not None else self._timestamp_raw,
             "metadata": self.metadata,
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Message":
-        """Create from dictionary"""
-        return cls(
-            role=MessageRole(data["role"]),
-            content=data["content"],
-            timestamp=datetime.fromisoformat(data["timestamp"]) if isinstance(data.get("timestamp"), str) else data.get("timestamp", datetime.utcnow()),
-            metadata=data.get("metadata", {}),
-        )
+        """
+        Create from dictionary.
+
+        Trusted loading for data written by to_dict: fields are assigned
+        without validation and the timestamp is parsed lazily.
+        """
+        message = cls.__new__(cls)
+        message.role = _ROLES[data["role"]]
+        message.content = data["content"]
+        message.metadata = data.get("metadata") or {}
+        timestamp = data.get("timestamp")
+        if isinstance(timestamp, str):
+            message._timestamp = None
+            message._timestamp_raw = timestamp
+        else:
+            message._timestamp = timestamp or datetime.utcnow()
+            message._timestamp_raw = None
+        return message
 
     @classmethod
     def user(cls, content: str, **metadata) -> "Message":
@@ -1,10 +1,11 @@
 """Session domain model"""
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 import uuid
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from .message import Message
 
@@ -18,14 +19,77 @@ class SessionStatus(str, Enum):
 
 
 class SessionContext(BaseModel):
-    """Session context for initialization"""
+    """
+    Session context for initialization.
+
+    Reference files are either inline ({"name", "content"}) or stored in a
+    blob store ({"name", "sha256", "size"}); blob contents are attached
+    with resolve_files() before the prompt is rendered.
+
+    The rendered system prompt is cached until a field is reassigned;
+    in-place edits (e.g. files.append) must be followed by reassigning
+    the field to be picked up.
+    """
 
     memory: str | None = Field(default=None, description="Project memory (e.g., CLAUDE.md content)")
     previous_summary: str | None = Field(default=None, description="Previous session summary")
-    files: list[dict[str, str]] = Field(default_factory=list, description="Reference files")
+    files: list[dict[str, Any]] = Field(default_factory=list, description="Reference files")
+
+    _revision: int = PrivateAttr(default=0)
+    _prompt_cache: tuple[str | None] | None = PrivateAttr(default=None)
+    _blob_contents: dict[str, str] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._revision += 1
+            self._prompt_cache = None
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped on every field assignment"""
+        return self._revision
+
+    @property
+    def file_digests(self) -> list[str]:
+        """Digests of reference files stored in a blob store"""
+        return [f["sha256"] for f in self.files if "sha256" in f and "content" not in f]
+
+    @property
+    def total_file_bytes(self) -> int:
+        """Total size of reference files in bytes"""
+        return sum(
+            f["size"] if "size" in f else len(f.get("content", "").encode("utf-8"))
+            for f in self.files
+        )
+
+    @property
+    def unresolved_digests(self) -> list[str]:
+        """Digests of blob-backed files whose content is not attached yet"""
+        return [d for d in self.file_digests if d not in self._blob_contents]
+
+    def resolve_files(self, contents: dict[str, str]) -> None:
+        """Attach blob contents by digest for prompt rendering"""
+        if not contents:
+            return
+        self._blob_contents.update(contents)
+        self._revision += 1
+        self._prompt_cache = None
 
     def to_system_prompt(self) -> str | None:
-        """Convert context to system prompt format"""
+        """Convert context to system prompt format (cached)"""
+        if self._prompt_cache is None:
+            self._prompt_cache = (self._render_system_prompt(),)
+        return self._prompt_cache[0]
+
+    def _file_content(self, file: dict[str, Any]) -> str | None:
+        """Inline content or attached blob content of a reference file"""
+        if "content" in file:
+            return file["content"]
+        return self._blob_contents.get(file.get("sha256", ""))
+
+    def _render_system_prompt(self) -> str | None:
+        """Render context as system prompt"""
         parts = []
 
         if self.memory:
@@ -36,7 +100,9 @@ class SessionContext(BaseModel):
 
         if self.files:
             files_content = "\n".join(
-                f"## {f['name']}\n{f['content']}" for f in self.files if "name" in f and "content" in f
+                f"## {f['name']}\n{content}"
+                for f in self.files
+                if "name" in f and (content := self._file_content(f)) is not None
             )
             if files_content:
                 parts.append(f"# Reference Files\n{files_content}")
@@ -44,20 +110,41 @@ class SessionContext(BaseModel):
         return "\n\n".join(parts) if parts else None
 
 
-class Session(BaseModel):
-    """Chat session model"""
-
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    provider: str = Field(description="LLM provider (claude, gemini)")
-    model: str = Field(description="Default model for this session")
-    status: SessionStatus = Field(default=SessionStatus.ACTIVE)
-    system_prompt: str | None = Field(default=None, description="System prompt/instruction")
-    context: SessionContext | None = Field(default=None, description="Session context")
-    messages: list[Message] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-    expires_at: datetime | None = Field(default=None)
-    metadata: dict[str, Any] = Field(default_factory=dict)
+@dataclass(slots=True, kw_only=True)
+class Session:
+    """
+    Chat session model.
+
+    A slotted dataclass rather than a pydantic model so that loading a
+    session from a store skips per-field validation; request validation
+    happens in the API schemas.
+    """
+
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    provider: str  # LLM provider (claude, gemini)
+    model: str  # Default model for this session
+    status: SessionStatus = SessionStatus.ACTIVE
+    system_prompt: str | None = None
+    context: SessionContext | None = None
+    messages: list[Message] = field(default_factory=list)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+    expires_at: datetime | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+    # Rolling memory summaries by compression level:
+    # {"content": str, "message_count": int (messages covered), "updated_at": iso str}
+    summaries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # Incremented by the store on every write; tells a held copy that it is stale
+    revision: int = 0
+    # (context revision, prompt); reset when system_prompt or context is assigned
+    _prompt_cache: tuple[int | None, str | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "system_prompt" or name == "context":
+            object.__setattr__(self, "_prompt_cache", None)
+        object.__setattr__(self, name, value)
 
     def add_message(self, message: Message) -> None:
         """Add message to session"""
@@ -92,7 +179,16 @@ class Session(BaseModel):
         return result
 
     def _build_system_prompt(self) -> str | None:
-        """Build combined system prompt from context and system_prompt"""
+        """Build combined system prompt from context and system_prompt (cached)"""
+        revision = self.context.revision if self.context else None
+        cache = self._prompt_cache
+        if cache is None or cache[0] != revision:
+            cache = (revision, self._render_system_prompt())
+            object.__setattr__(self, "_prompt_cache", cache)
+        return cache[1]
+
+    def _render_system_prompt(self) -> str | None:
+        """Render combined system prompt from context and system_prompt"""
         parts = []
 
         if self.system_prompt:
@@ -132,13 +228,17 @@ class Session(BaseModel):
             "updated_at": self.updated_at.isoformat(),
             "expires_at": self.expires_at.isoformat() if self.expires_at else None,
             "metadata": self.metadata,
+            "summaries": self.summaries,
+            "revision": self.revision,
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Session":
         """Create from dictionary"""
-        messages = [Message.from_dict(m) for m in data.get("messages", [])]
-        context = SessionContext(**data["context"]) if data.get("context") else None
+        load_message = Message.from_dict
+        messages = [load_message(m) for m in data.get("messages", [])]
+        # Stored context was validated when the session was created
+        context = SessionContext.model_construct(**data["context"]) if data.get("context") else None
 
         return cls(
             id=data["id"],
@@ -152,4 +252,77 @@ class Session(BaseModel):
             updated_at=datetime.fromisoformat(data["updated_at"]) if isinstance(data.get("updated_at"), str) else data.get("updated_at", datetime.utcnow()),
             expires_at=datetime.fromisoformat(data["expires_at"]) if data.get("expires_at") else None,
             metadata=data.get("metadata", {}),
+            summaries=data.get("summaries") or {},
+            revision=data.get("revision", 0),
+        )
+
+
+@dataclass(slots=True, kw_only=True)
+class SessionHeader:
+    """Lightweight session metadata without messages or reference files"""
+
+    id: str
+    provider: str
+    model: str
+    status: SessionStatus = SessionStatus.ACTIVE
+    created_at: datetime
+    updated_at: datetime
+    expires_at: datetime | None = None
+    message_count: int = 0
+    system_prompt: str | None = None
+    revision: int = 0
+
+    def is_active(self) -> bool:
+        """Check if session is active"""
+        if self.status != SessionStatus.ACTIVE:
+            return False
+        if self.expires_at and datetime.utcnow() > self.expires_at:
+            return False
+        return True
+
+    @classmethod
+    def from_session(cls, session: Session) -> "SessionHeader":
+        """Create header from a loaded session"""
+        return cls(
+            id=session.id,
+            provider=session.provider,
+            model=session.model,
+            status=session.status,
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+            expires_at=session.expires_at,
+            message_count=len(session.messages),
+            system_prompt=session.system_prompt,
+            revision=session.revision,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "id": self.id,
+            "provider": self.provider,
+            "model": self.model,
+            "status": self.status.value,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "message_count": self.message_count,
+            "system_prompt": self.system_prompt,
+            "revision": self.revision,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SessionHeader":
+        """Create from dictionary"""
+        return cls(
+            id=data["id"],
+            provider=data["provider"],
+            model=data["model"],
+            status=SessionStatus(data.get("status", "active")),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            expires_at=datetime.fromisoformat(data["expires_at"]) if data.get("expires_at") else None,
+            message_count=data.get("message_count", 0),
+            system_prompt=data.get("system_prompt"),
+            revision=data.get("revision", 0),
         )
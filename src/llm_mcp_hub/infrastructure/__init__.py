@@ -1,11 +1,16 @@
 """Infrastructure layer - external system integrations"""
 from .session import SessionStore, MemorySessionStore, RedisSessionStore
+from .blob import BlobStore, MemoryBlobStore, FileBlobStore, RedisBlobStore
 from .providers import ProviderAdapter, ClaudeAdapter, GeminiAdapter
 
 __all__ = [
     "SessionStore",
     "MemorySessionStore",
     "RedisSessionStore",
+    "BlobStore",
+    "MemoryBlobStore",
+    "FileBlobStore",
+    "RedisBlobStore",
     "ProviderAdapter",
     "ClaudeAdapter",
     "GeminiAdapter",
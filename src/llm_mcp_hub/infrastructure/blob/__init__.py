@@ -0,0 +1,13 @@
+"""Content-addressed blob store implementations"""
+from .base import BlobStore, BlobWriter
+from .memory import MemoryBlobStore
+from .file import FileBlobStore
+from .redis import RedisBlobStore
+
+__all__ = [
+    "BlobStore",
+    "BlobWriter",
+    "MemoryBlobStore",
+    "FileBlobStore",
+    "RedisBlobStore",
+]
@@ -0,0 +1,95 @@
+"""Abstract base class for content-addressed blob storage"""
+import hashlib
+from abc import ABC, abstractmethod
+
+
+class BlobWriter(ABC):
+    """
+    Incremental blob writer.
+
+    Content is hashed as it is written, so uploads never need to be held
+    in memory as a whole (except by the in-memory store).
+    """
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+    async def write(self, chunk: bytes) -> None:
+        """Append chunk to the blob"""
+        self._hash.update(chunk)
+        self.size += len(chunk)
+        await self._write(chunk)
+
+    @property
+    def digest(self) -> str:
+        """Digest of content written so far"""
+        return self._hash.hexdigest()
+
+    @abstractmethod
+    async def _write(self, chunk: bytes) -> None:
+        """Store chunk"""
+        pass
+
+    @abstractmethod
+    async def commit(self) -> str:
+        """Finish the blob, add a reference and return its digest"""
+        pass
+
+    @abstractmethod
+    async def abort(self) -> None:
+        """Discard partially written content"""
+        pass
+
+
+class BlobStore(ABC):
+    """
+    Content-addressed blob store interface.
+
+    Blobs are keyed by the SHA-256 hex digest of their content and carry a
+    reference count: put() and acquire() add a reference, release() drops
+    one and deletes the blob when none remain.
+    """
+
+    @staticmethod
+    def digest(content: bytes) -> str:
+        """Compute blob key for content"""
+        return hashlib.sha256(content).hexdigest()
+
+    @abstractmethod
+    async def put(self, content: bytes) -> str:
+        """Store content (if new) and add a reference, return its digest"""
+        pass
+
+    @abstractmethod
+    def open_writer(self) -> BlobWriter:
+        """Start an incremental upload"""
+        pass
+
+    @abstractmethod
+    async def acquire(self, digest: str) -> bool:
+        """Add a reference to an existing blob, return False if missing"""
+        pass
+
+    @abstractmethod
+    async def release(self, digest: str) -> None:
+        """Drop a reference, deleting the blob when none remain"""
+        pass
+
+    @abstractmethod
+    async def get_many(self, digests: list[str]) -> dict[str, bytes]:
+        """Get contents by digest; missing blobs are omitted"""
+        pass
+
+    async def get(self, digest: str) -> bytes | None:
+        """Get content by digest"""
+        return (await self.get_many([digest])).get(digest)
+
+    async def touch(self, digests: list[str], ttl: int) -> None:
+        """Keep blobs for at least ttl seconds; a no-op for stores without expiry"""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close connection/cleanup resources"""
+        pass
@@ -0,0 +1,149 @@
+"""Local disk blob store"""
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+
+from .base import BlobStore, BlobWriter
+
+
+class FileBlobWriter(BlobWriter):
+    """Incremental writer for FileBlobStore, spooling to a temp file"""
+
+    def __init__(self, store: "FileBlobStore"):
+        super().__init__()
+        self._store = store
+        self._file = None
+
+    async def _write(self, chunk: bytes) -> None:
+        if self._file is None:
+            self._store._base.mkdir(parents=True, exist_ok=True)
+            self._file = await asyncio.to_thread(
+                tempfile.NamedTemporaryFile, dir=self._store._base, prefix=".upload-", delete=False
+            )
+        await asyncio.to_thread(self._file.write, chunk)
+
+    async def commit(self) -> str:
+        if self._file is None:
+            return await self._store.put(b"")
+        await asyncio.to_thread(self._file.close)
+        digest = self.digest
+        async with self._store._lock:
+            await asyncio.to_thread(self._store._commit_sync, digest, self._file.name)
+        return digest
+
+    async def abort(self) -> None:
+        if self._file is not None:
+            await asyncio.to_thread(self._file.close)
+            Path(self._file.name).unlink(missing_ok=True)
+
+
+class FileBlobStore(BlobStore):
+    """
+    Local disk blob store implementation.
+
+    Blobs live at <base>/<digest[:2]>/<digest> with the reference count in
+    a <digest>.refs sidecar file. Writes go through a temp file and
+    os.replace so readers never see partial content. Intended for a single
+    hub process per directory.
+    """
+
+    def __init__(self, base_path: str):
+        self._base = Path(base_path)
+        self._lock = asyncio.Lock()
+
+    def _path(self, digest: str) -> Path:
+        """Blob content path"""
+        return self._base / digest[:2] / digest
+
+    def _refs_path(self, digest: str) -> Path:
+        """Blob reference count path"""
+        return self._base / digest[:2] / f"{digest}.refs"
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write file via temp file + rename"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _read_refs(self, digest: str) -> int:
+        try:
+            return int(self._refs_path(digest).read_text())
+        except FileNotFoundError:
+            return 0
+
+    def _add_ref(self, digest: str) -> None:
+        self._write_atomic(self._refs_path(digest), str(self._read_refs(digest) + 1).encode())
+
+    def _put_sync(self, digest: str, content: bytes) -> None:
+        if not self._path(digest).exists():
+            self._write_atomic(self._path(digest), content)
+        self._add_ref(digest)
+
+    def _commit_sync(self, digest: str, tmp_path: str) -> None:
+        path = self._path(digest)
+        if path.exists():
+            os.unlink(tmp_path)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, path)
+        self._add_ref(digest)
+
+    def _acquire_sync(self, digest: str) -> bool:
+        if not self._path(digest).exists():
+            return False
+        self._add_ref(digest)
+        return True
+
+    def _release_sync(self, digest: str) -> None:
+        refs = self._read_refs(digest)
+        if refs <= 1:
+            self._path(digest).unlink(missing_ok=True)
+            self._refs_path(digest).unlink(missing_ok=True)
+        else:
+            self._write_atomic(self._refs_path(digest), str(refs - 1).encode())
+
+    def _get_many_sync(self, digests: list[str]) -> dict[str, bytes]:
+        result = {}
+        for digest in digests:
+            try:
+                result[digest] = self._path(digest).read_bytes()
+            except FileNotFoundError:
+                continue
+        return result
+
+    async def put(self, content: bytes) -> str:
+        """Store content (if new) and add a reference, return its digest"""
+        digest = self.digest(content)
+        async with self._lock:
+            await asyncio.to_thread(self._put_sync, digest, content)
+        return digest
+
+    def open_writer(self) -> BlobWriter:
+        """Start an incremental upload"""
+        return FileBlobWriter(self)
+
+    async def acquire(self, digest: str) -> bool:
+        """Add a reference to an existing blob, return False if missing"""
+        async with self._lock:
+            return await asyncio.to_thread(self._acquire_sync, digest)
+
+    async def release(self, digest: str) -> None:
+        """Drop a reference, deleting the blob when none remain"""
+        async with self._lock:
+            await asyncio.to_thread(self._release_sync, digest)
+
+    async def get_many(self, digests: list[str]) -> dict[str, bytes]:
+        """Get contents by digest; missing blobs are omitted"""
+        return await asyncio.to_thread(self._get_many_sync, digests)
+
+    async def close(self) -> None:
+        """Nothing to close for disk storage"""
+        pass
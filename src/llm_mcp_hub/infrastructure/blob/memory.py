@@ -0,0 +1,66 @@
+"""In-memory blob store for development and testing"""
+from .base import BlobStore, BlobWriter
+
+
+class MemoryBlobWriter(BlobWriter):
+    """Incremental writer for MemoryBlobStore"""
+
+    def __init__(self, store: "MemoryBlobStore"):
+        super().__init__()
+        self._store = store
+        self._chunks: list[bytes] = []
+
+    async def _write(self, chunk: bytes) -> None:
+        self._chunks.append(chunk)
+
+    async def commit(self) -> str:
+        return await self._store.put(b"".join(self._chunks))
+
+    async def abort(self) -> None:
+        self._chunks.clear()
+
+
+class MemoryBlobStore(BlobStore):
+    """In-memory blob store implementation"""
+
+    def __init__(self):
+        self._blobs: dict[str, bytes] = {}
+        self._refs: dict[str, int] = {}
+
+    async def put(self, content: bytes) -> str:
+        """Store content (if new) and add a reference, return its digest"""
+        digest = self.digest(content)
+        self._blobs.setdefault(digest, content)
+        self._refs[digest] = self._refs.get(digest, 0) + 1
+        return digest
+
+    def open_writer(self) -> BlobWriter:
+        """Start an incremental upload"""
+        return MemoryBlobWriter(self)
+
+    async def acquire(self, digest: str) -> bool:
+        """Add a reference to an existing blob, return False if missing"""
+        if digest not in self._blobs:
+            return False
+        self._refs[digest] += 1
+        return True
+
+    async def release(self, digest: str) -> None:
+        """Drop a reference, deleting the blob when none remain"""
+        refs = self._refs.get(digest)
+        if refs is None:
+            return
+        if refs <= 1:
+            del self._refs[digest]
+            del self._blobs[digest]
+        else:
+            self._refs[digest] = refs - 1
+
+    async def get_many(self, digests: list[str]) -> dict[str, bytes]:
+        """Get contents by digest; missing blobs are omitted"""
+        return {d: self._blobs[d] for d in digests if d in self._blobs}
+
+    async def close(self) -> None:
+        """Clear all blobs"""
+        self._blobs.clear()
+        self._refs.clear()
@@ -0,0 +1,168 @@
+"""Redis blob store"""
+import logging
+import uuid
+
+import redis.asyncio as redis
+
+from .base import BlobStore, BlobWriter
+
+logger = logging.getLogger(__name__)
+
+# Move upload into place unless the blob already exists, then add a reference
+_COMMIT_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    redis.call('DEL', KEYS[1])
+    redis.call('EXPIRE', KEYS[2], ARGV[1], 'GT')
+else
+    redis.call('RENAME', KEYS[1], KEYS[2])
+    redis.call('EXPIRE', KEYS[2], ARGV[1])
+end
+redis.call('INCR', KEYS[3])
+redis.call('EXPIRE', KEYS[3], ARGV[1], 'NX')
+redis.call('EXPIRE', KEYS[3], ARGV[1], 'GT')
+return 1
+"""
+
+# Decrement reference count and delete blob + counter when it reaches zero
+_RELEASE_SCRIPT = """
+local refs = redis.call('DECR', KEYS[2])
+if refs <= 0 then
+    redis.call('DEL', KEYS[1], KEYS[2])
+end
+return refs
+"""
+
+
+class RedisBlobWriter(BlobWriter):
+    """Incremental writer for RedisBlobStore, appending to a temporary key"""
+
+    def __init__(self, store: "RedisBlobStore"):
+        super().__init__()
+        self._store = store
+        self._upload_key = f"{store.UPLOAD_KEY_PREFIX}{uuid.uuid4()}"
+
+    async def _write(self, chunk: bytes) -> None:
+        client = await self._store._ensure_connected()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.append(self._upload_key, chunk)
+            # Abandoned uploads disappear on their own
+            pipe.expire(self._upload_key, self._store.UPLOAD_TTL)
+            await pipe.execute()
+
+    async def commit(self) -> str:
+        if self.size == 0:
+            return await self._store.put(b"")
+        digest = self.digest
+        await self._store._commit_upload(self._upload_key, digest)
+        return digest
+
+    async def abort(self) -> None:
+        client = await self._store._ensure_connected()
+        await client.delete(self._upload_key)
+
+
+class RedisBlobStore(BlobStore):
+    """
+    Redis-based blob store implementation.
+
+    Content and reference count live under separate keys. Both carry a TTL
+    that is extended (never shortened) on every put/acquire and by touch(),
+    which the session service calls so blobs outlive the sessions that
+    reference them. References of expired sessions are released by the
+    session store's expiry sweep; the TTL reclaims whatever a crash leaks.
+    """
+
+    KEY_PREFIX = "llm_hub:blob:"
+    REFS_KEY_PREFIX = "llm_hub:blob_refs:"
+    UPLOAD_KEY_PREFIX = "llm_hub:blob_upload:"
+    UPLOAD_TTL = 3600
+
+    def __init__(self, redis_url: str, ttl: int = 86400):
+        self._redis_url = redis_url
+        self._ttl = ttl
+        self._client: redis.Redis | None = None
+
+    async def _ensure_connected(self) -> redis.Redis:
+        """Ensure Redis connection is established"""
+        if self._client is None:
+            # Blob content is binary; keep responses as bytes
+            self._client = redis.from_url(self._redis_url, decode_responses=False)
+        return self._client
+
+    def _key(self, digest: str) -> str:
+        return f"{self.KEY_PREFIX}{digest}"
+
+    def _refs_key(self, digest: str) -> str:
+        return f"{self.REFS_KEY_PREFIX}{digest}"
+
+    async def put(self, content: bytes) -> str:
+        """Store content (if new) and add a reference, return its digest"""
+        client = await self._ensure_connected()
+        digest = self.digest(content)
+
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.set(self._key(digest), content, nx=True, ex=self._ttl)
+            pipe.expire(self._key(digest), self._ttl, gt=True)
+            pipe.incr(self._refs_key(digest))
+            pipe.expire(self._refs_key(digest), self._ttl, nx=True)
+            pipe.expire(self._refs_key(digest), self._ttl, gt=True)
+            await pipe.execute()
+
+        logger.debug(f"Stored blob: {digest} ({len(content)} bytes)")
+        return digest
+
+    def open_writer(self) -> BlobWriter:
+        """Start an incremental upload"""
+        return RedisBlobWriter(self)
+
+    async def _commit_upload(self, upload_key: str, digest: str) -> None:
+        """Move a finished upload to its content key"""
+        client = await self._ensure_connected()
+        await client.eval(
+            _COMMIT_SCRIPT, 3, upload_key, self._key(digest), self._refs_key(digest), self._ttl
+        )
+        logger.debug(f"Stored uploaded blob: {digest}")
+
+    async def acquire(self, digest: str) -> bool:
+        """Add a reference to an existing blob, return False if missing"""
+        client = await self._ensure_connected()
+        if not await client.exists(self._key(digest)):
+            return False
+
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.expire(self._key(digest), self._ttl, gt=True)
+            pipe.incr(self._refs_key(digest))
+            pipe.expire(self._refs_key(digest), self._ttl, nx=True)
+            pipe.expire(self._refs_key(digest), self._ttl, gt=True)
+            await pipe.execute()
+        return True
+
+    async def touch(self, digests: list[str], ttl: int) -> None:
+        """Extend blob and reference count TTLs to at least ttl seconds"""
+        if not digests:
+            return
+        client = await self._ensure_connected()
+        async with client.pipeline(transaction=False) as pipe:
+            for digest in digests:
+                pipe.expire(self._key(digest), ttl, gt=True)
+                pipe.expire(self._refs_key(digest), ttl, gt=True)
+            await pipe.execute()
+
+    async def release(self, digest: str) -> None:
+        """Drop a reference, deleting the blob when none remain"""
+        client = await self._ensure_connected()
+        await client.eval(_RELEASE_SCRIPT, 2, self._key(digest), self._refs_key(digest))
+
+    async def get_many(self, digests: list[str]) -> dict[str, bytes]:
+        """Get contents by digest; missing blobs are omitted"""
+        if not digests:
+            return {}
+        client = await self._ensure_connected()
+        values = await client.mget([self._key(d) for d in digests])
+        return {d: v for d, v in zip(digests, values) if v is not None}
+
+    async def close(self) -> None:
+        """Close Redis connection"""
+        if self._client:
+            await self._client.close()
+            self._client = None
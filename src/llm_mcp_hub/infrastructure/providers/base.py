@@ -2,6 +2,21 @@
 from abc import ABC, abstractmethod
 from typing import AsyncIterator
 
+from llm_mcp_hub.core.metrics import REGISTRY
+
+# Shared by adapters that run one CLI process per call
+PROCESS_SPAWN_SECONDS = REGISTRY.histogram(
+    "llm_hub_process_spawn_seconds",
+    "Time to start a provider CLI process",
+    ("provider", "model"),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+PROCESSES = REGISTRY.gauge(
+    "llm_hub_provider_processes",
+    "Provider CLI processes currently running",
+    ("provider",),
+)
+
 
 class ProviderAdapter(ABC):
     """Abstract LLM provider adapter interface"""
@@ -3,7 +3,9 @@ import asyncio
 import json
 import logging
 import os
+import signal
 import subprocess
+import time
 from typing import AsyncIterator
 
 from llm_mcp_hub.core.exceptions import (
@@ -11,7 +13,8 @@ from llm_mcp_hub.core.exceptions import (
     ProviderError,
     ProviderTimeoutError,
 )
-from .base import ProviderAdapter
+from llm_mcp_hub.core.timing import SPAWN, record
+from .base import PROCESS_SPAWN_SECONDS, PROCESSES, ProviderAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +82,32 @@ class ClaudeAdapter(ProviderAdapter):
             env["CLAUDE_CODE_OAUTH_TOKEN"] = self._oauth_token
         return env
 
+    async def _spawn(self, cmd: list[str], model: str) -> asyncio.subprocess.Process:
+        """Start the CLI in its own process group, recording spawn time"""
+        started = time.perf_counter()
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=self._get_env(),
+            cwd="/tmp",  # Avoid reading CLAUDE.md from project directory
+            start_new_session=True,  # Own process group, so tool subprocesses can be killed too
+        )
+        spawn_seconds = time.perf_counter() - started
+        PROCESS_SPAWN_SECONDS.labels("claude", model).observe(spawn_seconds)
+        record(SPAWN, spawn_seconds)
+        PROCESSES.labels("claude").inc()
+        return proc
+
+    @staticmethod
+    async def _kill(proc: asyncio.subprocess.Process) -> None:
+        """Kill the CLI and everything it spawned"""
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+
     async def chat(
         self,
         prompt: str,
@@ -106,29 +135,26 @@ class ClaudeAdapter(ProviderAdapter):
 
         logger.debug(f"Executing Claude CLI: {' '.join(cmd[:6])}...")
 
+        proc = await self._spawn(cmd, effective_model)
         try:
-            result = await asyncio.wait_for(
-                asyncio.to_thread(
-                    subprocess.run,
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    env=self._get_env(),
-                    cwd="/tmp",  # Avoid reading CLAUDE.md from project directory
-                ),
-                timeout=timeout,
-            )
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
         except asyncio.TimeoutError:
             raise ProviderTimeoutError("claude", timeout)
+        finally:
+            # Timed out or cancelled: stop the CLI instead of leaving it running
+            if proc.returncode is None:
+                logger.info("Stopping Claude CLI")
+                await self._kill(proc)
+            PROCESSES.labels("claude").dec()
 
-        if result.returncode != 0:
-            logger.error(f"Claude CLI error: {result.stderr}")
-            raise ProviderError(f"claude-code failed: {result.stderr}", provider="claude")
+        if proc.returncode != 0:
+            logger.error(f"Claude CLI error: {stderr.decode()}")
+            raise ProviderError(f"claude-code failed: {stderr.decode()}", provider="claude")
 
         try:
-            response = json.loads(result.stdout)
+            response = json.loads(stdout)
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Claude response: {result.stdout}")
+            logger.error(f"Failed to parse Claude response: {stdout.decode()}")
             raise ProviderError(f"Invalid JSON response: {e}", provider="claude")
 
         # Handle error response
@@ -174,30 +200,30 @@ class ClaudeAdapter(ProviderAdapter):
 
         logger.debug(f"Executing Claude CLI (stream): {' '.join(cmd[:6])}...")
 
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=self._get_env(),
-            cwd="/tmp",  # Avoid reading CLAUDE.md from project directory
-        )
-
-        async for line in proc.stdout:  # type: ignore
-            if line:
-                try:
-                    data = json.loads(line.decode())
-                    # Extract text from assistant message
-                    if data.get("type") == "assistant":
-                        message = data.get("message", {})
-                        for content in message.get("content", []):
-                            if content.get("type") == "text":
-                                text = content.get("text", "")
-                                if text:
-                                    yield text
-                except json.JSONDecodeError:
-                    continue
-
-        await proc.wait()
+        proc = await self._spawn(cmd, effective_model)
+        try:
+            async for line in proc.stdout:  # type: ignore
+                if line:
+                    try:
+                        data = json.loads(line.decode())
+                        # Extract text from assistant message
+                        if data.get("type") == "assistant":
+                            message = data.get("message", {})
+                            for content in message.get("content", []):
+                                if content.get("type") == "text":
+                                    text = content.get("text", "")
+                                    if text:
+                                        yield text
+                    except json.JSONDecodeError:
+                        continue
+
+            await proc.wait()
+        finally:
+            # Stream abandoned (client gone or cancelled): stop the CLI
+            if proc.returncode is None:
+                logger.info("Stopping abandoned Claude CLI stream")
+                await self._kill(proc)
+            PROCESSES.labels("claude").dec()
 
         if proc.returncode != 0:
             stderr = await proc.stderr.read() if proc.stderr else b""  # type: ignore
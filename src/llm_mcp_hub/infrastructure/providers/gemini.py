@@ -3,6 +3,7 @@ import asyncio
 import logging
 import os
 import re
+import time
 from pathlib import Path
 from typing import AsyncIterator
 
@@ -11,7 +12,8 @@ from llm_mcp_hub.core.exceptions import (
     ProviderError,
     ProviderTimeoutError,
 )
-from .base import ProviderAdapter
+from llm_mcp_hub.core.timing import SPAWN, record
+from .base import PROCESS_SPAWN_SECONDS, PROCESSES, ProviderAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -72,37 +74,46 @@ class GeminiAdapter(ProviderAdapter):
         """Remove ANSI escape codes from text"""
         return self.ANSI_ESCAPE.sub("", text)
 
-    def _sync_chat(self, prompt: str, model: str, timeout: float) -> str:
-        """Synchronous PTY chat execution"""
+    def _sync_chat(self, prompt: str, model: str, timeout: float, processes: list | None = None) -> str:
+        """Synchronous PTY chat execution; the spawned process is appended to processes"""
         from ptyprocess import PtyProcess
-        import time
 
         cmd = ["gemini", "-p", prompt, "-m", model]
 
+        spawn_started = time.perf_counter()
         proc = PtyProcess.spawn(
             cmd,
             env=self._get_env(),
             dimensions=(24, 200),  # Terminal size
         )
+        spawn_seconds = time.perf_counter() - spawn_started
+        PROCESS_SPAWN_SECONDS.labels("gemini", model).observe(spawn_seconds)
+        record(SPAWN, spawn_seconds)
+        PROCESSES.labels("gemini").inc()
+        if processes is not None:
+            processes.append(proc)
 
         output = []
         start_time = time.time()
 
-        while proc.isalive():
-            if time.time() - start_time > timeout:
-                proc.terminate(force=True)
-                raise TimeoutError(f"Gemini response timeout ({timeout}s)")
+        try:
+            while proc.isalive():
+                if time.time() - start_time > timeout:
+                    proc.terminate(force=True)
+                    raise TimeoutError(f"Gemini response timeout ({timeout}s)")
 
-            try:
-                chunk = proc.read(1024)
-                if chunk:
-                    output.append(chunk.decode("utf-8", errors="ignore"))
-            except EOFError:
-                break
-            except Exception:
-                break
+                try:
+                    chunk = proc.read(1024)
+                    if chunk:
+                        output.append(chunk.decode("utf-8", errors="ignore"))
+                except EOFError:
+                    break
+                except Exception:
+                    break
 
-        proc.close()
+            proc.close()
+        finally:
+            PROCESSES.labels("gemini").dec()
 
         raw_output = "".join(output)
         return self._parse_response(raw_output)
@@ -138,9 +149,10 @@ class GeminiAdapter(ProviderAdapter):
 
         logger.debug(f"Executing Gemini CLI: gemini -p '...' -m {effective_model}")
 
+        processes: list = []
         try:
             result = await asyncio.wait_for(
-                asyncio.to_thread(self._sync_chat, full_prompt, effective_model, timeout),
+                asyncio.to_thread(self._sync_chat, full_prompt, effective_model, timeout, processes),
                 timeout=timeout + 5,  # Extra buffer for thread overhead
             )
             return result
@@ -151,6 +163,12 @@ class GeminiAdapter(ProviderAdapter):
         except Exception as e:
             logger.error(f"Gemini error: {e}")
             raise ProviderError(f"Gemini CLI failed: {e}", provider="gemini")
+        finally:
+            # Cancelled or timed out: the worker thread keeps reading until the process exits
+            for proc in processes:
+                if proc.isalive():
+                    logger.info("Stopping Gemini CLI")
+                    proc.terminate(force=True)
 
     async def chat_stream(
         self,
@@ -184,13 +202,19 @@ class GeminiAdapter(ProviderAdapter):
         cmd = ["gemini", "-p", full_prompt, "-m", effective_model]
 
         def _create_process():
-            return PtyProcess.spawn(
+            started = time.perf_counter()
+            proc = PtyProcess.spawn(
                 cmd,
                 env=self._get_env(),
                 dimensions=(24, 200),
             )
+            spawn_seconds = time.perf_counter() - started
+            PROCESS_SPAWN_SECONDS.labels("gemini", effective_model).observe(spawn_seconds)
+            record(SPAWN, spawn_seconds)
+            return proc
 
         proc = await asyncio.to_thread(_create_process)
+        PROCESSES.labels("gemini").inc()
 
         try:
             while True:
@@ -207,7 +231,12 @@ class GeminiAdapter(ProviderAdapter):
                 except Exception:
                     break
         finally:
+            # Also reached when the stream is abandoned: stop the CLI first,
+            # which unblocks a pending read
+            if proc.isalive():
+                proc.terminate(force=True)
             await asyncio.to_thread(proc.close)
+            PROCESSES.labels("gemini").dec()
 
     async def health_check(self) -> dict:
         """Check Gemini provider health"""
@@ -1,11 +1,38 @@
 """Abstract base class for session storage"""
+import asyncio
+import logging
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Callable
 
-from llm_mcp_hub.domain import Session
+from llm_mcp_hub.domain import Message, Session, SessionHeader
+
+logger = logging.getLogger(__name__)
 
 
 class SessionStore(ABC):
-    """Abstract session store interface"""
+    """
+    Abstract session store interface.
+
+    Sessions removed by expiry or eviction are reported to the removal
+    listener with their reference file digests, so blob references are
+    released however a session ends. Expired sessions are found by
+    cleanup_expired(), run periodically by start_cleanup_task().
+    """
+
+    _cleanup_task: asyncio.Task | None = None
+    _removal_listener: Callable[[str, list[str]], None] | None = None
+
+    def set_removal_listener(self, listener: Callable[[str, list[str]], None] | None) -> None:
+        """Set callback invoked with id and file digests of sessions removed by expiry or eviction"""
+        self._removal_listener = listener
+
+    def _notify_removed(self, session_id: str, digests: list[str]) -> None:
+        """Invoke removal listener"""
+        if self._removal_listener is not None:
+            try:
+                self._removal_listener(session_id, digests)
+            except Exception as e:
+                logger.error(f"Session removal listener failed: {e}")
 
     @abstractmethod
     async def create(self, session: Session) -> Session:
@@ -18,8 +45,18 @@ class SessionStore(ABC):
         pass
 
     @abstractmethod
-    async def update(self, session: Session) -> Session:
-        """Update existing session"""
+    async def get_header(self, session_id: str) -> SessionHeader | None:
+        """Get session metadata by ID without loading messages"""
+        pass
+
+    @abstractmethod
+    def iter_messages(self, session_id: str) -> AsyncIterator[Message]:
+        """Iterate session messages in order without loading the whole session"""
+        pass
+
+    @abstractmethod
+    async def update(self, session: Session, touch: bool = True) -> Session:
+        """Update existing session; touch=False keeps updated_at (background writes)"""
         pass
 
     @abstractmethod
@@ -37,7 +74,44 @@ class SessionStore(ABC):
         """List sessions with pagination"""
         pass
 
+    @abstractmethod
+    async def list_headers(self, limit: int = 100, offset: int = 0) -> list[SessionHeader]:
+        """List session metadata with pagination, without loading messages"""
+        pass
+
+    @abstractmethod
+    async def cleanup_expired(self) -> int:
+        """Remove expired sessions, return count of removed sessions"""
+        pass
+
     @abstractmethod
     async def close(self) -> None:
         """Close connection/cleanup resources"""
         pass
+
+    def start_cleanup_task(self, interval: float = 60.0) -> None:
+        """Start background task that removes expired sessions every interval seconds"""
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop(interval))
+
+    async def stop_cleanup_task(self) -> None:
+        """Stop background cleanup task"""
+        if self._cleanup_task is None:
+            return
+        self._cleanup_task.cancel()
+        try:
+            await self._cleanup_task
+        except asyncio.CancelledError:
+            pass
+        self._cleanup_task = None
+
+    async def _cleanup_loop(self, interval: float) -> None:
+        """Periodically remove expired sessions"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                removed = await self.cleanup_expired()
+                if removed:
+                    logger.debug(f"Removed {removed} expired sessions")
+            except Exception as e:
+                logger.error(f"Session cleanup failed: {e}")
@@ -1,85 +1,250 @@
 """In-memory session store for development and testing"""
-import asyncio
+import heapq
+import logging
+from bisect import bisect_left, insort
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from typing import AsyncIterator
 
-from llm_mcp_hub.domain import Session, SessionStatus
+from llm_mcp_hub.domain import Message, Session, SessionHeader, SessionStatus
 from .base import SessionStore
 
+logger = logging.getLogger(__name__)
+
 
 class MemorySessionStore(SessionStore):
-    """In-memory session store implementation"""
+    """
+    In-memory session store implementation.
+
+    No operation awaits while touching shared state, so every method is
+    atomic with respect to other coroutines on the event loop and no lock
+    is needed. Listing order is kept in an index sorted by (created_at, id)
+    that is maintained on create/delete, so a page costs O(limit).
+
+    Expiry is tracked in a min-heap keyed by expires_at, so a cleanup pass
+    only touches sessions that are actually due. Optional caps on session
+    count and total message bytes evict the least recently used sessions.
+    """
 
-    def __init__(self, ttl: int = 3600):
+    def __init__(
+        self,
+        ttl: int = 3600,
+        max_sessions: int | None = None,
+        max_message_bytes: int | None = None,
+    ):
         self._sessions: dict[str, Session] = {}
         self._ttl = ttl
-        self._lock = asyncio.Lock()
+        self._max_sessions = max_sessions
+        self._max_message_bytes = max_message_bytes
+        # Ascending (created_at, session_id); newest sessions are at the end
+        self._index: list[tuple[datetime, str]] = []
+        # Index key per session, as inserted (created_at may be reassigned later)
+        self._index_keys: dict[str, tuple[datetime, str]] = {}
+        # (expires_at, session_id) min-heap; entries may be stale and are checked on pop
+        self._expiry_heap: list[tuple[datetime, str]] = []
+        self._scheduled_expiry: dict[str, datetime] = {}
+        # Least recently used first
+        self._lru: OrderedDict[str, None] = OrderedDict()
+        # Per session (accounted message count, message bytes)
+        self._message_bytes: dict[str, tuple[int, int]] = {}
+        self._total_message_bytes = 0
+
+    def _removed(self, session: Session | None) -> None:
+        """Report a session removed by expiry or eviction"""
+        if session is not None:
+            self._notify_removed(session.id, session.context.file_digests if session.context else [])
+
+    def _index_add(self, session: Session) -> None:
+        """Insert session into the ordering index"""
+        key = (session.created_at, session.id)
+        self._index_keys[session.id] = key
+        # Sessions are created in time order, so appending is the common case
+        if not self._index or key >= self._index[-1]:
+            self._index.append(key)
+        else:
+            insort(self._index, key)
+
+    def _index_remove(self, session_id: str) -> None:
+        """Remove session from the ordering index"""
+        key = self._index_keys.pop(session_id, None)
+        if key is None:
+            return
+        i = bisect_left(self._index, key)
+        if i < len(self._index) and self._index[i] == key:
+            del self._index[i]
+
+    def _schedule_expiry(self, session: Session) -> None:
+        """Push session expiry onto the heap if it changed"""
+        if session.expires_at is None:
+            self._scheduled_expiry.pop(session.id, None)
+            return
+        if self._scheduled_expiry.get(session.id) == session.expires_at:
+            return
+        self._scheduled_expiry[session.id] = session.expires_at
+        heapq.heappush(self._expiry_heap, (session.expires_at, session.id))
+
+        # Drop stale entries once they dominate the heap
+        if len(self._expiry_heap) > 2 * len(self._scheduled_expiry) + 1024:
+            self._expiry_heap = [(at, sid) for sid, at in self._scheduled_expiry.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _account_messages(self, session: Session) -> None:
+        """Update message byte accounting for session"""
+        count, size = self._message_bytes.get(session.id, (0, 0))
+        messages = session.messages
+        if len(messages) >= count:
+            # Messages are append-only in practice; only count the new ones
+            new_size = size + sum(len(m.content.encode("utf-8")) for m in messages[count:])
+        else:
+            new_size = sum(len(m.content.encode("utf-8")) for m in messages)
+        self._message_bytes[session.id] = (len(messages), new_size)
+        self._total_message_bytes += new_size - size
+
+    def _touch(self, session_id: str) -> None:
+        """Mark session as most recently used"""
+        if session_id in self._lru:
+            self._lru.move_to_end(session_id)
+        else:
+            self._lru[session_id] = None
+
+    def _enforce_limits(self, keep: str) -> None:
+        """Evict least recently used sessions until caps are satisfied"""
+        while self._lru and (
+            (self._max_sessions is not None and len(self._sessions) > self._max_sessions)
+            or (self._max_message_bytes is not None and self._total_message_bytes > self._max_message_bytes)
+        ):
+            victim = next(iter(self._lru))
+            if victim == keep:
+                break
+            self._removed(self._remove(victim))
+            logger.debug(f"Evicted session: {victim}")
+
+    def _remove(self, session_id: str) -> Session | None:
+        """Remove session and all its bookkeeping"""
+        session = self._sessions.pop(session_id, None)
+        if session is not None:
+            self._index_remove(session_id)
+            self._scheduled_expiry.pop(session_id, None)
+            self._lru.pop(session_id, None)
+            _, size = self._message_bytes.pop(session_id, (0, 0))
+            self._total_message_bytes -= size
+        return session
 
     async def create(self, session: Session) -> Session:
         """Create a new session"""
-        async with self._lock:
-            # Set expiration if not already set
-            if not session.expires_at:
-                session.expires_at = datetime.utcnow() + timedelta(seconds=self._ttl)
+        # Set expiration if not already set
+        if not session.expires_at:
+            session.expires_at = datetime.utcnow() + timedelta(seconds=self._ttl)
 
-            self._sessions[session.id] = session
-            return session
+        if session.id in self._sessions:
+            self._index_remove(session.id)
+
+        self._sessions[session.id] = session
+        self._index_add(session)
+        self._schedule_expiry(session)
+        self._account_messages(session)
+        self._touch(session.id)
+        self._enforce_limits(keep=session.id)
+        return session
 
     async def get(self, session_id: str) -> Session | None:
         """Get session by ID"""
-        async with self._lock:
-            session = self._sessions.get(session_id)
-            if session is None:
-                return None
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
 
-            # Check expiration
-            if session.expires_at and datetime.utcnow() > session.expires_at:
-                session.status = SessionStatus.EXPIRED
-                return session
+        self._touch(session_id)
 
+        # Check expiration
+        if session.expires_at and datetime.utcnow() > session.expires_at:
+            session.status = SessionStatus.EXPIRED
             return session
 
-    async def update(self, session: Session) -> Session:
-        """Update existing session"""
-        async with self._lock:
+        return session
+
+    async def get_header(self, session_id: str) -> SessionHeader | None:
+        """Get session metadata by ID without loading messages"""
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+
+        header = SessionHeader.from_session(session)
+        if session.expires_at and datetime.utcnow() > session.expires_at:
+            header.status = SessionStatus.EXPIRED
+        return header
+
+    async def iter_messages(self, session_id: str) -> AsyncIterator[Message]:
+        """Iterate session messages in order without loading the whole session"""
+        session = self._sessions.get(session_id)
+        if session is None:
+            return
+        messages = session.messages
+        # Messages appended while iterating are not included
+        for i in range(len(messages)):
+            yield messages[i]
+
+    async def update(self, session: Session, touch: bool = True) -> Session:
+        """Update existing session; touch=False keeps updated_at and LRU position"""
+        if touch:
             session.updated_at = datetime.utcnow()
-            self._sessions[session.id] = session
-            return session
+        session.revision += 1
+        if session.id not in self._index_keys:
+            self._index_add(session)
+        self._sessions[session.id] = session
+        self._schedule_expiry(session)
+        self._account_messages(session)
+        if touch or session.id not in self._lru:
+            self._touch(session.id)
+        self._enforce_limits(keep=session.id)
+        return session
 
     async def delete(self, session_id: str) -> bool:
         """Delete session by ID"""
-        async with self._lock:
-            if session_id in self._sessions:
-                del self._sessions[session_id]
-                return True
-            return False
+        return self._remove(session_id) is not None
 
     async def exists(self, session_id: str) -> bool:
         """Check if session exists"""
-        async with self._lock:
-            return session_id in self._sessions
+        return session_id in self._sessions
 
     async def list_sessions(self, limit: int = 100, offset: int = 0) -> list[Session]:
-        """List sessions with pagination"""
-        async with self._lock:
-            sessions = list(self._sessions.values())
-            # Sort by created_at descending
-            sessions.sort(key=lambda s: s.created_at, reverse=True)
-            return sessions[offset : offset + limit]
+        """List sessions with pagination (newest first)"""
+        end = len(self._index) - offset
+        if end <= 0 or limit <= 0:
+            return []
+        start = max(end - limit, 0)
+        return [self._sessions[sid] for _, sid in reversed(self._index[start:end])]
+
+    async def list_headers(self, limit: int = 100, offset: int = 0) -> list[SessionHeader]:
+        """List session metadata with pagination (newest first)"""
+        return [SessionHeader.from_session(s) for s in await self.list_sessions(limit=limit, offset=offset)]
 
     async def close(self) -> None:
         """Clear all sessions"""
-        async with self._lock:
-            self._sessions.clear()
+        self._sessions.clear()
+        self._index.clear()
+        self._index_keys.clear()
+        self._expiry_heap.clear()
+        self._scheduled_expiry.clear()
+        self._lru.clear()
+        self._message_bytes.clear()
+        self._total_message_bytes = 0
 
     async def cleanup_expired(self) -> int:
         """Remove expired sessions, return count of removed sessions"""
-        async with self._lock:
-            now = datetime.utcnow()
-            expired_ids = [
-                sid
-                for sid, session in self._sessions.items()
-                if session.expires_at and now > session.expires_at
-            ]
-            for sid in expired_ids:
-                del self._sessions[sid]
-            return len(expired_ids)
+        now = datetime.utcnow()
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            _, sid = heapq.heappop(self._expiry_heap)
+            session = self._sessions.get(sid)
+            if session is None:
+                continue
+            if session.expires_at is None:
+                self._scheduled_expiry.pop(sid, None)
+            elif session.expires_at < now:
+                self._removed(self._remove(sid))
+                removed += 1
+            else:
+                # Expiry was extended in place; reschedule
+                self._scheduled_expiry.pop(sid, None)
+                self._schedule_expiry(session)
+        return removed
@@ -1,36 +1,269 @@
 """Redis session store for production"""
+import codecs
 import json
 import logging
-from datetime import timedelta
+import time
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator
 
 import redis.asyncio as redis
+from redis.client import NEVER_DECODE
 
-from llm_mcp_hub.domain import Session
+from llm_mcp_hub.core.metrics import REGISTRY, RollingQuantiles
+from llm_mcp_hub.domain import Message, Session, SessionHeader
 from .base import SessionStore
 
 logger = logging.getLogger(__name__)
 
+_json_decoder = json.JSONDecoder()
+
+_OPERATION_SECONDS = REGISTRY.histogram(
+    "llm_hub_redis_operation_seconds",
+    "Session store Redis round-trip time per operation",
+    ("operation",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+_CONNECTION_ERRORS = REGISTRY.counter(
+    "llm_hub_redis_connection_errors_total",
+    "Session store operations failed by connection errors or timeouts",
+    ("operation",),
+)
+_POOL_CONNECTIONS = REGISTRY.gauge(
+    "llm_hub_redis_pool_connections",
+    "Session store pool connections by state (in_use, idle, waiting callers)",
+    ("state",),
+)
+_POOL_WAITS = REGISTRY.counter(
+    "llm_hub_redis_pool_waits_total",
+    "Connection checkouts that had to wait for a free pool connection",
+)
+
+
+class _InstrumentedPool(redis.BlockingConnectionPool):
+    """
+    Blocking connection pool that tracks connection states and waiting callers.
+
+    Counts are kept here rather than read from the pool's private lists.
+    Connections handed out are remembered by id, because the base pool
+    releases a connection itself when connecting it fails.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.waiting = 0
+        self.waits = 0
+        self.created = 0
+        self._leased: set[int] = set()
+
+    def reset(self) -> None:
+        super().reset()
+        self.created = 0
+        self._leased = set()
+
+    def make_connection(self):
+        self.created += 1
+        return super().make_connection()
+
+    def stats(self) -> dict[str, int]:
+        """Connection counts by state"""
+        in_use = len(self._leased)
+        return {
+            "max_connections": self.max_connections,
+            "in_use": in_use,
+            "idle": self.created - in_use,
+            "waiting": self.waiting,
+            "waits": self.waits,
+        }
+
+    def _publish(self) -> None:
+        in_use = len(self._leased)
+        _POOL_CONNECTIONS.labels("in_use").set(in_use)
+        _POOL_CONNECTIONS.labels("idle").set(self.created - in_use)
+        _POOL_CONNECTIONS.labels("waiting").set(self.waiting)
+
+    async def get_connection(self, *args, **kwargs):
+        if len(self._leased) < self.max_connections:
+            connection = await super().get_connection(*args, **kwargs)
+        else:
+            self.waiting += 1
+            self.waits += 1
+            _POOL_WAITS.inc()
+            self._publish()
+            try:
+                connection = await super().get_connection(*args, **kwargs)
+            finally:
+                self.waiting -= 1
+        self._leased.add(id(connection))
+        self._publish()
+        return connection
+
+    async def release(self, connection) -> None:
+        await super().release(connection)
+        self._leased.discard(id(connection))
+        self._publish()
+
+
+class _RecordReader:
+    """
+    Incremental reader for a JSON object stored as a Redis string.
+
+    The value is fetched in fixed-size byte ranges and decoded one value at
+    a time, so memory use is bounded by the range size plus the largest
+    single value.
+    """
+
+    def __init__(self, client: redis.Redis, key: str, chunk_size: int):
+        self._client = client
+        self._key = key
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._offset = 0
+        self._eof = False
+
+    async def _fill(self) -> bool:
+        """Read the next byte range, return False at end of value"""
+        if self._eof:
+            return False
+        data = await self._client.execute_command(
+            "GETRANGE", self._key, self._offset, self._offset + self._chunk_size - 1, **{NEVER_DECODE: True}
+        )
+        self._offset += len(data)
+        self._eof = len(data) < self._chunk_size
+        self._buf = self._buf[self._pos:] + self._decoder.decode(data, final=self._eof)
+        self._pos = 0
+        return True
+
+    async def _peek(self) -> str:
+        """Skip whitespace and return the next character ("" at end)"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not await self._fill():
+                return ""
+
+    async def _take(self, expected: str) -> str:
+        """Consume the next character, which must be one of expected"""
+        char = await self._peek()
+        if not char or char not in expected:
+            raise ValueError(f"Malformed session record {self._key}: expected {expected!r}, got {char!r}")
+        self._pos += 1
+        return char
+
+    async def _value(self) -> Any:
+        """Decode the next JSON value"""
+        await self._peek()
+        while True:
+            try:
+                value, end = _json_decoder.raw_decode(self._buf, self._pos)
+                # A number ending exactly at the buffer end may continue in the next range
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            await self._fill()
+
+    async def iter_array(self, field: str) -> AsyncIterator[Any]:
+        """Yield the items of the array stored under a top-level key"""
+        await self._take("{")
+        if await self._peek() == "}":
+            return
+        while True:
+            key = await self._value()
+            await self._take(":")
+            if key == field and await self._peek() == "[":
+                self._pos += 1
+                if await self._peek() == "]":
+                    return
+                while True:
+                    yield await self._value()
+                    if await self._take(",]") == "]":
+                        return
+            await self._value()
+            if await self._take(",}") == "}":
+                return
+
 
 class RedisSessionStore(SessionStore):
-    """Redis-based session store implementation"""
+    """
+    Redis-based session store implementation.
 
-    KEY_PREFIX = "llm_hub:session:"
+    Each session is stored as a full JSON record plus a small header record
+    (provider, model, status, timestamps, message count) under a separate
+    key with the same TTL, so metadata reads never load messages. A sorted
+    set indexed by created_at serves paginated listing.
+
+    Redis expires the records themselves. A second sorted set scored by
+    expiry and a hash of each session's file digests let cleanup_expired()
+    drop index entries of expired sessions and report their files to the
+    removal listener.
 
-    def __init__(self, redis_url: str, ttl: int = 3600):
+    Messages can be streamed from a snapshot of the record without decoding
+    it whole (requires Redis 6.2+ for COPY).
+
+    Connections come from a bounded blocking pool. Round-trip times of
+    store operations feed rolling percentiles reported by health_check,
+    alongside pool connection counts and connection errors.
+    """
+
+    KEY_PREFIX = "llm_hub:session:"
+    HEADER_KEY_PREFIX = "llm_hub:session_header:"
+    INDEX_KEY = "llm_hub:sessions"
+    # Same members as INDEX_KEY, scored by expiry time, so expired entries can be found without listing
+    EXPIRY_KEY = "llm_hub:sessions:expiry"
+    # Session id -> JSON list of reference file digests, kept until the session is cleaned up
+    FILES_KEY = "llm_hub:sessions:files"
+    PRUNE_BATCH = 100
+    SNAPSHOT_KEY_PREFIX = "llm_hub:session_snapshot:"
+    SNAPSHOT_TTL = 3600
+    READ_CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        redis_url: str,
+        ttl: int = 3600,
+        max_connections: int = 50,
+        pool_timeout: float | None = 5.0,
+        socket_timeout: float | None = 5.0,
+        connect_timeout: float | None = 5.0,
+    ):
         self._redis_url = redis_url
         self._ttl = ttl
+        self._max_connections = max_connections
+        self._pool_timeout = pool_timeout
+        self._socket_timeout = socket_timeout
+        self._connect_timeout = connect_timeout
+        self._pool: _InstrumentedPool | None = None
         self._client: redis.Redis | None = None
+        self._latency = RollingQuantiles()
+        self._connection_errors = 0
 
     async def connect(self) -> None:
         """Connect to Redis"""
         if self._client is None:
-            self._client = redis.from_url(
+            self._pool = _InstrumentedPool.from_url(
                 self._redis_url,
+                max_connections=self._max_connections,
+                timeout=self._pool_timeout,
+                socket_timeout=self._socket_timeout,
+                socket_connect_timeout=self._connect_timeout,
                 encoding="utf-8",
                 decode_responses=True,
             )
+            self._client = redis.Redis(connection_pool=self._pool)
             # Test connection
-            await self._client.ping()
+            try:
+                await self._client.ping()
+            except Exception:
+                await self.close()
+                raise
             logger.info("Connected to Redis")
 
     async def _ensure_connected(self) -> redis.Redis:
@@ -39,10 +272,87 @@ class RedisSessionStore(SessionStore):
             await self.connect()
         return self._client  # type: ignore
 
+    @asynccontextmanager
+    async def _timed(self, operation: str):
+        """Record round-trip time of a store operation, count connection errors"""
+        started = time.perf_counter()
+        try:
+            yield
+        except (redis.ConnectionError, redis.TimeoutError):
+            self._connection_errors += 1
+            _CONNECTION_ERRORS.labels(operation).inc()
+            raise
+        seconds = time.perf_counter() - started
+        self._latency.observe(seconds)
+        _OPERATION_SECONDS.labels(operation).observe(seconds)
+
     def _key(self, session_id: str) -> str:
         """Generate Redis key for session"""
         return f"{self.KEY_PREFIX}{session_id}"
 
+    def _header_key(self, session_id: str) -> str:
+        """Generate Redis key for session header"""
+        return f"{self.HEADER_KEY_PREFIX}{session_id}"
+
+    async def _write(self, client: redis.Redis, session: Session, ttl: int) -> None:
+        """Write session record, header and index entry in one round trip"""
+        header = SessionHeader.from_session(session)
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.setex(self._key(session.id), ttl, json.dumps(session.to_dict()))
+            pipe.setex(self._header_key(session.id), ttl, json.dumps(header.to_dict()))
+            pipe.zadd(self.INDEX_KEY, {session.id: session.created_at.timestamp()})
+            pipe.zadd(self.EXPIRY_KEY, {session.id: time.time() + ttl})
+            digests = session.context.file_digests if session.context else []
+            if digests:
+                pipe.hset(self.FILES_KEY, session.id, json.dumps(digests))
+            else:
+                pipe.hdel(self.FILES_KEY, session.id)
+            await pipe.execute()
+
+    async def _prune_expired(self, client: redis.Redis) -> tuple[int, int]:
+        """
+        Clean up to PRUNE_BATCH sessions whose keys have expired.
+
+        Returns the number of entries looked at and of sessions removed.
+        """
+        ids = await client.zrangebyscore(self.EXPIRY_KEY, "-inf", time.time(), start=0, num=self.PRUNE_BATCH)
+        if not ids:
+            return 0, 0
+        # Only drop entries whose record is really gone (clock skew, TTL refreshed elsewhere)
+        values = await client.mget([self._key(sid) for sid in ids])
+        expired = [sid for sid, value in zip(ids, values) if value is None]
+        if not expired:
+            return len(ids), 0
+
+        # Claim each entry, so a session is reported by one replica only
+        async with client.pipeline(transaction=False) as pipe:
+            for sid in expired:
+                pipe.zrem(self.EXPIRY_KEY, sid)
+            claimed = [sid for sid, removed in zip(expired, await pipe.execute()) if removed]
+        if not claimed:
+            return len(ids), 0
+
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hmget(self.FILES_KEY, claimed)
+            pipe.hdel(self.FILES_KEY, *claimed)
+            pipe.zrem(self.INDEX_KEY, *claimed)
+            files, _, _ = await pipe.execute()
+        for sid, digests in zip(claimed, files):
+            self._notify_removed(sid, json.loads(digests) if digests else [])
+        return len(ids), len(claimed)
+
+    async def cleanup_expired(self) -> int:
+        """Drop index entries of expired sessions and report them, return count"""
+        client = await self._ensure_connected()
+        removed = 0
+        async with self._timed("cleanup"):
+            while True:
+                scanned, pruned = await self._prune_expired(client)
+                removed += pruned
+                # A full batch with nothing removed is left for a later pass
+                if scanned < self.PRUNE_BATCH or not pruned:
+                    return removed
+
     async def create(self, session: Session) -> Session:
         """Create a new session"""
         client = await self._ensure_connected()
@@ -50,18 +360,21 @@ class RedisSessionStore(SessionStore):
         # Calculate TTL
         ttl = self._ttl
         if session.expires_at:
-            from datetime import datetime
-
             delta = session.expires_at - datetime.utcnow()
             ttl = max(int(delta.total_seconds()), 1)
         else:
-            from datetime import datetime
-
             session.expires_at = datetime.utcnow() + timedelta(seconds=self._ttl)
 
         # Store session
-        key = self._key(session.id)
-        await client.setex(key, ttl, json.dumps(session.to_dict()))
+        async with self._timed("create"):
+            await self._write(client, session, ttl)
+
+        # Every new session adds an index entry; drop a batch of expired ones so
+        # the index stays bounded even if sessions are never listed
+        try:
+            await self._prune_expired(client)
+        except redis.RedisError as e:
+            logger.warning(f"Session index pruning failed: {e}")
 
         logger.debug(f"Created session: {session.id}, TTL: {ttl}s")
         return session
@@ -70,30 +383,62 @@ class RedisSessionStore(SessionStore):
         """Get session by ID"""
         client = await self._ensure_connected()
 
-        key = self._key(session_id)
-        data = await client.get(key)
+        async with self._timed("get"):
+            data = await client.get(self._key(session_id))
 
         if data is None:
             return None
 
         return Session.from_dict(json.loads(data))
 
-    async def update(self, session: Session) -> Session:
-        """Update existing session"""
+    async def get_header(self, session_id: str) -> SessionHeader | None:
+        """Get session metadata by ID without loading messages"""
         client = await self._ensure_connected()
 
-        from datetime import datetime
+        async with self._timed("get_header"):
+            data = await client.get(self._header_key(session_id))
+        if data is not None:
+            return SessionHeader.from_dict(json.loads(data))
 
-        session.updated_at = datetime.utcnow()
+        # Sessions written before headers existed only have the full record
+        session = await self.get(session_id)
+        return SessionHeader.from_session(session) if session else None
 
-        key = self._key(session.id)
+    async def iter_messages(self, session_id: str) -> AsyncIterator[Message]:
+        """
+        Iterate session messages in order without loading the whole session.
 
-        # Get remaining TTL
-        ttl = await client.ttl(key)
-        if ttl <= 0:
-            ttl = self._ttl
+        The record is copied to a snapshot key first, so updates during the
+        iteration cannot shift the ranges being read.
+        """
+        client = await self._ensure_connected()
 
-        await client.setex(key, ttl, json.dumps(session.to_dict()))
+        snapshot = f"{self.SNAPSHOT_KEY_PREFIX}{uuid.uuid4().hex}"
+        if not await client.copy(self._key(session_id), snapshot):
+            return
+        try:
+            # Snapshot outlives a crashed reader by at most SNAPSHOT_TTL
+            await client.expire(snapshot, self.SNAPSHOT_TTL)
+            reader = _RecordReader(client, snapshot, self.READ_CHUNK_SIZE)
+            async for data in reader.iter_array("messages"):
+                yield Message.from_dict(data)
+        finally:
+            await client.delete(snapshot)
+
+    async def update(self, session: Session, touch: bool = True) -> Session:
+        """Update existing session; touch=False keeps updated_at (background writes)"""
+        client = await self._ensure_connected()
+
+        if touch:
+            session.updated_at = datetime.utcnow()
+        session.revision += 1
+
+        async with self._timed("update"):
+            # Keep remaining TTL
+            ttl = await client.ttl(self._key(session.id))
+            if ttl <= 0:
+                ttl = self._ttl
+            await self._write(client, session, ttl)
 
         logger.debug(f"Updated session: {session.id}")
         return session
@@ -102,8 +447,14 @@ class RedisSessionStore(SessionStore):
         """Delete session by ID"""
         client = await self._ensure_connected()
 
-        key = self._key(session_id)
-        result = await client.delete(key)
+        async with self._timed("delete"), client.pipeline(transaction=True) as pipe:
+            pipe.delete(self._key(session_id))
+            pipe.delete(self._header_key(session_id))
+            pipe.zrem(self.INDEX_KEY, session_id)
+            pipe.zrem(self.EXPIRY_KEY, session_id)
+            # The caller releases the files of explicitly deleted sessions
+            pipe.hdel(self.FILES_KEY, session_id)
+            result, *_ = await pipe.execute()
 
         logger.debug(f"Deleted session: {session_id}, success: {result > 0}")
         return result > 0
@@ -112,44 +463,83 @@ class RedisSessionStore(SessionStore):
         """Check if session exists"""
         client = await self._ensure_connected()
 
-        key = self._key(session_id)
-        return await client.exists(key) > 0
+        async with self._timed("exists"):
+            return await client.exists(self._key(session_id)) > 0
+
+    async def _list_ids(self, client: redis.Redis, limit: int, offset: int) -> list[tuple[str, str]]:
+        """
+        List (session_id, header JSON) pairs newest first.
+
+        Index entries whose keys have expired are pruned as they are found.
+        """
+        results: list[tuple[str, str]] = []
+        start = offset
+        while len(results) < limit:
+            ids = await client.zrevrange(self.INDEX_KEY, start, start + limit - len(results) - 1)
+            if not ids:
+                break
+
+            values = await client.mget([self._header_key(sid) for sid in ids])
+            stale = [sid for sid, value in zip(ids, values) if value is None]
+            results.extend((sid, value) for sid, value in zip(ids, values) if value is not None)
+
+            if stale:
+                # Expiry entries stay for cleanup_expired to report their files
+                await client.zrem(self.INDEX_KEY, *stale)
+            start += len(ids) - len(stale)
+
+        return results
 
     async def list_sessions(self, limit: int = 100, offset: int = 0) -> list[Session]:
-        """List sessions with pagination"""
+        """List sessions with pagination (newest first)"""
         client = await self._ensure_connected()
 
-        # Get all session keys
-        pattern = f"{self.KEY_PREFIX}*"
-        keys = []
-        async for key in client.scan_iter(match=pattern, count=100):
-            keys.append(key)
+        async with self._timed("list"):
+            ids = [sid for sid, _ in await self._list_ids(client, limit, offset)]
+            if not ids:
+                return []
+            values = await client.mget([self._key(sid) for sid in ids])
+        return [Session.from_dict(json.loads(data)) for data in values if data]
 
-        # Sort and paginate
-        keys.sort(reverse=True)
-        paginated_keys = keys[offset : offset + limit]
-
-        # Get sessions
-        sessions = []
-        for key in paginated_keys:
-            data = await client.get(key)
-            if data:
-                sessions.append(Session.from_dict(json.loads(data)))
+    async def list_headers(self, limit: int = 100, offset: int = 0) -> list[SessionHeader]:
+        """List session metadata with pagination (newest first)"""
+        client = await self._ensure_connected()
 
-        return sessions
+        async with self._timed("list_headers"):
+            records = await self._list_ids(client, limit, offset)
+        return [SessionHeader.from_dict(json.loads(data)) for _, data in records]
 
     async def close(self) -> None:
         """Close Redis connection"""
         if self._client:
             await self._client.close()
+            await self._pool.disconnect()
             self._client = None
+            self._pool = None
             logger.info("Redis connection closed")
 
+    def stats(self) -> dict[str, Any]:
+        """Rolling operation latency percentiles (ms), pool counts and connection errors"""
+        return {
+            "latency_ms": {
+                name: round(seconds * 1000, 3)
+                for name, seconds in self._latency.percentiles(50, 95, 99).items()
+            },
+            "samples": len(self._latency),
+            "pool": self._pool.stats() if self._pool else None,
+            "connection_errors": self._connection_errors,
+        }
+
     async def health_check(self) -> dict:
-        """Check Redis health"""
+        """Check Redis health with ping round-trip time and operation statistics"""
         try:
             client = await self._ensure_connected()
+            started = time.perf_counter()
             await client.ping()
-            return {"status": "healthy", "latency_ms": 0}
+            return {
+                "status": "healthy",
+                "latency_ms": round((time.perf_counter() - started) * 1000, 3),
+                "details": self.stats(),
+            }
         except Exception as e:
-            return {"status": "unhealthy", "error": str(e)}
+            return {"status": "unhealthy", "error": str(e), "details": self.stats()}
@@ -1,4 +1,5 @@
 """FastAPI application entry point"""
+import asyncio
 import logging
 import re
 from contextlib import asynccontextmanager
@@ -7,13 +8,30 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from llm_mcp_hub.core.config import get_settings
+from llm_mcp_hub.core.config import Settings, get_settings
 from llm_mcp_hub.core.exceptions import LLMHubError
 from llm_mcp_hub.infrastructure.session import MemorySessionStore, RedisSessionStore
+from llm_mcp_hub.infrastructure.blob import BlobStore, FileBlobStore, MemoryBlobStore, RedisBlobStore
 from llm_mcp_hub.infrastructure.providers import ClaudeAdapter, GeminiAdapter
-from llm_mcp_hub.services import ChatService, SessionService, MemoryService
+from llm_mcp_hub.services import (
+    AdmissionController,
+    BulkExporter,
+    ChatService,
+    HealthMonitor,
+    MemoryReplayLog,
+    MemoryService,
+    RedisReplayLog,
+    RedisRequestRegistry,
+    ReplayLog,
+    RequestRegistry,
+    SessionService,
+)
+from llm_mcp_hub.services.memory import CompressionLevel
+from llm_mcp_hub.api.compression import CompressionMiddleware
+from llm_mcp_hub.api.timing import TimingMiddleware, access_logger
 from llm_mcp_hub.api.v1 import router as api_v1_router
 from llm_mcp_hub.api.v1.health import router as health_router
+from llm_mcp_hub.api.v1.metrics import router as metrics_router
 
 # Configure logging
 logging.basicConfig(
@@ -42,6 +60,21 @@ class TokenMaskingFilter(logging.Filter):
 # Add token masking filter to root logger
 logging.getLogger().addFilter(TokenMaskingFilter())
 
+# Access log lines are JSON documents on their own
+_access_handler = logging.StreamHandler()
+_access_handler.setFormatter(logging.Formatter("%(message)s"))
+access_logger.addHandler(_access_handler)
+access_logger.propagate = False
+
+
+def _create_memory_store(settings: Settings) -> MemorySessionStore:
+    """Create in-memory session store with configured limits"""
+    return MemorySessionStore(
+        ttl=settings.session_ttl,
+        max_sessions=settings.session_max_count,
+        max_message_bytes=settings.session_max_message_bytes,
+    )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -58,15 +91,31 @@ async def lifespan(app: FastAPI):
         session_store = RedisSessionStore(
             redis_url=settings.redis_url,
             ttl=settings.session_ttl,
+            max_connections=settings.redis_max_connections,
+            pool_timeout=settings.redis_pool_timeout,
+            socket_timeout=settings.redis_socket_timeout,
+            connect_timeout=settings.redis_connect_timeout,
         )
         try:
             await session_store.connect()
         except Exception as e:
             logger.warning(f"Redis connection failed, using memory store: {e}")
-            session_store = MemorySessionStore(ttl=settings.session_ttl)
+            session_store = _create_memory_store(settings)
     else:
         logger.info("Using in-memory session store")
-        session_store = MemorySessionStore(ttl=settings.session_ttl)
+        session_store = _create_memory_store(settings)
+
+    # Initialize blob store for reference files
+    blob_store: BlobStore
+    if settings.blob_store_path:
+        logger.info(f"Using file blob store: {settings.blob_store_path}")
+        blob_store = FileBlobStore(settings.blob_store_path)
+    elif isinstance(session_store, RedisSessionStore):
+        logger.info("Using Redis blob store")
+        blob_store = RedisBlobStore(redis_url=settings.redis_url, ttl=settings.blob_ttl)
+    else:
+        logger.info("Using in-memory blob store")
+        blob_store = MemoryBlobStore()
 
     # Initialize providers
     providers = {}
@@ -111,25 +160,97 @@ async def lifespan(app: FastAPI):
         session_store=session_store,
         providers=providers,
         default_ttl=settings.session_ttl,
+        blob_store=blob_store,
+        max_context_bytes=settings.session_max_context_bytes,
+    )
+
+    # Release reference files of sessions that expire or are evicted
+    session_store.set_removal_listener(session_service.on_session_removed)
+    session_store.start_cleanup_task(settings.session_cleanup_interval)
+
+    admission = AdmissionController(
+        max_concurrency=settings.provider_max_concurrency,
+        reserve=settings.provider_low_priority_reserve,
+        low_priority_concurrency=settings.provider_low_priority_concurrency,
     )
 
+    # In-flight request registry, shared across replicas when sessions live in Redis
+    request_registry: RequestRegistry
+    if isinstance(session_store, RedisSessionStore):
+        request_registry = RedisRequestRegistry(redis_url=settings.redis_url)
+        try:
+            await request_registry.start()
+        except Exception as e:
+            logger.warning(f"Redis request registry unavailable, cancellation is per replica: {e}")
+            await request_registry.close()
+            request_registry = RequestRegistry()
+    else:
+        request_registry = RequestRegistry()
+
+    # Replay log for resumable streams, readable from any replica when in Redis
+    replay_log: ReplayLog
+    if isinstance(session_store, RedisSessionStore):
+        replay_log = RedisReplayLog(
+            redis_url=settings.redis_url,
+            max_events=settings.stream_replay_max_events,
+            ttl=settings.stream_replay_ttl,
+        )
+        try:
+            await replay_log.connect()
+        except Exception as e:
+            logger.warning(f"Redis replay log unavailable, streams resume on the same replica only: {e}")
+            await replay_log.close()
+            replay_log = MemoryReplayLog(settings.stream_replay_max_events, settings.stream_replay_ttl)
+    else:
+        replay_log = MemoryReplayLog(settings.stream_replay_max_events, settings.stream_replay_ttl)
+
     chat_service = ChatService(
         providers=providers,
         session_service=session_service,
+        admission=admission,
     )
 
     memory_service = MemoryService(
         session_service=session_service,
         chat_service=chat_service,
+        timeout=settings.memory_summary_timeout,
+        chunk_tokens=settings.memory_chunk_tokens,
+        max_parallel_chunks=settings.memory_max_parallel_chunks,
+        chunk_cache_size=settings.memory_chunk_cache_size,
     )
 
+    bulk_exporter = BulkExporter(session_service=session_service, memory_service=memory_service)
+
+    health_monitor = HealthMonitor(
+        session_store=session_store,
+        providers=providers,
+        interval=settings.health_check_interval,
+        timeout=settings.health_check_timeout,
+    )
+    health_monitor.start()
+
+    if settings.memory_precompute_idle is not None:
+        memory_service.start_precompute_task(
+            interval=settings.memory_precompute_interval,
+            idle_seconds=settings.memory_precompute_idle,
+            compression=CompressionLevel(settings.memory_precompute_compression),
+            provider=settings.memory_precompute_provider,
+        )
+
     # Store in app state for dependency injection
     app.state.settings = settings
     app.state.session_store = session_store
+    app.state.blob_store = blob_store
     app.state.providers = providers
+    app.state.admission = admission
+    app.state.request_registry = request_registry
+    app.state.replay_log = replay_log
+    app.state.stream_recorders = set()
     app.state.session_service = session_service
     app.state.chat_service = chat_service
     app.state.memory_service = memory_service
+    app.state.bulk_exporter = bulk_exporter
+    app.state.health_monitor = health_monitor
 
     logger.info("LLM MCP Hub started successfully")
     logger.info(f"Available providers: {list(providers.keys())}")
@@ -139,8 +260,21 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down LLM MCP Hub...")
 
-    # Close session store
+    # Stop resumable stream producers before the registry and replay log they write to
+    recorders: set[asyncio.Task] = app.state.stream_recorders
+    for task in recorders:
+        task.cancel()
+    await asyncio.gather(*recorders, return_exceptions=True)
+
+    await health_monitor.close()
+    await memory_service.stop_precompute_task()
+    await request_registry.close()
+    await replay_log.close()
+
+    # Stop expiry sweeper and close session store
+    await session_store.stop_cleanup_task()
     await session_store.close()
+    await blob_store.close()
 
     logger.info("LLM MCP Hub shutdown complete")
 
@@ -168,9 +302,26 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_min_size,
+            cpu_budget=settings.compression_cpu_budget,
+            compress_streams=settings.compression_streams,
+        )
+
+    # Outermost, so total and first byte include compression
+    if settings.server_timing_enabled or settings.access_log_enabled:
+        app.add_middleware(
+            TimingMiddleware,
+            server_timing=settings.server_timing_enabled,
+            access_log=settings.access_log_enabled,
+        )
+
     # Include routers
     app.include_router(api_v1_router)
     app.include_router(health_router)
+    app.include_router(metrics_router)
 
     # Global exception handler for LLMHubError
     @app.exception_handler(LLMHubError)
@@ -183,6 +334,10 @@ def create_app() -> FastAPI:
             "PROVIDER_ERROR": 502,
             "PROVIDER_TIMEOUT": 504,
             "TOKEN_EXPIRED": 401,
+            "CONTEXT_QUOTA_EXCEEDED": 413,
+            "REQUEST_CANCELLED": 409,
+            "REQUEST_ID_IN_USE": 409,
+            "STREAM_NOT_RESUMABLE": 410,
         }
         status_code = status_map.get(exc.code, 500)
         return JSONResponse(
@@ -1,10 +1,27 @@
 """Business services"""
-from .chat import ChatService
+from .admission import AdmissionController
+from .chat import ChatService, Conversation
 from .session import SessionService
 from .memory import MemoryService
+from .export import BulkExporter, ExportFilter
+from .requests import InFlightRequest, RedisRequestRegistry, RequestRegistry
+from .replay import MemoryReplayLog, RedisReplayLog, ReplayLog
+from .health import ComponentStatus, HealthMonitor
 
 __all__ = [
+    "AdmissionController",
     "ChatService",
+    "Conversation",
     "SessionService",
     "MemoryService",
+    "BulkExporter",
+    "ExportFilter",
+    "InFlightRequest",
+    "RequestRegistry",
+    "RedisRequestRegistry",
+    "ReplayLog",
+    "MemoryReplayLog",
+    "RedisReplayLog",
+    "ComponentStatus",
+    "HealthMonitor",
 ]
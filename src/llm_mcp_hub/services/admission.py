@@ -0,0 +1,124 @@
+"""Admission control for provider CLI processes"""
+import asyncio
+import logging
+import math
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+
+class _ProviderSlots:
+    """Slot accounting and FIFO waiters for one provider"""
+
+    def __init__(self, limit: float, low_priority_limit: int):
+        self.limit = limit
+        self.low_priority_limit = low_priority_limit
+        self.in_use = 0
+        self.waiters: deque[asyncio.Future] = deque()
+        self.low_priority_waiters: deque[asyncio.Future] = deque()
+
+
+class AdmissionController:
+    """
+    Per-provider limit on concurrently running provider calls.
+
+    Every provider call spawns a CLI process, so unbounded concurrency
+    exhausts CPU and subscription rate limits. Callers wait in FIFO order
+    for a slot. Low priority callers (background work) only get a slot
+    while no regular caller is waiting, and always leave `reserve` slots
+    free for regular traffic.
+
+    Regular calls are not limited unless max_concurrency (or a per-provider
+    limit) is set. Low priority calls then only run while fewer than
+    low_priority_concurrency calls are in flight.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        limits: dict[str, int] | None = None,
+        reserve: int = 1,
+        low_priority_concurrency: int = 2,
+    ):
+        self._default_limit = max_concurrency
+        self._limits = limits or {}
+        self._reserve = reserve
+        self._low_priority_concurrency = low_priority_concurrency
+        self._slots: dict[str, _ProviderSlots] = {}
+
+    def _get(self, provider: str) -> _ProviderSlots:
+        slots = self._slots.get(provider)
+        if slots is None:
+            limit = self._limits.get(provider, self._default_limit)
+            if limit is None:
+                slots = _ProviderSlots(math.inf, self._low_priority_concurrency)
+            else:
+                slots = _ProviderSlots(limit, max(limit - self._reserve, 1))
+            self._slots[provider] = slots
+        return slots
+
+    def in_flight(self, provider: str) -> int:
+        """Number of calls currently holding a slot"""
+        return self._get(provider).in_use
+
+    def waiting(self, provider: str) -> int:
+        """Number of calls waiting for a slot"""
+        slots = self._get(provider)
+        return len(slots.waiters) + len(slots.low_priority_waiters)
+
+    async def acquire(self, provider: str, low_priority: bool = False) -> None:
+        """Wait for a slot"""
+        slots = self._get(provider)
+        if low_priority:
+            if slots.in_use < slots.low_priority_limit and not slots.waiters and not slots.low_priority_waiters:
+                slots.in_use += 1
+                return
+            queue = slots.low_priority_waiters
+        else:
+            if slots.in_use < slots.limit and not slots.waiters:
+                slots.in_use += 1
+                return
+            queue = slots.waiters
+
+        future = asyncio.get_running_loop().create_future()
+        queue.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted just before cancellation; give it back
+                self.release(provider)
+            else:
+                queue.remove(future)
+            raise
+
+    def release(self, provider: str) -> None:
+        """Return a slot and grant free slots to waiters"""
+        slots = self._get(provider)
+        slots.in_use -= 1
+        self._grant(slots)
+
+    @staticmethod
+    def _grant(slots: _ProviderSlots) -> None:
+        """Hand free slots to waiters, regular callers first"""
+        while slots.waiters and slots.in_use < slots.limit:
+            future = slots.waiters.popleft()
+            if not future.done():
+                slots.in_use += 1
+                future.set_result(None)
+        while slots.low_priority_waiters and not slots.waiters and slots.in_use < slots.low_priority_limit:
+            future = slots.low_priority_waiters.popleft()
+            if not future.done():
+                slots.in_use += 1
+                future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, provider: str, low_priority: bool = False) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block"""
+        await self.acquire(provider, low_priority)
+        try:
+            yield
+        finally:
+            self.release(provider)
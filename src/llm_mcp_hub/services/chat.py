@@ -1,14 +1,72 @@
 """Chat service for handling LLM conversations"""
+import asyncio
 import logging
-from typing import AsyncIterator, Any
-
-from llm_mcp_hub.core.exceptions import ProviderError
+import time
+from contextlib import aclosing, asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Any, Iterator
+
+from llm_mcp_hub.core.exceptions import InvalidModelError, LLMHubError, ProviderError
+from llm_mcp_hub.core.metrics import REGISTRY
+from llm_mcp_hub.core.timing import FIRST_BYTE, QUEUE_WAIT, SESSION_LOAD, mark, record, tag, timed
 from llm_mcp_hub.domain import Session, Message
 from llm_mcp_hub.infrastructure.providers import ProviderAdapter
+from .admission import AdmissionController
 from .session import SessionService
 
 logger = logging.getLogger(__name__)
 
+_CHAT_SECONDS = REGISTRY.histogram(
+    "llm_hub_chat_duration_seconds",
+    "End-to-end latency of non-streaming chat calls",
+    ("provider", "model"),
+)
+_STREAM_SECONDS = REGISTRY.histogram(
+    "llm_hub_stream_duration_seconds",
+    "Duration of streamed chat turns, including aborted ones",
+    ("provider", "model"),
+)
+_FIRST_TOKEN_SECONDS = REGISTRY.histogram(
+    "llm_hub_time_to_first_token_seconds",
+    "Time from request start to the first streamed content",
+    ("provider", "model"),
+)
+_ADMISSION_WAIT_SECONDS = REGISTRY.histogram(
+    "llm_hub_admission_wait_seconds",
+    "Time spent waiting for a provider slot",
+    ("provider", "model"),
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+_ERRORS = REGISTRY.counter(
+    "llm_hub_errors_total",
+    "Failed chat calls by error code",
+    ("code",),
+)
+
+
+@contextmanager
+def _counting_errors() -> Iterator[None]:
+    """Count errors raised in the block by error code"""
+    try:
+        yield
+    except LLMHubError as e:
+        _ERRORS.labels(e.code).inc()
+        raise
+    except Exception:
+        _ERRORS.labels("INTERNAL_ERROR").inc()
+        raise
+
+
+@dataclass(slots=True)
+class Conversation:
+    """Session, adapter and model resolved once and reused for every turn"""
+
+    session: Session
+    adapter: ProviderAdapter
+    provider: str
+    model: str
+    system_prompt: str | None = None
+
 
 class ChatService:
     """Chat service for handling LLM conversations"""
@@ -17,9 +75,51 @@ class ChatService:
         self,
         providers: dict[str, ProviderAdapter],
         session_service: SessionService,
+        admission: AdmissionController | None = None,
     ):
         self._providers = providers
         self._session_service = session_service
+        self._admission = admission or AdmissionController()
+
+    async def _resolve(
+        self,
+        provider: str | None,
+        model: str | None,
+        session_id: str | None,
+        system_prompt: str | None,
+    ) -> tuple[Session | None, str, str, str | None]:
+        """Resolve session, provider, model and system prompt for a request"""
+        session = None
+        with timed(SESSION_LOAD):
+            header = await self._session_service.get_session_header_or_none(session_id)
+
+            if header:
+                # Validate against the header before loading messages
+                self._session_service.validate_provider_match(header, provider)
+                effective_model = self._session_service.validate_model(header, model)
+                session = await self._session_service.get_session_or_none(header.id)
+
+            if session:
+                # Get system prompt from session (reference files are fetched lazily)
+                await self._session_service.resolve_context(session)
+
+        if session:
+            effective_system_prompt = session._build_system_prompt() or system_prompt
+            return session, session.provider, effective_model, effective_system_prompt
+
+        # No session - use provided values
+        effective_provider = provider or "claude"
+        if effective_provider not in self._providers:
+            raise ProviderError(f"Unknown provider: {effective_provider}")
+
+        adapter = self._providers[effective_provider]
+        effective_model = adapter.resolve_model(model)
+        # Reject unknown models here, before they are used as metric labels
+        if not adapter.is_model_supported(effective_model):
+            raise InvalidModelError(
+                effective_model, provider=effective_provider, supported_models=adapter.supported_models
+            )
+        return None, effective_provider, effective_model, system_prompt
 
     async def chat(
         self,
@@ -29,61 +129,52 @@ class ChatService:
         session_id: str | None = None,
         system_prompt: str | None = None,
         timeout: float = 120.0,
+        low_priority: bool = False,
     ) -> dict[str, Any]:
         """
         Send chat request and get response.
 
+        Low priority requests (background work) only run on spare provider
+        capacity.
+
         Returns dict with:
         - response: str - The LLM response
         - session_id: str | None - Session ID if session was used
         - provider: str - Provider used
         - model: str - Model used
         """
-        # Get or create context
-        session = await self._session_service.get_session_or_none(session_id)
-
-        if session:
-            # Validate provider match
-            self._session_service.validate_provider_match(session, provider)
-
-            # Resolve model
-            effective_model = self._session_service.validate_model(session, model)
-            effective_provider = session.provider
-
-            # Get system prompt from session
-            effective_system_prompt = session._build_system_prompt() or system_prompt
-        else:
-            # No session - use provided values
-            effective_provider = provider or "claude"
-            if effective_provider not in self._providers:
-                raise ProviderError(f"Unknown provider: {effective_provider}")
-
+        started = time.perf_counter()
+        with _counting_errors():
+            # Get or create context
+            session, effective_provider, effective_model, effective_system_prompt = await self._resolve(
+                provider, model, session_id, system_prompt
+            )
+
+            # Get adapter
             adapter = self._providers[effective_provider]
-            effective_model = adapter.resolve_model(model)
-            effective_system_prompt = system_prompt
+            tag(provider=effective_provider, model=effective_model)
 
-        # Get adapter
-        adapter = self._providers[effective_provider]
+            # Add user message to session
+            if session:
+                session.add_user_message(prompt)
 
-        # Add user message to session
-        if session:
-            session.add_user_message(prompt)
-
-        # Send request
-        logger.info(f"Chat request: provider={effective_provider}, model={effective_model}")
+            # Send request
+            logger.info(f"Chat request: provider={effective_provider}, model={effective_model}")
 
-        response = await adapter.chat(
-            prompt=prompt,
-            model=effective_model,
-            system_prompt=effective_system_prompt,
-            timeout=timeout,
-        )
+            async with self._slot(effective_provider, effective_model, low_priority):
+                response = await adapter.chat(
+                    prompt=prompt,
+                    model=effective_model,
+                    system_prompt=effective_system_prompt,
+                    timeout=timeout,
+                )
 
-        # Add assistant response to session
-        if session:
-            session.add_assistant_message(response)
-            await self._session_service.update_session(session)
+            # Add assistant response to session
+            if session:
+                session.add_assistant_message(response)
+                await self._session_service.update_session(session)
 
+        _CHAT_SECONDS.labels(effective_provider, effective_model).observe(time.perf_counter() - started)
         return {
             "response": response,
             "session_id": session.id if session else None,
@@ -102,6 +193,10 @@ class ChatService:
         """
         Stream chat response.
 
+        If the stream is closed or cancelled before it finishes, the provider
+        call is stopped and the partial answer is stored with aborted=True
+        metadata.
+
         Yields dicts with:
         - type: str - Event type (content, done)
         - text: str - Content text (for content events)
@@ -109,53 +204,148 @@ class ChatService:
         - provider: str - Provider used
         - model: str - Model used
         """
-        # Get or create context
-        session = await self._session_service.get_session_or_none(session_id)
-
-        if session:
-            self._session_service.validate_provider_match(session, provider)
-            effective_model = self._session_service.validate_model(session, model)
-            effective_provider = session.provider
-            effective_system_prompt = session._build_system_prompt() or system_prompt
-        else:
-            effective_provider = provider or "claude"
-            if effective_provider not in self._providers:
-                raise ProviderError(f"Unknown provider: {effective_provider}")
+        started = time.perf_counter()
+        with _counting_errors():
+            # Get or create context
+            session, effective_provider, effective_model, effective_system_prompt = await self._resolve(
+                provider, model, session_id, system_prompt
+            )
 
             adapter = self._providers[effective_provider]
-            effective_model = adapter.resolve_model(model)
-            effective_system_prompt = system_prompt
+            async with aclosing(self._stream(
+                session, adapter, effective_provider, effective_model, effective_system_prompt, prompt, started
+            )) as events:
+                async for event in events:
+                    yield event
 
-        adapter = self._providers[effective_provider]
+    async def open_conversation(
+        self,
+        session_id: str,
+        provider: str | None = None,
+        model: str | None = None,
+    ) -> Conversation:
+        """Resolve a session once for a long-lived connection"""
+        header = await self._session_service.get_session_header(session_id)
+        self._session_service.validate_provider_match(header, provider)
+        effective_model = self._session_service.validate_model(header, model)
+
+        adapter = self._providers.get(header.provider)
+        if adapter is None:
+            raise ProviderError(f"Unknown provider: {header.provider}")
+
+        session = await self._session_service.get_session(header.id)
+        await self._session_service.resolve_context(session)
+        return Conversation(
+            session=session,
+            adapter=adapter,
+            provider=session.provider,
+            model=effective_model,
+            system_prompt=session._build_system_prompt(),
+        )
 
+    async def stream_conversation(self, conversation: Conversation, prompt: str) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream one turn of an open conversation.
+
+        Same events and abort handling as chat_stream. Only the session
+        header is checked per turn; the session is reloaded when it was
+        written elsewhere since the conversation last saw it.
+        """
+        started = time.perf_counter()
+        with _counting_errors():
+            await self._refresh(conversation)
+
+            async with aclosing(self._stream(
+                conversation.session, conversation.adapter, conversation.provider, conversation.model,
+                conversation.system_prompt, prompt, started,
+            )) as events:
+                async for event in events:
+                    yield event
+
+    async def _refresh(self, conversation: Conversation) -> None:
+        """
+        Re-check a held session before a turn.
+
+        Raises if the session was deleted, closed or expired meanwhile, so
+        the turn does not write it back. A changed revision means another
+        writer (REST chat, file upload, summary) stored it; reload it so
+        that the turn does not overwrite those changes.
+        """
+        header = await self._session_service.get_session_header(conversation.session.id)
+        if header.revision == conversation.session.revision:
+            return
+        session = await self._session_service.get_session(header.id)
+        await self._session_service.resolve_context(session)
+        conversation.session = session
+        conversation.system_prompt = session._build_system_prompt()
+
+    @asynccontextmanager
+    async def _slot(self, provider: str, model: str, low_priority: bool = False) -> AsyncIterator[None]:
+        """Hold an admission slot, recording the wait for it"""
+        started = time.perf_counter()
+        async with self._admission.slot(provider, low_priority):
+            waited = time.perf_counter() - started
+            _ADMISSION_WAIT_SECONDS.labels(provider, model).observe(waited)
+            record(QUEUE_WAIT, waited)
+            yield
+
+    async def _stream(
+        self,
+        session: Session | None,
+        adapter: ProviderAdapter,
+        effective_provider: str,
+        effective_model: str,
+        effective_system_prompt: str | None,
+        prompt: str,
+        started: float,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream a turn and record it in the session; started is the request start (perf_counter)"""
         # Add user message to session
         if session:
             session.add_user_message(prompt)
 
         logger.info(f"Chat stream: provider={effective_provider}, model={effective_model}")
+        tag(provider=effective_provider, model=effective_model)
 
         # Collect full response for session
         full_response = []
 
-        async for chunk in adapter.chat_stream(
-            prompt=prompt,
-            model=effective_model,
-            system_prompt=effective_system_prompt,
-        ):
-            full_response.append(chunk)
-            yield {
-                "type": "content",
-                "text": chunk,
-                "session_id": session.id if session else None,
-                "provider": effective_provider,
-                "model": effective_model,
-            }
+        try:
+            async with self._slot(effective_provider, effective_model):
+                async with aclosing(adapter.chat_stream(
+                    prompt=prompt,
+                    model=effective_model,
+                    system_prompt=effective_system_prompt,
+                )) as chunks:
+                    async for chunk in chunks:
+                        if not full_response:
+                            _FIRST_TOKEN_SECONDS.labels(effective_provider, effective_model).observe(
+                                time.perf_counter() - started
+                            )
+                            mark(FIRST_BYTE)
+                        full_response.append(chunk)
+                        yield {
+                            "type": "content",
+                            "text": chunk,
+                            "session_id": session.id if session else None,
+                            "provider": effective_provider,
+                            "model": effective_model,
+                        }
+        except (asyncio.CancelledError, GeneratorExit):
+            # Consumer went away (e.g. client disconnect): keep the partial answer, marked aborted
+            if session:
+                session.add_assistant_message("".join(full_response), aborted=True)
+                await self._session_service.update_session(session)
+            logger.info(f"Chat stream aborted: provider={effective_provider}, model={effective_model}")
+            _STREAM_SECONDS.labels(effective_provider, effective_model).observe(time.perf_counter() - started)
+            raise
 
         # Add assistant response to session
         if session:
             session.add_assistant_message("".join(full_response))
             await self._session_service.update_session(session)
 
+        _STREAM_SECONDS.labels(effective_provider, effective_model).observe(time.perf_counter() - started)
         yield {
             "type": "done",
             "session_id": session.id if session else None,
@@ -176,17 +366,17 @@ class ChatService:
 
         Messages format: [{"role": "user", "content": "..."}, ...]
         """
-        # Extract the last user message as the prompt
-        user_messages = [m for m in messages if m.get("role") == "user"]
-        if not user_messages:
+        # Last user message is the prompt, first system message the system prompt
+        prompt = system_prompt = None
+        for m in messages:
+            role = m.get("role")
+            if role == "user":
+                prompt = m["content"]
+            elif role == "system" and system_prompt is None:
+                system_prompt = m["content"]
+        if prompt is None:
             raise ValueError("No user message found in messages")
 
-        prompt = user_messages[-1]["content"]
-
-        # Extract system prompt if present
-        system_messages = [m for m in messages if m.get("role") == "system"]
-        system_prompt = system_messages[0]["content"] if system_messages else None
-
         return await self.chat(
             prompt=prompt,
             provider=provider,
@@ -0,0 +1,268 @@
+"""Bulk memory export across many sessions"""
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from llm_mcp_hub.domain import Session, SessionHeader, SessionStatus
+from .memory import CompressionLevel, MemoryService
+from .session import SessionService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, kw_only=True)
+class ExportFilter:
+    """Selects sessions for a bulk export; unset fields match everything"""
+
+    session_ids: list[str] | None = None
+    provider: str | None = None
+    model: str | None = None
+    status: SessionStatus | None = None
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+    idle_seconds: float | None = None
+    min_messages: int = 1
+
+    def matches(self, header: SessionHeader, now: datetime) -> bool:
+        """Check whether a session header passes the filter"""
+        if self.session_ids is not None and header.id not in self.session_ids:
+            return False
+        if self.provider and header.provider != self.provider:
+            return False
+        if self.model and header.model != self.model:
+            return False
+        if self.status and header.status != self.status:
+            return False
+        if self.created_after and header.created_at < self.created_after:
+            return False
+        if self.created_before and header.created_at >= self.created_before:
+            return False
+        if self.idle_seconds is not None and header.updated_at > now - timedelta(seconds=self.idle_seconds):
+            return False
+        return header.message_count >= self.min_messages
+
+
+class BulkExporter:
+    """
+    Export memory for many sessions in one job.
+
+    Matching sessions are read from headers a page at a time and exported
+    by a fixed pool of workers (at low provider priority by default, so
+    interactive chats keep their capacity). Closed and expired sessions
+    still in the store are exported too. Sessions with identical
+    conversations (system prompt and message contents) are rendered once;
+    the others are reported as duplicates of the first once it finishes,
+    without holding a worker while they wait.
+
+    run() yields NDJSON-ready events: a start event, one session event per
+    session with its timing and progress, and a final done event with the
+    total and counts. When an output directory is given, each rendered
+    memory is written to <session_id>.md and every event is appended to
+    manifest.ndjson; otherwise content travels in the events.
+    """
+
+    PAGE_SIZE = 100
+
+    def __init__(self, session_service: SessionService, memory_service: MemoryService):
+        self._session_service = session_service
+        self._memory_service = memory_service
+
+    async def select(self, export_filter: ExportFilter) -> AsyncIterator[SessionHeader]:
+        """Yield headers of sessions matching the filter, whatever their status"""
+        now = datetime.utcnow()
+        if export_filter.session_ids is not None:
+            for sid in export_filter.session_ids:
+                header = await self._session_service.get_session_header_any_status(sid)
+                if header and export_filter.matches(header, now):
+                    yield header
+            return
+
+        offset = 0
+        while True:
+            headers = await self._session_service.list_session_headers(limit=self.PAGE_SIZE, offset=offset)
+            if not headers:
+                return
+            offset += len(headers)
+            for header in headers:
+                if export_filter.matches(header, now):
+                    yield header
+
+    async def run(
+        self,
+        export_filter: ExportFilter,
+        compression: CompressionLevel = CompressionLevel.MEDIUM,
+        provider: str = "claude",
+        concurrency: int = 4,
+        output_dir: Path | None = None,
+        low_priority: bool = True,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Run the export, yielding progress events"""
+        started = time.perf_counter()
+        if output_dir is not None:
+            await asyncio.to_thread(output_dir.mkdir, parents=True, exist_ok=True)
+        logger.info(f"Bulk export started: compression={compression.value}, concurrency={concurrency}")
+
+        start_event = {
+            "type": "start",
+            "compression": compression.value,
+            "output_dir": str(output_dir) if output_dir else None,
+        }
+        await self._record(output_dir, start_event)
+        yield start_event
+
+        headers = self.select(export_filter)
+        pull = asyncio.Lock()
+        # Conversation digest -> id of the first export, or the sessions
+        # waiting for it while it is rendered
+        seen: dict[str, str | list] = {}
+        # Bounded, so workers stop while the consumer is slow
+        results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+        counts = {"exported": 0, "duplicate": 0, "failed": 0}
+
+        async def work() -> None:
+            while True:
+                async with pull:
+                    header = await anext(headers, None)
+                if header is None:
+                    return
+                export = self._export_one(header, compression, provider, low_priority, output_dir, seen)
+                async with aclosing(export) as events:
+                    async for event in events:
+                        await results.put(event)
+
+        async def finish() -> None:
+            try:
+                await asyncio.gather(*workers)
+            except Exception as e:
+                await results.put(e)
+            else:
+                await results.put(None)
+
+        workers = [asyncio.create_task(work()) for _ in range(concurrency)]
+        finisher = asyncio.create_task(finish())
+        done = 0
+        try:
+            while (event := await results.get()) is not None:
+                if isinstance(event, Exception):
+                    raise event
+                done += 1
+                counts[event["status"]] += 1
+                event["done"] = done
+                await self._record(output_dir, event)
+                if done % 100 == 0:
+                    logger.info(f"Bulk export progress: {done} sessions")
+                yield event
+        finally:
+            for task in (*workers, finisher):
+                task.cancel()
+            await asyncio.gather(*workers, finisher, return_exceptions=True)
+            await headers.aclose()
+
+        done_event = {
+            "type": "done",
+            "total": done,
+            **counts,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        await self._record(output_dir, done_event)
+        logger.info(f"Bulk export finished: {counts}")
+        yield done_event
+
+    async def _export_one(
+        self,
+        header: SessionHeader,
+        compression: CompressionLevel,
+        provider: str,
+        low_priority: bool,
+        output_dir: Path | None,
+        seen: dict[str, str | list],
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Export one session, then report the identical sessions that waited for it"""
+        started = time.perf_counter()
+        event: dict[str, Any] = {"type": "session", "session_id": header.id}
+        try:
+            session = await self._session_service.get_session_any_status(header.id)
+            digest = event["digest"] = self.conversation_digest(session)
+        except Exception as e:
+            logger.error(f"Bulk export of session {header.id} failed: {e}")
+            yield self._finish(event, started, "failed", error=str(e))
+            return
+
+        original = seen.get(digest)
+        if isinstance(original, str):
+            yield self._finish(event, started, "duplicate", duplicate_of=original)
+            return
+        if original is not None:
+            # Reported by the worker rendering the identical conversation
+            original.append((event, started, session))
+            return
+
+        seen[digest] = waiting = []
+        while True:
+            try:
+                fields = await self._render(session, compression, provider, low_priority, output_dir)
+            except Exception as e:
+                logger.error(f"Bulk export of session {session.id} failed: {e}")
+                yield self._finish(event, started, "failed", error=str(e))
+                if not waiting:
+                    del seen[digest]
+                    return
+                # The first identical session takes over
+                event, started, session = waiting.pop(0)
+                continue
+
+            seen[digest] = session.id
+            yield self._finish(event, started, "exported", **fields)
+            for event, started, _ in waiting:
+                yield self._finish(event, started, "duplicate", duplicate_of=session.id)
+            return
+
+    async def _render(
+        self,
+        session: Session,
+        compression: CompressionLevel,
+        provider: str,
+        low_priority: bool,
+        output_dir: Path | None,
+    ) -> dict[str, Any]:
+        """Render a session's memory, return the fields for its event"""
+        content = await self._memory_service.render_memory(session, compression, provider, low_priority)
+        if output_dir is None:
+            return {"content": content}
+        path = output_dir / f"{session.id}.md"
+        await asyncio.to_thread(path.write_text, content, encoding="utf-8")
+        return {"path": str(path)}
+
+    @staticmethod
+    def _finish(event: dict[str, Any], started: float, status: str, **fields) -> dict[str, Any]:
+        """Complete a session event with its status and duration"""
+        event.update(status=status, duration_ms=round((time.perf_counter() - started) * 1000, 1), **fields)
+        return event
+
+    @staticmethod
+    def conversation_digest(session: Session) -> str:
+        """Hash of system prompt and message roles and contents"""
+        digest = hashlib.sha256((session.system_prompt or "").encode("utf-8"))
+        for message in session.messages:
+            digest.update(b"\0" + message.role.value.encode() + b"\0" + message.content.encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    async def _record(output_dir: Path | None, event: dict[str, Any]) -> None:
+        """Append event to the job manifest"""
+        if output_dir is None:
+            return
+        line = json.dumps(event) + "\n"
+
+        def append() -> None:
+            with open(output_dir / "manifest.ndjson", "a", encoding="utf-8") as f:
+                f.write(line)
+
+        await asyncio.to_thread(append)
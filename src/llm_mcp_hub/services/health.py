@@ -0,0 +1,133 @@
+"""Background health probing with cached component status"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from llm_mcp_hub.infrastructure.providers.base import ProviderAdapter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class ComponentStatus:
+    """Last probe result of one component"""
+
+    status: str
+    latency_ms: float | None = None
+    error: str | None = None
+    supported_models: list[str] | None = None
+    last_success: datetime | None = None
+    checked_at: datetime | None = None
+    # Component-specific statistics (e.g. Redis latency percentiles and pool counts)
+    details: dict[str, Any] | None = None
+
+
+class HealthMonitor:
+    """
+    Probe Redis and providers in the background and keep the last results.
+
+    All components are probed in parallel every interval seconds, each with
+    its own timeout. Health endpoints read the cached results, so a probe
+    hitting them every few seconds does not start CLI processes. Until the
+    first round finishes, the first reader runs it.
+    """
+
+    def __init__(
+        self,
+        session_store: Any,
+        providers: dict[str, ProviderAdapter],
+        interval: float = 30.0,
+        timeout: float = 10.0,
+    ):
+        self._session_store = session_store
+        self._providers = providers
+        self._interval = interval
+        self._timeout = timeout
+        self._components: dict[str, ComponentStatus] | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    def _checks(self) -> dict[str, Callable[[], Awaitable[dict]]]:
+        """Health check callables by component name"""
+        checks: dict[str, Callable[[], Awaitable[dict]]] = {}
+        if hasattr(self._session_store, "health_check"):
+            checks["redis"] = self._session_store.health_check
+        for name, adapter in self._providers.items():
+            checks[name] = adapter.health_check
+        return checks
+
+    async def _probe(self, name: str, check: Callable[[], Awaitable[dict]]) -> tuple[str, ComponentStatus]:
+        """Run one check with a timeout; failures become unhealthy status"""
+        started = time.perf_counter()
+        try:
+            health = await asyncio.wait_for(check(), self._timeout)
+        except asyncio.TimeoutError:
+            health = {"status": "unhealthy", "error": f"Health check timed out after {self._timeout}s"}
+        except Exception as e:
+            health = {"status": "unhealthy", "error": str(e)}
+        now = datetime.utcnow()
+
+        previous = self._components.get(name) if self._components else None
+        status = health.get("status", "unhealthy")
+        latency_ms = health.get("latency_ms")
+        if latency_ms is None:
+            latency_ms = round((time.perf_counter() - started) * 1000, 3)
+        return name, ComponentStatus(
+            status=status,
+            latency_ms=latency_ms,
+            error=health.get("error"),
+            supported_models=health.get("supported_models"),
+            details=health.get("details"),
+            last_success=now if status == "healthy" else (previous.last_success if previous else None),
+            checked_at=now,
+        )
+
+    async def _probe_all(self) -> dict[str, ComponentStatus]:
+        results = await asyncio.gather(*(self._probe(name, check) for name, check in self._checks().items()))
+        self._components = dict(results)
+        for name, component in self._components.items():
+            if component.status != "healthy":
+                logger.warning(f"Health check failed for {name}: {component.error}")
+        return self._components
+
+    async def probe(self) -> dict[str, ComponentStatus]:
+        """Probe all components in parallel and cache the results"""
+        async with self._lock:
+            return await self._probe_all()
+
+    async def components(self) -> dict[str, ComponentStatus]:
+        """Cached component status (probes once if nothing is cached yet)"""
+        if self._components is None:
+            async with self._lock:
+                if self._components is None:
+                    await self._probe_all()
+        return self._components
+
+    def start(self) -> None:
+        """Start background probing every interval seconds"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._probe_loop())
+
+    async def close(self) -> None:
+        """Stop background probing"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _probe_loop(self) -> None:
+        """Probe immediately, then every interval seconds"""
+        while True:
+            try:
+                await self.probe()
+            except Exception as e:
+                logger.error(f"Health probe failed: {e}")
+            await asyncio.sleep(self._interval)
+
@@ -1,10 +1,23 @@
 """Memory service for session export and compression"""
+import asyncio
+import hashlib
+import json
 import logging
-from datetime import datetime
+import math
+import re
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any
+from typing import Any, AsyncIterator
 
-from llm_mcp_hub.domain import Session
+try:
+    import numpy as np
+except ImportError:  # optional: pure-Python scoring is used instead
+    np = None
+
+from llm_mcp_hub.core.metrics import CACHE_LOOKUPS
+from llm_mcp_hub.domain import Message, Session, SessionHeader
 from .session import SessionService
 from .chat import ChatService
 
@@ -20,16 +33,280 @@ class CompressionLevel(str, Enum):
     HIGH = "high"  # Keywords only
 
 
+# Summarization prompts by compression level
+_PROMPTS = {
+    CompressionLevel.LOW: """Summarize this conversation, keeping important details and key messages:
+
+{conversation}
+
+Format as markdown with:
+- Brief summary
+- Key decisions or conclusions
+- Important quotes or statements""",
+    CompressionLevel.MEDIUM: """Create a concise summary of this conversation focusing on:
+1. Main topics discussed
+2. Decisions made
+3. Action items or next steps
+
+Conversation:
+{conversation}
+
+Format as markdown with clear sections.""",
+    CompressionLevel.HIGH: """Extract only the essential keywords and key points from this conversation:
+
+{conversation}
+
+Format as a brief bullet list of keywords and concepts only.""",
+}
+
+# Folds new messages into an existing summary
+_UPDATE_PROMPT = """Below is a summary of the earlier part of a conversation, followed by new messages.
+Produce an updated summary covering the whole conversation, in the same format as the existing summary.
+
+Existing summary:
+{summary}
+
+{instructions}"""
+
+# Map step for conversations too long for one prompt
+_CHUNK_PROMPT = """This is one part of a longer conversation. Summarize it, keeping topics, decisions,
+action items and important details so that it can later be merged with summaries of the other parts:
+
+{conversation}"""
+
+# Reduce step when the partial summaries themselves are too long
+_COMBINE_PROMPT = """These are summaries of consecutive parts of one conversation.
+Merge them into a single summary, keeping topics, decisions, action items and important details:
+
+{conversation}"""
+
+# Rough characters per token for chunk sizing
+_CHARS_PER_TOKEN = 4
+
+# Backoff before retrying a precomputed summary whose LLM call failed
+_PRECOMPUTE_RETRY_SECONDS = 300.0
+_PRECOMPUTE_RETRY_MAX_SECONDS = 6 * 3600.0
+
+_MARKDOWN_FOOTER = "\n\n---\n*Generated by LLM MCP Hub*"
+
+# Characters per chunk of streamed exports
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+_WORD_RE = re.compile(r"\w+")
+_STOPWORDS = frozenset(
+    """a about after all also am an and any are as at be because been but by can could did do does
+    for from get got had has have he her here him his how i if in into is it its just let like me
+    more my no not now of on one or our out please she should so some than that the their them then
+    there these they this those to too up us very was we well were what when where which while who
+    why will with would yes you your""".split()
+)
+
+# (key sentences, keywords) per compression level for extractive summaries
+_EXTRACTIVE_SIZES = {
+    CompressionLevel.LOW: (20, 15),
+    CompressionLevel.MEDIUM: (10, 15),
+    CompressionLevel.HIGH: (5, 20),
+}
+
+
+class ExtractiveSummarizer:
+    """
+    Local extractive summarizer (no LLM call).
+
+    Each sentence is treated as a document for TF-IDF. Sentences are scored
+    by cosine similarity to the conversation's TF-IDF centroid, the best
+    candidates are re-ranked with TextRank over their similarity graph, and
+    keywords are the terms with the highest total TF-IDF weight. Scoring is
+    vectorized with NumPy when installed and pure Python otherwise.
+    """
+
+    def __init__(self, candidates: int = 200, damping: float = 0.85, iterations: int = 30):
+        self._candidates = candidates
+        self._damping = damping
+        self._iterations = iterations
+
+    def summarize(
+        self,
+        messages: list[Message],
+        sentences: int = 10,
+        keywords: int = 15,
+    ) -> tuple[list[str], list[str]]:
+        """Return (key sentences in conversation order, keywords)"""
+        texts, bags = self._split(messages)
+        if not texts:
+            return [], []
+
+        # Vocabulary and document frequency over sentences
+        vocab: dict[str, int] = {}
+        rows: list[dict[int, int]] = []
+        for bag in bags:
+            rows.append({vocab.setdefault(term, len(vocab)): tf for term, tf in bag.items()})
+        terms = list(vocab)
+
+        if np is not None:
+            idf, weights, scores = self._score_numpy(rows, len(terms))
+        else:
+            idf, weights, scores = self._score_python(rows, len(terms))
+
+        top_terms = sorted(range(len(terms)), key=lambda t: -weights[t])[:keywords]
+        candidates = sorted(range(len(rows)), key=lambda i: -scores[i])[: self._candidates]
+        ranks = self._textrank([rows[i] for i in candidates], idf)
+        chosen = sorted(candidates[j] for j in sorted(range(len(candidates)), key=lambda j: -ranks[j])[:sentences])
+        return [texts[i] for i in chosen], [terms[t] for t in top_terms]
+
+    @staticmethod
+    def _split(messages: list[Message]) -> tuple[list[str], list[Counter]]:
+        """Split messages into unique sentences and their term counts"""
+        texts: list[str] = []
+        bags: list[Counter] = []
+        seen: set[str] = set()
+        for message in messages:
+            role = "User" if message.role.value == "user" else "Assistant"
+            for sentence in _SENTENCE_RE.split(message.content):
+                sentence = sentence.strip()
+                key = sentence.lower()
+                if not sentence or key in seen:
+                    continue
+                bag = Counter(w for w in _WORD_RE.findall(key) if len(w) > 1 and w not in _STOPWORDS)
+                if len(bag) < 2:
+                    continue
+                seen.add(key)
+                texts.append(f"{role}: {sentence}")
+                bags.append(bag)
+        return texts, bags
+
+    @staticmethod
+    def _score_numpy(rows: list[dict[int, int]], vocab_size: int):
+        """IDF, keyword weights and centroid scores, vectorized"""
+        lengths = np.fromiter((len(r) for r in rows), dtype=np.int64, count=len(rows))
+        sent = np.repeat(np.arange(len(rows)), lengths)
+        term = np.fromiter((t for r in rows for t in r), dtype=np.int64, count=int(lengths.sum()))
+        tf = np.fromiter((c for r in rows for c in r.values()), dtype=np.float64, count=len(term))
+
+        df = np.bincount(term, minlength=vocab_size)
+        idf = np.log((1 + len(rows)) / (1 + df)) + 1.0
+        values = tf * idf[term]
+        weights = np.bincount(term, weights=values, minlength=vocab_size)
+        norms = np.sqrt(np.bincount(sent, weights=values * values, minlength=len(rows)))
+        dots = np.bincount(sent, weights=values * weights[term], minlength=len(rows))
+        scores = dots / np.maximum(norms, 1e-12)
+        return idf.tolist(), weights.tolist(), scores.tolist()
+
+    @staticmethod
+    def _score_python(rows: list[dict[int, int]], vocab_size: int):
+        """IDF, keyword weights and centroid scores, pure Python"""
+        df = [0] * vocab_size
+        for row in rows:
+            for t in row:
+                df[t] += 1
+        idf = [math.log((1 + len(rows)) / (1 + d)) + 1.0 for d in df]
+        weights = [0.0] * vocab_size
+        for row in rows:
+            for t, tf in row.items():
+                weights[t] += tf * idf[t]
+        scores = []
+        for row in rows:
+            dot = norm = 0.0
+            for t, tf in row.items():
+                value = tf * idf[t]
+                dot += value * weights[t]
+                norm += value * value
+            scores.append(dot / max(math.sqrt(norm), 1e-12))
+        return idf, weights, scores
+
+    def _textrank(self, rows: list[dict[int, int]], idf: list[float]) -> list[float]:
+        """PageRank over the cosine similarity graph of sentences"""
+        n = len(rows)
+        if n <= 2:
+            return [1.0] * n
+
+        vectors = []
+        for row in rows:
+            vector = {t: tf * idf[t] for t, tf in row.items()}
+            norm = math.sqrt(sum(v * v for v in vector.values())) or 1.0
+            vectors.append({t: v / norm for t, v in vector.items()})
+
+        if np is not None:
+            columns: dict[int, int] = {}
+            matrix = np.zeros((n, sum(len(v) for v in vectors)))
+            for i, vector in enumerate(vectors):
+                for t, v in vector.items():
+                    matrix[i, columns.setdefault(t, len(columns))] = v
+            sim = matrix[:, : len(columns)] @ matrix[:, : len(columns)].T
+            np.fill_diagonal(sim, 0.0)
+            out = sim.sum(axis=1, keepdims=True)
+            transition = np.divide(sim, out, out=np.zeros_like(sim), where=out > 0)
+            rank = np.full(n, 1.0 / n)
+            for _ in range(self._iterations):
+                rank = (1 - self._damping) / n + self._damping * (transition.T @ rank)
+            return rank.tolist()
+
+        # Sparse similarity via an inverted index over terms
+        postings: dict[int, list[tuple[int, float]]] = {}
+        for i, vector in enumerate(vectors):
+            for t, v in vector.items():
+                postings.setdefault(t, []).append((i, v))
+        edges: list[dict[int, float]] = [{} for _ in range(n)]
+        for entries in postings.values():
+            for a, va in entries:
+                for b, vb in entries:
+                    if a != b:
+                        edges[a][b] = edges[a].get(b, 0.0) + va * vb
+        out = [sum(e.values()) for e in edges]
+        rank = [1.0 / n] * n
+        for _ in range(self._iterations):
+            incoming = [0.0] * n
+            for a, e in enumerate(edges):
+                if out[a]:
+                    share = rank[a] / out[a]
+                    for b, w in e.items():
+                        incoming[b] += share * w
+            rank = [(1 - self._damping) / n + self._damping * x for x in incoming]
+        return rank
+
+
 class MemoryService:
-    """Service for exporting and compressing session memory"""
+    """
+    Service for exporting and compressing session memory.
+
+    Conversations longer than one prompt budget are summarized map-reduce
+    style: the text is split into chunks on message boundaries, chunks are
+    summarized concurrently (bounded per export and by provider admission),
+    and the partial summaries are merged. Chunk summaries are cached by
+    content hash so re-exports only recompute chunks that changed.
+
+    High compression is served by the local extractive summarizer, which
+    is also the fallback when an LLM summary fails.
+
+    An optional background task summarizes idle sessions ahead of time at
+    low provider priority, so close/export usually find a current summary.
+    """
 
     def __init__(
         self,
         session_service: SessionService,
         chat_service: ChatService,
+        timeout: float = 120.0,
+        chunk_tokens: int = 8000,
+        max_parallel_chunks: int = 4,
+        chunk_cache_size: int = 1024,
     ):
         self._session_service = session_service
         self._chat_service = chat_service
+        self._timeout = timeout
+        self._chunk_chars = chunk_tokens * _CHARS_PER_TOKEN
+        self._max_parallel_chunks = max_parallel_chunks
+        self._chunk_cache_size = chunk_cache_size
+        # (provider, chunk sha256) -> summary, least recently used first
+        self._chunk_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._extractive = ExtractiveSummarizer()
+        # session_id -> message count covered by the last precomputed summary
+        self._precomputed: dict[str, int] = {}
+        # session_id -> (message count, failed attempts, retry at) for failed LLM summaries
+        self._precompute_failures: dict[str, tuple[int, int, float]] = {}
+        self._precompute_task: asyncio.Task | None = None
 
     async def export_memory(
         self,
@@ -49,11 +326,7 @@ class MemoryService:
         - metadata: dict - Session metadata
         """
         session = await self._session_service.get_session(session_id)
-
-        if compression == CompressionLevel.NONE:
-            content = self._format_full_conversation(session)
-        else:
-            content = await self._compress_conversation(session, compression, provider)
+        content = await self.render_memory(session, compression, provider)
 
         if format == "json":
             return {
@@ -82,95 +355,288 @@ class MemoryService:
             },
         }
 
+    async def render_memory(
+        self,
+        session: Session,
+        compression: CompressionLevel,
+        provider: str = "claude",
+        low_priority: bool = False,
+    ) -> str:
+        """Render memory of a loaded session at the given compression level"""
+        if compression == CompressionLevel.NONE:
+            return self._format_full_conversation(session)
+        return await self._compress_conversation(session, compression, provider, low_priority)
+
     def _format_full_conversation(self, session: Session) -> str:
         """Format full conversation as markdown"""
+        parts = [self._markdown_preamble(SessionHeader.from_session(session))]
+        parts.extend(self._markdown_message(msg) for msg in session.messages)
+        parts.append(_MARKDOWN_FOOTER)
+        return "".join(parts)
+
+    @staticmethod
+    def _markdown_preamble(header: SessionHeader) -> str:
+        """Markdown export up to the conversation heading"""
         lines = [
-            f"# Session Memory: {session.id}",
+            f"# Session Memory: {header.id}",
             "",
             "## Metadata",
-            f"- **Created**: {session.created_at.isoformat()}",
-            f"- **Provider**: {session.provider}",
-            f"- **Model**: {session.model}",
-            f"- **Messages**: {len(session.messages)}",
+            f"- **Created**: {header.created_at.isoformat()}",
+            f"- **Provider**: {header.provider}",
+            f"- **Model**: {header.model}",
+            f"- **Messages**: {header.message_count}",
             "",
         ]
 
-        if session.system_prompt:
+        if header.system_prompt:
             lines.extend([
                 "## System Prompt",
-                session.system_prompt,
+                header.system_prompt,
                 "",
             ])
 
         lines.append("## Conversation")
+        return "\n".join(lines)
 
-        for msg in session.messages:
-            role = "User" if msg.role.value == "user" else "Assistant"
-            lines.extend([
-                "",
-                f"### {role} ({msg.timestamp.strftime('%Y-%m-%d %H:%M:%S')})",
-                msg.content,
-            ])
+    @staticmethod
+    def _markdown_message(msg: Message) -> str:
+        """Markdown export of one message"""
+        role = "User" if msg.role.value == "user" else "Assistant"
+        return f"\n\n### {role} ({msg.timestamp.strftime('%Y-%m-%d %H:%M:%S')})\n{msg.content}"
 
-        lines.extend(["", "---", "*Generated by LLM MCP Hub*"])
-        return "\n".join(lines)
+    async def stream_memory(self, session_id: str, format: str = "markdown") -> AsyncIterator[str]:
+        """
+        Stream the full conversation as markdown or NDJSON.
+
+        Messages come from the store's message iterator and output is
+        flushed in chunks of about STREAM_CHUNK_SIZE characters, so memory
+        use does not grow with the session. The session is checked before
+        the stream is returned, so lookup errors surface before any output.
+        """
+        header = await self._session_service.get_session_header(session_id)
+        messages = self._session_service.iter_messages(session_id)
+        if format == "ndjson":
+            parts = self._ndjson_parts(header, messages)
+        else:
+            parts = self._markdown_parts(header, messages)
+        return self._buffered(parts)
+
+    async def _markdown_parts(self, header: SessionHeader, messages: AsyncIterator[Message]) -> AsyncIterator[str]:
+        """Markdown export, piece by piece"""
+        yield self._markdown_preamble(header)
+        async for msg in messages:
+            yield self._markdown_message(msg)
+        yield _MARKDOWN_FOOTER
+
+    @staticmethod
+    async def _ndjson_parts(header: SessionHeader, messages: AsyncIterator[Message]) -> AsyncIterator[str]:
+        """NDJSON export: a session line followed by one line per message"""
+        yield json.dumps({"type": "session", **header.to_dict()}) + "\n"
+        async for msg in messages:
+            yield json.dumps({"type": "message", **msg.to_dict()}) + "\n"
+
+    @staticmethod
+    async def _buffered(parts: AsyncIterator[str]) -> AsyncIterator[str]:
+        """Coalesce small pieces into chunks of about STREAM_CHUNK_SIZE"""
+        buffer: list[str] = []
+        size = 0
+        async for part in parts:
+            buffer.append(part)
+            size += len(part)
+            if size >= STREAM_CHUNK_SIZE:
+                yield "".join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield "".join(buffer)
 
     async def _compress_conversation(
         self,
         session: Session,
         compression: CompressionLevel,
         provider: str,
+        low_priority: bool = False,
     ) -> str:
-        """Compress conversation using LLM"""
+        """
+        Compress conversation using LLM (extractively for high compression).
+
+        The last summary per compression level is kept on the session with
+        the number of messages it covers. Later exports only summarize the
+        messages added since and fold them into that summary.
+        """
         if not session.messages:
             return "# Empty Session\nNo messages to summarize."
 
-        # Build conversation text
-        conversation_text = "\n".join(
-            f"{'User' if m.role.value == 'user' else 'Assistant'}: {m.content}"
-            for m in session.messages
-        )
+        message_count = len(session.messages)
+        cached = session.summaries.get(compression.value)
+        covered = cached["message_count"] if cached else 0
 
-        # Build compression prompt based on level
-        if compression == CompressionLevel.LOW:
-            prompt = f"""Summarize this conversation, keeping important details and key messages:
+        if cached and covered == message_count:
+            CACHE_LOOKUPS.labels("memory_summary", "hit").inc()
+            return cached["content"]
+        CACHE_LOOKUPS.labels("memory_summary", "partial" if cached and covered < message_count else "miss").inc()
 
-{conversation_text}
+        if compression == CompressionLevel.HIGH:
+            content = await self._extractive_summary(session, compression)
+            return await self._store_summary(session, compression, content, message_count)
 
-Format as markdown with:
-- Brief summary
-- Key decisions or conclusions
-- Important quotes or statements"""
-
-        elif compression == CompressionLevel.MEDIUM:
-            prompt = f"""Create a concise summary of this conversation focusing on:
-1. Main topics discussed
-2. Decisions made
-3. Action items or next steps
+        try:
+            if cached and covered < message_count:
+                conversation = await self._condense(session.messages[covered:], provider, low_priority)
+                prompt = _UPDATE_PROMPT.format(
+                    summary=cached["content"],
+                    instructions=_PROMPTS[compression].format(conversation=conversation),
+                )
+            else:
+                conversation = await self._condense(session.messages, provider, low_priority)
+                prompt = _PROMPTS[compression].format(conversation=conversation)
+
+            content = await self._summarize(prompt, provider, low_priority)
+        except Exception as e:
+            logger.error(f"Failed to compress conversation: {e}")
+            # Fallback to local extractive summary (not stored, so a later export retries the LLM)
+            return await self._extractive_summary(session, compression)
 
-Conversation:
-{conversation_text}
+        return await self._store_summary(session, compression, content, message_count)
 
-Format as markdown with clear sections."""
+    async def _store_summary(
+        self,
+        session: Session,
+        compression: CompressionLevel,
+        content: str,
+        message_count: int,
+    ) -> str:
+        """Persist summary on the session with the number of messages it covers"""
+        entry = {
+            "content": content,
+            "message_count": message_count,
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        session.summaries[compression.value] = entry
+
+        # Summarizing can take a while; write onto the latest copy so that
+        # messages added in the meantime are kept
+        latest = await self._session_service.get_session_or_none(session.id)
+        if latest is None:
+            return content
+        if latest is not session:
+            latest.summaries[compression.value] = entry
+        # Not user activity: keep updated_at so idle sessions stay idle
+        await self._session_service.update_session(latest, touch=False)
+        return content
+
+    async def _extractive_summary(self, session: Session, compression: CompressionLevel) -> str:
+        """Summary of key sentences and keywords without LLM"""
+        sentences, keywords = _EXTRACTIVE_SIZES[compression]
+        # Scoring is CPU bound; run it off the event loop on a snapshot of the messages
+        key_sentences, key_terms = await asyncio.to_thread(
+            self._extractive.summarize, list(session.messages), sentences, keywords
+        )
 
-        else:  # HIGH
-            prompt = f"""Extract only the essential keywords and key points from this conversation:
+        lines = [self._simple_summary(session)]
+        if key_terms:
+            lines.extend(["", "## Keywords", ", ".join(key_terms)])
+        if key_sentences:
+            lines.extend(["", "## Key Points"])
+            lines.extend(f"- {sentence[:300]}" for sentence in key_sentences)
+        return "\n".join(lines)
 
-{conversation_text}
+    async def _summarize(self, prompt: str, provider: str, low_priority: bool = False) -> str:
+        """Run one summarization call"""
+        result = await self._chat_service.chat(
+            prompt=prompt,
+            provider=provider,
+            timeout=self._timeout,
+            low_priority=low_priority,
+        )
+        return result["response"]
 
-Format as a brief bullet list of keywords and concepts only."""
+    async def _condense(self, messages: list[Message], provider: str, low_priority: bool = False) -> str:
+        """
+        Render messages as text that fits one prompt budget.
 
-        try:
-            result = await self._chat_service.chat(
-                prompt=prompt,
-                provider=provider,
-                timeout=60.0,
+        Short conversations are returned verbatim. Longer ones are chunked
+        and summarized, and the partial summaries are merged level by level
+        until they fit.
+        """
+        chunks = self._chunk_lines(self._conversation_lines(messages))
+        if len(chunks) == 1:
+            return chunks[0]
+
+        logger.info(f"Summarizing conversation in {len(chunks)} chunks")
+        partials = await self._map_chunks(chunks, _CHUNK_PROMPT, provider, low_priority)
+        while True:
+            groups = self._chunk_lines(
+                f"Part {i}:\n{summary}\n" for i, summary in enumerate(partials, 1)
             )
-            return result["response"]
-        except Exception as e:
-            logger.error(f"Failed to compress conversation: {e}")
-            # Fallback to simple summary
-            return self._simple_summary(session)
+            if len(groups) == 1 or len(groups) >= len(partials):
+                # Fits, or merging no longer shrinks the input
+                return groups[0] if len(groups) == 1 else "\n".join(groups)
+            partials = await self._map_chunks(groups, _COMBINE_PROMPT, provider, low_priority)
+
+    async def _map_chunks(
+        self,
+        chunks: list[str],
+        template: str,
+        provider: str,
+        low_priority: bool = False,
+    ) -> list[str]:
+        """Summarize chunks concurrently, reusing cached chunk summaries"""
+        semaphore = asyncio.Semaphore(self._max_parallel_chunks)
+
+        async def summarize(chunk: str) -> str:
+            prompt = template.format(conversation=chunk)
+            key = (provider, hashlib.sha256(prompt.encode("utf-8")).hexdigest())
+            summary = self._chunk_cache.get(key)
+            if summary is not None:
+                CACHE_LOOKUPS.labels("memory_chunk", "hit").inc()
+                self._chunk_cache.move_to_end(key)
+                return summary
+            CACHE_LOOKUPS.labels("memory_chunk", "miss").inc()
+
+            async with semaphore:
+                summary = await self._summarize(prompt, provider, low_priority)
+
+            self._chunk_cache[key] = summary
+            if len(self._chunk_cache) > self._chunk_cache_size:
+                self._chunk_cache.popitem(last=False)
+            return summary
+
+        # A failed chunk cancels its siblings
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(summarize(chunk)) for chunk in chunks]
+        return [task.result() for task in tasks]
+
+    def _chunk_lines(self, lines) -> list[str]:
+        """
+        Pack lines into chunks of at most the chunk budget in characters.
+
+        Chunks break on line boundaries so that appending messages leaves
+        earlier chunks (and their cached summaries) unchanged. Lines longer
+        than the budget are split.
+        """
+        budget = self._chunk_chars
+        chunks: list[str] = []
+        current: list[str] = []
+        size = 0
+        for line in lines:
+            pieces = [line[i:i + budget] for i in range(0, len(line), budget)] or [line]
+            for piece in pieces:
+                if current and size + len(piece) > budget:
+                    chunks.append("\n".join(current))
+                    current, size = [], 0
+                current.append(piece)
+                size += len(piece) + 1
+        if current or not chunks:
+            chunks.append("\n".join(current))
+        return chunks
+
+    @staticmethod
+    def _conversation_lines(messages: list[Message]):
+        """Render messages as plain conversation lines"""
+        return (
+            f"{'User' if m.role.value == 'user' else 'Assistant'}: {m.content}"
+            for m in messages
+        )
 
     def _simple_summary(self, session: Session) -> str:
         """Simple summary without LLM (fallback)"""
@@ -219,3 +685,102 @@ Format as a brief bullet list of keywords and concepts only."""
             "status": session.status.value,
             "compressed_memory": memory["content"],
         }
+
+    async def precompute_idle(
+        self,
+        idle_seconds: float,
+        compression: CompressionLevel = CompressionLevel.MEDIUM,
+        provider: str = "claude",
+    ) -> int:
+        """
+        Summarize sessions idle for at least idle_seconds, at low priority.
+
+        Sessions whose last precomputed summary still covers all their
+        messages are skipped using the header alone. When the LLM summary
+        fails, the session is retried with exponential backoff (or as soon
+        as new messages arrive). Returns the number of sessions summarized.
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=idle_seconds)
+        seen: dict[str, int] = {}
+        failures: dict[str, tuple[int, int, float]] = {}
+        summarized = 0
+        offset = 0
+        while True:
+            headers = await self._session_service.list_session_headers(limit=100, offset=offset)
+            if not headers:
+                break
+            offset += len(headers)
+
+            for header in headers:
+                if not header.is_active() or not header.message_count or header.updated_at > cutoff:
+                    continue
+                if self._precomputed.get(header.id) == header.message_count:
+                    seen[header.id] = header.message_count
+                    continue
+                failure = self._precompute_failures.get(header.id)
+                if failure and failure[0] != header.message_count:
+                    failure = None
+                if failure and time.monotonic() < failure[2]:
+                    failures[header.id] = failure
+                    continue
+
+                session = await self._session_service.get_session_or_none(header.id)
+                if session is None:
+                    continue
+                await self._compress_conversation(session, compression, provider, low_priority=True)
+
+                cached = session.summaries.get(compression.value)
+                if cached and cached["message_count"] == len(session.messages):
+                    seen[header.id] = len(session.messages)
+                    summarized += 1
+                else:
+                    # Only the extractive fallback was produced; back off before the next LLM attempt
+                    attempts = failure[1] + 1 if failure else 1
+                    delay = min(_PRECOMPUTE_RETRY_SECONDS * 2 ** (attempts - 1), _PRECOMPUTE_RETRY_MAX_SECONDS)
+                    failures[header.id] = (header.message_count, attempts, time.monotonic() + delay)
+
+        # Forget sessions that are gone or active again
+        self._precomputed = seen
+        self._precompute_failures = failures
+        return summarized
+
+    def start_precompute_task(
+        self,
+        interval: float,
+        idle_seconds: float,
+        compression: CompressionLevel = CompressionLevel.MEDIUM,
+        provider: str = "claude",
+    ) -> None:
+        """Start background task that precomputes idle session summaries every interval seconds"""
+        if self._precompute_task is None or self._precompute_task.done():
+            self._precompute_task = asyncio.create_task(
+                self._precompute_loop(interval, idle_seconds, compression, provider)
+            )
+
+    async def stop_precompute_task(self) -> None:
+        """Stop background precompute task"""
+        if self._precompute_task is None:
+            return
+        self._precompute_task.cancel()
+        try:
+            await self._precompute_task
+        except asyncio.CancelledError:
+            pass
+        self._precompute_task = None
+
+    async def _precompute_loop(
+        self,
+        interval: float,
+        idle_seconds: float,
+        compression: CompressionLevel,
+        provider: str,
+    ) -> None:
+        """Periodically precompute summaries of idle sessions"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                summarized = await self.precompute_idle(idle_seconds, compression, provider)
+                if summarized:
+                    logger.debug(f"Precomputed memory for {summarized} idle sessions")
+            except Exception as e:
+                logger.error(f"Memory precompute failed: {e}")
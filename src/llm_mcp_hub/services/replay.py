@@ -0,0 +1,272 @@
+"""Replay logs for resumable streams"""
+import asyncio
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, AsyncIterator
+
+import redis.asyncio as redis
+
+from llm_mcp_hub.core.exceptions import RequestCancelledError, StreamNotResumableError
+
+logger = logging.getLogger(__name__)
+
+# Event types that end a stream
+TERMINAL_EVENTS = frozenset({"done", "error"})
+
+
+class ReplayLog(ABC):
+    """
+    Bounded log of stream events, readable from any sequence id.
+
+    A resumable stream is produced by record(), which runs independently of
+    any client connection and appends each event with the next sequence id
+    (stored in the event as "id"). Clients read with read(), starting after
+    the last id they saw, and follow the log until a terminal event.
+    """
+
+    @abstractmethod
+    async def create(self, stream_id: str) -> bool:
+        """Create an empty stream, return False if it already exists"""
+        pass
+
+    @abstractmethod
+    async def append(self, stream_id: str, event: dict[str, Any]) -> int:
+        """Append event, return its sequence id"""
+        pass
+
+    @abstractmethod
+    async def finish(self, stream_id: str) -> None:
+        """Mark stream complete; it stays replayable until its TTL runs out"""
+        pass
+
+    @abstractmethod
+    async def check(self, stream_id: str, after: int = 0) -> None:
+        """Raise StreamNotResumableError if the stream cannot be read after the given id"""
+        pass
+
+    @abstractmethod
+    def read(self, stream_id: str, after: int = 0) -> AsyncIterator[dict[str, Any]]:
+        """Yield events with id > after, following the stream until it ends"""
+        pass
+
+    async def close(self) -> None:
+        """Release resources"""
+
+    async def record(self, stream_id: str, events: AsyncIterator[dict[str, Any]]) -> None:
+        """Append all events of a stream; cancellation is recorded as an error event"""
+        try:
+            async for event in events:
+                await self.append(stream_id, event)
+        except asyncio.CancelledError:
+            error = RequestCancelledError(stream_id)
+            await self.append(stream_id, {"type": "error", "error": error.message, "code": error.code})
+            raise
+        finally:
+            await self.finish(stream_id)
+
+
+class _ReplayBuffer:
+    """Events and reader wakeups for one in-memory stream"""
+
+    __slots__ = ("events", "next_seq", "finished", "waiters")
+
+    def __init__(self, max_events: int):
+        self.events: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self.next_seq = 1
+        self.finished = False
+        self.waiters: list[asyncio.Future] = []
+
+    def wake(self) -> None:
+        for waiter in self.waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self.waiters.clear()
+
+
+class MemoryReplayLog(ReplayLog):
+    """
+    In-process replay log.
+
+    Each stream keeps its last max_events events in a ring buffer. Finished
+    streams are dropped ttl seconds after they finish.
+    """
+
+    def __init__(self, max_events: int = 10000, ttl: int = 300):
+        self._max_events = max_events
+        self._ttl = ttl
+        self._streams: dict[str, _ReplayBuffer] = {}
+        # (expires_at, stream_id) in finishing order
+        self._expiry: deque[tuple[float, str]] = deque()
+
+    def _purge(self) -> None:
+        """Drop finished streams past their TTL"""
+        now = time.monotonic()
+        while self._expiry and self._expiry[0][0] <= now:
+            _, stream_id = self._expiry.popleft()
+            self._streams.pop(stream_id, None)
+
+    async def create(self, stream_id: str) -> bool:
+        """Create an empty stream, return False if it already exists"""
+        self._purge()
+        if stream_id in self._streams:
+            return False
+        self._streams[stream_id] = _ReplayBuffer(self._max_events)
+        return True
+
+    async def append(self, stream_id: str, event: dict[str, Any]) -> int:
+        """Append event, return its sequence id"""
+        buffer = self._streams[stream_id]
+        seq = buffer.next_seq
+        buffer.next_seq += 1
+        event["id"] = seq
+        buffer.events.append(event)
+        if buffer.waiters:
+            buffer.wake()
+        return seq
+
+    async def finish(self, stream_id: str) -> None:
+        """Mark stream complete and schedule its removal"""
+        buffer = self._streams.get(stream_id)
+        if buffer is None or buffer.finished:
+            return
+        buffer.finished = True
+        buffer.wake()
+        self._expiry.append((time.monotonic() + self._ttl, stream_id))
+
+    def _get(self, stream_id: str, after: int) -> _ReplayBuffer:
+        """Get a stream readable after the given id"""
+        self._purge()
+        buffer = self._streams.get(stream_id)
+        if buffer is None:
+            raise StreamNotResumableError(stream_id, "unknown or expired stream")
+        if buffer.events and after + 1 < buffer.events[0]["id"]:
+            raise StreamNotResumableError(stream_id, f"events before {buffer.events[0]['id']} were dropped")
+        return buffer
+
+    async def check(self, stream_id: str, after: int = 0) -> None:
+        """Raise StreamNotResumableError if the stream cannot be read after the given id"""
+        self._get(stream_id, after)
+
+    async def read(self, stream_id: str, after: int = 0) -> AsyncIterator[dict[str, Any]]:
+        """Yield events with id > after, following the stream until it ends"""
+        buffer = self._get(stream_id, after)
+        next_seq = after + 1
+        while True:
+            # Index from the tail end is cheap in a deque; readers are usually near it
+            while buffer.events:
+                i = next_seq - buffer.events[0]["id"]
+                if i < 0:
+                    raise StreamNotResumableError(stream_id, "reader fell behind the replay buffer")
+                if i >= len(buffer.events):
+                    break
+                event = buffer.events[i]
+                next_seq += 1
+                yield event
+                if event["type"] in TERMINAL_EVENTS:
+                    return
+            if buffer.finished:
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            buffer.waiters.append(waiter)
+            await waiter
+
+
+class RedisReplayLog(ReplayLog):
+    """
+    Replay log in Redis Streams, readable from any replica.
+
+    Events are XADDed with ids 0-<seq> and the stream is trimmed to about
+    max_events entries. The first entry (0-1) is a start marker: adding it
+    fails if the stream exists, which makes create() atomic. The key's TTL
+    is refreshed on every append, so streams of crashed producers expire.
+    """
+
+    KEY_PREFIX = "llm_hub:stream:"
+
+    def __init__(self, redis_url: str, max_events: int = 10000, ttl: int = 300, block_ms: int = 5000):
+        self._redis_url = redis_url
+        self._max_events = max_events
+        self._ttl = ttl
+        self._block_ms = block_ms
+        self._client: redis.Redis | None = None
+        # Next sequence id of streams produced by this replica
+        self._next_seq: dict[str, int] = {}
+
+    def _key(self, stream_id: str) -> str:
+        return f"{self.KEY_PREFIX}{stream_id}"
+
+    async def connect(self) -> None:
+        """Connect to Redis"""
+        if self._client is None:
+            self._client = redis.from_url(self._redis_url, encoding="utf-8", decode_responses=True)
+            await self._client.ping()
+
+    async def close(self) -> None:
+        """Close Redis connection"""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    async def create(self, stream_id: str) -> bool:
+        """Create a stream with its start marker, return False if it already exists"""
+        key = self._key(stream_id)
+        try:
+            await self._client.xadd(key, {"e": '{"type":"start"}'}, id="0-1")
+        except redis.ResponseError:
+            return False
+        await self._client.expire(key, self._ttl)
+        self._next_seq[stream_id] = 2
+        return True
+
+    async def append(self, stream_id: str, event: dict[str, Any]) -> int:
+        """Append event, return its sequence id"""
+        seq = self._next_seq[stream_id]
+        self._next_seq[stream_id] = seq + 1
+        event["id"] = seq
+        key = self._key(stream_id)
+        pipe = self._client.pipeline(transaction=False)
+        pipe.xadd(key, {"e": json.dumps(event)}, id=f"0-{seq}", maxlen=self._max_events, approximate=True)
+        pipe.expire(key, self._ttl)
+        await pipe.execute()
+        return seq
+
+    async def finish(self, stream_id: str) -> None:
+        """Forget the local sequence counter; the key expires on its own"""
+        self._next_seq.pop(stream_id, None)
+
+    async def check(self, stream_id: str, after: int = 0) -> None:
+        """Raise StreamNotResumableError if the stream cannot be read after the given id"""
+        first = await self._client.xrange(self._key(stream_id), count=1)
+        if not first:
+            raise StreamNotResumableError(stream_id, "unknown or expired stream")
+        first_seq = int(first[0][0].split("-")[1])
+        if after + 1 < first_seq:
+            raise StreamNotResumableError(stream_id, f"events before {first_seq} were dropped")
+
+    async def read(self, stream_id: str, after: int = 0) -> AsyncIterator[dict[str, Any]]:
+        """Yield events with id > after, following the stream until it ends"""
+        await self.check(stream_id, after)
+        key = self._key(stream_id)
+        last = after
+        while True:
+            response = await self._client.xread({key: f"0-{last}"}, count=500, block=self._block_ms)
+            if not response:
+                if not await self._client.exists(key):
+                    raise StreamNotResumableError(stream_id, "stream expired")
+                continue
+            for entry_id, fields in response[0][1]:
+                seq = int(entry_id.split("-")[1])
+                # Ids are contiguous from the start marker (1), so any jump means
+                # entries were trimmed before this reader got to them
+                if seq != last + 1:
+                    raise StreamNotResumableError(stream_id, f"events {last + 1}-{seq - 1} were dropped")
+                last = seq
+                event = json.loads(fields["e"])
+                if event["type"] == "start":
+                    continue
+                yield event
+                if event["type"] in TERMINAL_EVENTS:
+                    return
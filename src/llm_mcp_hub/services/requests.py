@@ -0,0 +1,275 @@
+"""Registry of in-flight completion requests"""
+import asyncio
+import json
+import logging
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator
+
+import redis.asyncio as redis
+
+from llm_mcp_hub.core.exceptions import RequestIdInUseError
+
+logger = logging.getLogger(__name__)
+
+# Delete a request key only if it still holds this request's record
+_WITHDRAW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass(slots=True, eq=False)
+class InFlightRequest:
+    """A running completion request"""
+
+    id: str
+    provider: str | None = None
+    model: str | None = None
+    stream: bool = False
+    replica: str = ""
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    # Task running the provider call, cancelled on cancel()
+    task: asyncio.Task | None = None
+    cancelled: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def cancel(self) -> None:
+        """Mark cancelled and cancel the running task"""
+        self.cancelled.set()
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to dictionary"""
+        return {
+            "request_id": self.id,
+            "provider": self.provider,
+            "model": self.model,
+            "stream": self.stream,
+            "replica": self.replica,
+            "started_at": self.started_at.isoformat(),
+        }
+
+
+class RequestRegistry:
+    """
+    In-flight completion requests of this replica, cancellable by id.
+
+    Cancelling a request sets its cancelled event and cancels its task. The
+    cancellation unwinds through the provider adapter, which kills the CLI
+    process, and through the admission slot, which is released on exit.
+    """
+
+    def __init__(self, replica_id: str | None = None):
+        self.replica_id = replica_id or uuid.uuid4().hex[:12]
+        self._requests: dict[str, InFlightRequest] = {}
+
+    @staticmethod
+    def new_request_id() -> str:
+        """Generate a request ID"""
+        return f"req_{uuid.uuid4().hex}"
+
+    def get(self, request_id: str) -> InFlightRequest | None:
+        """Get a request running on this replica"""
+        return self._requests.get(request_id)
+
+    async def register(
+        self,
+        request_id: str,
+        provider: str | None = None,
+        model: str | None = None,
+        stream: bool = False,
+        task: asyncio.Task | None = None,
+    ) -> InFlightRequest:
+        """Claim request_id for a new request, raise RequestIdInUseError if it is in flight"""
+        if request_id in self._requests:
+            raise RequestIdInUseError(request_id)
+        request = InFlightRequest(
+            id=request_id,
+            provider=provider,
+            model=model,
+            stream=stream,
+            replica=self.replica_id,
+            task=task,
+        )
+        self._requests[request_id] = request
+        try:
+            claimed = await self._announce(request)
+        except BaseException:
+            del self._requests[request_id]
+            raise
+        if not claimed:
+            del self._requests[request_id]
+            raise RequestIdInUseError(request_id)
+        return request
+
+    async def unregister(self, request: InFlightRequest) -> None:
+        """Release a finished request's id; safe to call more than once"""
+        if self._requests.get(request.id) is request:
+            del self._requests[request.id]
+            await self._withdraw(request)
+
+    @asynccontextmanager
+    async def track(
+        self,
+        request_id: str,
+        provider: str | None = None,
+        model: str | None = None,
+        stream: bool = False,
+        task: asyncio.Task | None = None,
+    ) -> AsyncIterator[InFlightRequest]:
+        """Register a request for the duration of the block"""
+        request = await self.register(request_id, provider, model, stream, task)
+        try:
+            yield request
+        finally:
+            await self.unregister(request)
+
+    def _cancel_local(self, request_id: str) -> bool:
+        """Cancel a request running on this replica"""
+        request = self._requests.get(request_id)
+        if request is None:
+            return False
+        logger.info(f"Cancelling request {request_id}")
+        request.cancel()
+        return True
+
+    async def cancel(self, request_id: str) -> bool:
+        """Cancel a request, return False if it is not in flight"""
+        return self._cancel_local(request_id)
+
+    async def list_requests(self) -> list[dict[str, Any]]:
+        """List in-flight requests, oldest first"""
+        return [r.to_dict() for r in sorted(self._requests.values(), key=lambda r: r.started_at)]
+
+    async def _announce(self, request: InFlightRequest) -> bool:
+        """Publish a new request to other replicas, return False if its id is taken"""
+        return True
+
+    async def _withdraw(self, request: InFlightRequest) -> None:
+        """Remove a finished request from other replicas' view"""
+
+    async def start(self) -> None:
+        """Start listening for cancellations"""
+
+    async def close(self) -> None:
+        """Stop listening for cancellations"""
+
+
+class RedisRequestRegistry(RequestRegistry):
+    """
+    Request registry shared by all replicas through Redis.
+
+    Each in-flight request claims its own key with SET NX, so an id runs
+    at most once across replicas. The key has a short TTL that the owning
+    replica refreshes while the request runs, however long that is; keys
+    of crashed replicas expire soon after. Cancelling a request that runs
+    on another replica publishes its id; every replica listens on the
+    channel and cancels the request if it owns it.
+    """
+
+    KEY_PREFIX = "llm_hub:request:"
+    CANCEL_CHANNEL = "llm_hub:request_cancel"
+
+    def __init__(self, redis_url: str, ttl: int = 60, replica_id: str | None = None):
+        super().__init__(replica_id)
+        self._redis_url = redis_url
+        self._ttl = ttl
+        self._client: redis.Redis | None = None
+        self._pubsub = None
+        self._listener: asyncio.Task | None = None
+        self._keepalive_task: asyncio.Task | None = None
+
+    def _key(self, request_id: str) -> str:
+        return f"{self.KEY_PREFIX}{request_id}"
+
+    async def start(self) -> None:
+        """Connect and subscribe to the cancel channel"""
+        if self._client is None:
+            self._client = redis.from_url(self._redis_url, encoding="utf-8", decode_responses=True)
+        self._pubsub = self._client.pubsub()
+        await self._pubsub.subscribe(self.CANCEL_CHANNEL)
+        self._listener = asyncio.create_task(self._listen())
+        self._keepalive_task = asyncio.create_task(self._keepalive())
+
+    async def close(self) -> None:
+        """Unsubscribe and disconnect"""
+        for task in (self._listener, self._keepalive_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._listener = None
+        self._keepalive_task = None
+        if self._pubsub is not None:
+            await self._pubsub.close()
+            self._pubsub = None
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    async def _listen(self) -> None:
+        """Cancel local requests named on the cancel channel"""
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message["type"] == "message":
+                        self._cancel_local(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Request cancel listener failed: {e}")
+                await asyncio.sleep(1.0)
+
+    async def _keepalive(self) -> None:
+        """Refresh the keys of this replica's requests while they run"""
+        while True:
+            await asyncio.sleep(self._ttl / 3)
+            if not self._requests:
+                continue
+            try:
+                async with self._client.pipeline(transaction=False) as pipe:
+                    for request_id in list(self._requests):
+                        pipe.expire(self._key(request_id), self._ttl)
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Failed to refresh in-flight requests in Redis: {e}")
+
+    async def _announce(self, request: InFlightRequest) -> bool:
+        """Claim the request's key so other replicas can list and cancel it"""
+        try:
+            return bool(await self._client.set(
+                self._key(request.id), json.dumps(request.to_dict()), ex=self._ttl, nx=True
+            ))
+        except Exception as e:
+            # Redis is only needed across replicas; keep serving this one
+            logger.warning(f"Failed to register request {request.id} in Redis: {e}")
+            return True
+
+    async def _withdraw(self, request: InFlightRequest) -> None:
+        """Delete the request's key if it is still ours"""
+        try:
+            await self._client.eval(_WITHDRAW_SCRIPT, 1, self._key(request.id), json.dumps(request.to_dict()))
+        except Exception as e:
+            logger.warning(f"Failed to unregister request {request.id} in Redis: {e}")
+
+    async def cancel(self, request_id: str) -> bool:
+        """Cancel a request on whichever replica runs it"""
+        if self._cancel_local(request_id):
+            return True
+        if not await self._client.exists(self._key(request_id)):
+            return False
+        await self._client.publish(self.CANCEL_CHANNEL, request_id)
+        return True
+
+    async def list_requests(self) -> list[dict[str, Any]]:
+        """List in-flight requests of all replicas, oldest first"""
+        keys = [key async for key in self._client.scan_iter(match=f"{self.KEY_PREFIX}*", count=500)]
+        requests = [json.loads(value) for value in await self._client.mget(keys) if value] if keys else []
+        return sorted(requests, key=lambda r: r["started_at"])
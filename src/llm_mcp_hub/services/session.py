@@ -1,20 +1,33 @@
 """Session management service"""
+import asyncio
+import codecs
 import logging
+import math
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, AsyncIterator
 
 from llm_mcp_hub.core.exceptions import (
+    ContextQuotaExceededError,
     SessionNotFoundError,
     SessionExpiredError,
     ProviderMismatchError,
     InvalidModelError,
 )
-from llm_mcp_hub.domain import Session, SessionContext, SessionStatus
+from llm_mcp_hub.core.metrics import REGISTRY
+from llm_mcp_hub.core.timing import STORE_WRITE, timed
+from llm_mcp_hub.domain import Message, Session, SessionContext, SessionHeader, SessionStatus
+from llm_mcp_hub.infrastructure.blob import BlobStore
 from llm_mcp_hub.infrastructure.session import SessionStore
 from llm_mcp_hub.infrastructure.providers import ProviderAdapter
 
 logger = logging.getLogger(__name__)
 
+_STORE_OPERATIONS = REGISTRY.counter(
+    "llm_hub_session_store_operations_total",
+    "Session store calls by operation",
+    ("operation",),
+)
+
 
 class SessionService:
     """Session management service"""
@@ -24,10 +37,15 @@ class SessionService:
         session_store: SessionStore,
         providers: dict[str, ProviderAdapter],
         default_ttl: int = 3600,
+        blob_store: BlobStore | None = None,
+        max_context_bytes: int | None = None,
     ):
         self._store = session_store
         self._providers = providers
         self._default_ttl = default_ttl
+        self._blob_store = blob_store
+        self._max_context_bytes = max_context_bytes
+        self._pending_releases: set[asyncio.Task] = set()
 
     async def create_session(
         self,
@@ -60,7 +78,7 @@ class SessionService:
             session_context = SessionContext(
                 memory=context.get("memory"),
                 previous_summary=context.get("previous_summary"),
-                files=context.get("files", []),
+                files=await self._store_files(context.get("files", [])),
             )
 
         # Calculate expiration
@@ -78,13 +96,17 @@ class SessionService:
         )
 
         # Store session
-        session = await self._store.create(session)
+        _STORE_OPERATIONS.labels("create").inc()
+        with timed(STORE_WRITE):
+            session = await self._store.create(session)
+        await self._keep_files(session)
 
         logger.info(f"Created session: {session.id}, provider: {provider}, model: {effective_model}")
         return session
 
     async def get_session(self, session_id: str) -> Session:
         """Get session by ID"""
+        _STORE_OPERATIONS.labels("get").inc()
         session = await self._store.get(session_id)
 
         if session is None:
@@ -98,6 +120,16 @@ class SessionService:
 
         return session
 
+    async def get_session_any_status(self, session_id: str) -> Session:
+        """Get session by ID, including closed and expired ones still stored"""
+        _STORE_OPERATIONS.labels("get").inc()
+        session = await self._store.get(session_id)
+
+        if session is None:
+            raise SessionNotFoundError(session_id)
+
+        return session
+
     async def get_session_or_none(self, session_id: str | None) -> Session | None:
         """Get session by ID, return None if not found or no ID provided"""
         if not session_id:
@@ -108,30 +140,222 @@ class SessionService:
         except (SessionNotFoundError, SessionExpiredError):
             return None
 
-    async def update_session(self, session: Session) -> Session:
-        """Update session"""
-        return await self._store.update(session)
+    async def get_session_header(self, session_id: str) -> SessionHeader:
+        """Get session metadata by ID without loading messages"""
+        _STORE_OPERATIONS.labels("get_header").inc()
+        header = await self._store.get_header(session_id)
+
+        if header is None:
+            raise SessionNotFoundError(session_id)
+
+        if not header.is_active():
+            raise SessionExpiredError(session_id)
+
+        return header
+
+    async def get_session_header_any_status(self, session_id: str) -> SessionHeader | None:
+        """Get session metadata by ID whatever its status, None if not found"""
+        _STORE_OPERATIONS.labels("get_header").inc()
+        return await self._store.get_header(session_id)
+
+    async def get_session_header_or_none(self, session_id: str | None) -> SessionHeader | None:
+        """Get session metadata by ID, return None if not found or no ID provided"""
+        if not session_id:
+            return None
+
+        try:
+            return await self.get_session_header(session_id)
+        except (SessionNotFoundError, SessionExpiredError):
+            return None
+
+    def iter_messages(self, session_id: str) -> AsyncIterator[Message]:
+        """Iterate session messages without loading the whole session"""
+        _STORE_OPERATIONS.labels("iter_messages").inc()
+        return self._store.iter_messages(session_id)
+
+    async def update_session(self, session: Session, touch: bool = True) -> Session:
+        """Update session; touch=False keeps updated_at, so background writes leave it idle"""
+        _STORE_OPERATIONS.labels("update").inc()
+        with timed(STORE_WRITE):
+            session = await self._store.update(session, touch=touch)
+        await self._keep_files(session)
+        return session
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete session"""
-        return await self._store.delete(session_id)
+        session = None
+        if self._blob_store:
+            _STORE_OPERATIONS.labels("get").inc()
+            session = await self._store.get(session_id)
+        _STORE_OPERATIONS.labels("delete").inc()
+        with timed(STORE_WRITE):
+            deleted = await self._store.delete(session_id)
+        if deleted and session:
+            await self._release_files(session)
+        return deleted
+
+    async def _store_files(self, files: list[dict[str, str]]) -> list[dict[str, str]]:
+        """Move inline reference file contents into the blob store"""
+        if not self._blob_store:
+            return files
+
+        stored = []
+        for f in files:
+            if "content" in f:
+                content = f["content"].encode("utf-8")
+                digest = await self._blob_store.put(content)
+                f = {k: v for k, v in f.items() if k != "content"} | {"sha256": digest, "size": len(content)}
+            stored.append(f)
+        return stored
+
+    async def attach_file(self, session_id: str, name: str, chunks: AsyncIterator[bytes]) -> dict[str, Any]:
+        """
+        Stream a reference file into the session context.
+
+        Chunks are hashed and written to the blob store as they arrive, so
+        memory use is bounded by the chunk size. A file with the same name
+        is replaced. Raises ContextQuotaExceededError as soon as the
+        session's reference files would exceed the context size quota, and
+        UnicodeDecodeError for non UTF-8 content.
+        """
+        session = await self.get_session(session_id)
+
+        # Early quota check while streaming; the final one is against the
+        # session as it is after the upload
+        budget = None
+        if self._max_context_bytes is not None:
+            files = session.context.files if session.context else []
+            kept = [f for f in files if f.get("name") != name]
+            budget = self._max_context_bytes - SessionContext.model_construct(files=kept).total_file_bytes
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        writer = self._blob_store.open_writer() if self._blob_store else None
+        parts: list[str] = []
+        size = 0
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if budget is not None and size > budget:
+                    raise ContextQuotaExceededError(session_id, self._max_context_bytes)  # type: ignore[arg-type]
+                text = decoder.decode(chunk)
+                if writer:
+                    await writer.write(chunk)
+                else:
+                    parts.append(text)
+            decoder.decode(b"", final=True)
+        except BaseException:
+            if writer:
+                await writer.abort()
+            raise
+
+        if writer:
+            entry: dict[str, Any] = {"name": name, "sha256": await writer.commit(), "size": size}
+        else:
+            entry = {"name": name, "content": "".join(parts)}
+
+        # The upload can take a while; apply it to the latest copy so that
+        # messages and files added in the meantime are kept
+        try:
+            session = await self.get_session(session_id)
+            context = session.context or SessionContext()
+            replaced = [f for f in context.files if f.get("name") == name]
+            files = [f for f in context.files if f.get("name") != name] + [entry]
+            total = SessionContext.model_construct(files=files).total_file_bytes
+            if self._max_context_bytes is not None and total > self._max_context_bytes:
+                raise ContextQuotaExceededError(session_id, self._max_context_bytes)
+            context.files = files
+            session.context = context
+            _STORE_OPERATIONS.labels("update").inc()
+            with timed(STORE_WRITE):
+                await self._store.update(session)
+        except BaseException:
+            if writer:
+                await self._blob_store.release(entry["sha256"])  # type: ignore[union-attr]
+            raise
+        await self._keep_files(session)
+
+        if self._blob_store:
+            for f in replaced:
+                if "sha256" in f and "content" not in f:
+                    await self._blob_store.release(f["sha256"])
+
+        logger.info(f"Attached file to session {session_id}: {name} ({size} bytes)")
+        return {
+            "name": name,
+            "sha256": entry.get("sha256"),
+            "size": size,
+            "total_bytes": total,
+        }
+
+    async def _release_files(self, session: Session) -> None:
+        """Drop blob references held by session"""
+        if session.context:
+            await self._release_digests(session.context.file_digests)
+
+    async def _release_digests(self, digests: list[str]) -> None:
+        """Drop one blob reference per digest"""
+        if not self._blob_store:
+            return
+        for digest in digests:
+            await self._blob_store.release(digest)
+
+    async def _keep_files(self, session: Session) -> None:
+        """Keep the session's file blobs at least until the session expires"""
+        if not self._blob_store or not session.context or not session.expires_at:
+            return
+        digests = session.context.file_digests
+        ttl = math.ceil((session.expires_at - datetime.utcnow()).total_seconds())
+        if digests and ttl > 0:
+            await self._blob_store.touch(digests, ttl)
+
+    def on_session_removed(self, session_id: str, digests: list[str]) -> None:
+        """Store callback for sessions removed by expiry or eviction"""
+        if not self._blob_store or not digests:
+            return
+        task = asyncio.get_running_loop().create_task(self._release_digests(digests))
+        self._pending_releases.add(task)
+        task.add_done_callback(self._pending_releases.discard)
+
+    async def resolve_context(self, session: Session) -> None:
+        """Attach blob-backed reference file contents to session context"""
+        if not self._blob_store or not session.context:
+            return
+        digests = session.context.unresolved_digests
+        if not digests:
+            return
+
+        blobs = await self._blob_store.get_many(digests)
+        missing = set(digests) - blobs.keys()
+        if missing:
+            logger.warning(f"Session {session.id}: reference file blobs not found: {sorted(missing)}")
+        session.context.resolve_files({d: b.decode("utf-8") for d, b in blobs.items()})
 
     async def close_session(self, session_id: str) -> Session:
         """Close session"""
         session = await self.get_session(session_id)
         session.close()
-        return await self._store.update(session)
+        _STORE_OPERATIONS.labels("update").inc()
+        with timed(STORE_WRITE):
+            return await self._store.update(session)
 
     async def list_sessions(self, limit: int = 100, offset: int = 0) -> list[Session]:
         """List sessions"""
+        _STORE_OPERATIONS.labels("list").inc()
         return await self._store.list_sessions(limit=limit, offset=offset)
 
-    def validate_provider_match(self, session: Session, requested_provider: str | None) -> None:
+    async def list_session_headers(self, limit: int = 100, offset: int = 0) -> list[SessionHeader]:
+        """List session metadata without loading messages"""
+        _STORE_OPERATIONS.labels("list_headers").inc()
+        return await self._store.list_headers(limit=limit, offset=offset)
+
+    def validate_provider_match(self, session: Session | SessionHeader, requested_provider: str | None) -> None:
         """Validate that requested provider matches session provider"""
         if requested_provider and requested_provider != session.provider:
             raise ProviderMismatchError(session.provider, requested_provider)
 
-    def validate_model(self, session: Session, requested_model: str | None) -> str:
+    def validate_model(self, session: Session | SessionHeader, requested_model: str | None) -> str:
         """Validate and resolve model for session"""
         adapter = self._providers.get(session.provider)
         if not adapter:
@@ -242,6 +242,52 @@ class TestChatEndpoints:
         # Should fail - empty messages
         assert response.status_code == 400 or response.status_code == 422
 
+    @pytest.mark.asyncio
+    async def test_chat_completion_prompts_from_messages(self, client, mock_providers, monkeypatch):
+        """POST /v1/chat/completions - Last user message and first system message are used"""
+        calls = []
+        chat = mock_providers["claude"].chat
+
+        async def recording_chat(prompt, **kwargs):
+            calls.append((prompt, kwargs.get("system_prompt")))
+            return await chat(prompt, **kwargs)
+
+        monkeypatch.setattr(mock_providers["claude"], "chat", recording_chat)
+        response = await client.post(
+            "/v1/chat/completions",
+            json={
+                "messages": [
+                    {"role": "system", "content": "First system."},
+                    {"role": "user", "content": "One"},
+                    {"role": "system", "content": "Second system."},
+                    {"role": "user", "content": "Two"},
+                ],
+                "provider": "claude",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert calls == [("Two", "First system.")]
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_invalid_body(self, client):
+        """POST /v1/chat/completions - Validation errors point into the body"""
+        response = await client.post(
+            "/v1/chat/completions",
+            json={"messages": [{"role": "robot", "content": "Hi"}]},
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "messages", 0, "role"]
+
+        response = await client.post(
+            "/v1/chat/completions",
+            content=b"{not json",
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
+
     @pytest.mark.asyncio
     async def test_chat_completion_default_provider(self, client):
         """POST /v1/chat/completions - Default provider"""
@@ -296,6 +342,22 @@ class TestChatEndpoints:
         content = response.text
         assert "event: message" in content or "event: done" in content
 
+    @pytest.mark.asyncio
+    async def test_chat_completion_stream_options(self, client):
+        """POST /v1/chat/completions - Per-request SSE framing options"""
+        response = await client.post(
+            "/v1/chat/completions",
+            json={
+                "messages": [{"role": "user", "content": "Hello!"}],
+                "provider": "claude",
+                "stream": True,
+                "stream_options": {"flush_interval_ms": 0, "keepalive_seconds": 0},
+            }
+        )
+
+        assert response.status_code == 200
+        assert "event: done" in response.text
+
     @pytest.mark.asyncio
     async def test_chat_session_stores_messages(self, client):
         """POST /v1/chat/completions - Verify session stores messages"""
@@ -0,0 +1,128 @@
+"""Tests for the WebSocket chat endpoint"""
+import asyncio
+
+import pytest
+from starlette.testclient import TestClient
+
+
+@pytest.fixture
+def ws_client(test_app):
+    """Synchronous client for WebSocket tests"""
+    with TestClient(test_app) as client:
+        yield client
+
+
+@pytest.fixture
+def hanging_stream(mock_providers, monkeypatch):
+    """Claude mock stream that sends one chunk and then hangs; records cleanup"""
+    state = {"stopped": False}
+
+    async def chat_stream(prompt, **kwargs):
+        try:
+            yield "partial "
+            await asyncio.sleep(3600)
+        finally:
+            state["stopped"] = True
+
+    monkeypatch.setattr(mock_providers["claude"], "chat_stream", chat_stream)
+    return state
+
+
+def _url(client, provider: str = "claude") -> str:
+    """WebSocket URL bound to a new session"""
+    session_id = client.post("/v1/sessions", json={"provider": provider}).json()["session_id"]
+    return f"/v1/chat/ws?session_id={session_id}"
+
+
+def _turn(ws) -> list[dict]:
+    """Receive frames until the turn ends"""
+    frames = []
+    while True:
+        frame = ws.receive_json()
+        frames.append(frame)
+        if frame["type"] in ("done", "error"):
+            return frames
+
+
+class TestChatWebSocket:
+    """Test /v1/chat/ws"""
+
+    def test_streams_turns(self, ws_client):
+        with ws_client.websocket_connect(_url(ws_client, "gemini")) as ws:
+            hello = ws.receive_json()
+            assert hello["type"] == "session"
+            assert hello["provider"] == "gemini"
+
+            for prompt in ("first", "second"):
+                ws.send_json({"type": "message", "content": prompt, "request_id": f"turn-{prompt}"})
+                frames = _turn(ws)
+                text = "".join(f["text"] for f in frames if f["type"] == "content")
+                assert text == "Mock Gemini streaming response"
+                assert frames[-1]["type"] == "done"
+                assert frames[-1]["request_id"] == f"turn-{prompt}"
+                assert frames[-1]["session_id"] == hello["session_id"]
+
+    def test_turns_are_recorded_in_session(self, ws_client, session_store):
+        with ws_client.websocket_connect(_url(ws_client)) as ws:
+            session_id = ws.receive_json()["session_id"]
+            ws.send_json({"type": "message", "content": "hello"})
+            _turn(ws)
+
+        session = ws_client.portal.call(session_store.get, session_id)
+        assert [m.content for m in session.messages] == ["hello", "Mock Claude streaming response"]
+
+    def test_binds_existing_session(self, ws_client):
+        created = ws_client.post("/v1/sessions", json={"provider": "claude", "model": "opus"}).json()
+        with ws_client.websocket_connect(
+            "/v1/chat/ws", headers={"X-Session-ID": created["session_id"]}
+        ) as ws:
+            hello = ws.receive_json()
+            assert hello["session_id"] == created["session_id"]
+            assert hello["model"] == "claude-opus-4-5-20251101"
+
+    def test_session_is_required(self, ws_client):
+        with ws_client.websocket_connect("/v1/chat/ws") as ws:
+            frame = ws.receive_json()
+            assert frame["type"] == "error"
+            assert frame["code"] == "INVALID_REQUEST"
+
+    def test_unknown_session_is_rejected(self, ws_client):
+        with ws_client.websocket_connect("/v1/chat/ws?session_id=missing") as ws:
+            frame = ws.receive_json()
+            assert frame["type"] == "error"
+            assert frame["code"] == "SESSION_NOT_FOUND"
+
+    def test_invalid_frames_keep_connection(self, ws_client):
+        with ws_client.websocket_connect(_url(ws_client)) as ws:
+            ws.receive_json()
+            ws.send_text("not json")
+            assert ws.receive_json()["code"] == "INVALID_REQUEST"
+            ws.send_json({"type": "message"})
+            assert ws.receive_json()["code"] == "INVALID_REQUEST"
+            ws.send_json({"type": "message", "content": "still there?"})
+            assert _turn(ws)[-1]["type"] == "done"
+
+    def test_cancel_turn(self, ws_client, chat_service, hanging_stream):
+        with ws_client.websocket_connect(_url(ws_client)) as ws:
+            ws.receive_json()
+            ws.send_json({"type": "message", "content": "long", "request_id": "ws-turn"})
+            assert ws.receive_json() == {"type": "content", "text": "partial "}
+
+            ws.send_json({"type": "message", "content": "overlapping"})
+            assert ws.receive_json()["code"] == "INVALID_REQUEST"
+
+            ws.send_json({"type": "cancel"})
+            frame = ws.receive_json()
+            assert frame["code"] == "REQUEST_CANCELLED"
+            assert frame["request_id"] == "ws-turn"
+            assert hanging_stream["stopped"]
+            assert chat_service._admission.in_flight("claude") == 0
+
+    def test_turn_cancellable_by_request_id(self, ws_client, hanging_stream):
+        with ws_client.websocket_connect(_url(ws_client)) as ws:
+            ws.receive_json()
+            ws.send_json({"type": "message", "content": "long", "request_id": "ws-turn"})
+            ws.receive_json()
+
+            assert ws_client.delete("/v1/requests/ws-turn").status_code == 200
+            assert ws.receive_json()["code"] == "REQUEST_CANCELLED"
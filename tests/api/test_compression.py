@@ -0,0 +1,186 @@
+"""Tests for response compression middleware"""
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from llm_mcp_hub.api.compression import CompressionMiddleware, negotiate
+from llm_mcp_hub.core.metrics import REGISTRY
+
+BIG_TEXT = "The quick brown fox jumps over the lazy dog. " * 200
+FRAMES = [f"event: message\ndata: {{\"text\": \"chunk {i}\"}}\n\n" for i in range(3)]
+LINES = [f'{{"session": {i}}}\n' for i in range(3)]
+
+
+def _create_app(**options) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/big")
+    async def big():
+        return PlainTextResponse(BIG_TEXT)
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/encoded")
+    async def encoded():
+        return Response(gzip.compress(BIG_TEXT.encode()), media_type="text/plain", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/sse")
+    async def sse():
+        async def frames():
+            for frame in FRAMES:
+                yield frame
+
+        return StreamingResponse(frames(), media_type="text/event-stream")
+
+    @app.get("/ndjson")
+    async def ndjson():
+        async def lines():
+            await app.state.gate.wait()
+            for line in LINES:
+                yield line
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    app.add_middleware(CompressionMiddleware, **options)
+    app.state.gate = asyncio.Event()
+    app.state.gate.set()
+    return app
+
+
+async def _call(app, path: str, accept_encoding: str = "gzip", sent: list | None = None) -> list[dict]:
+    """Run one request through the ASGI app and capture sent messages"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+        "server": ("test", 80),
+        "client": ("test", 1234),
+    }
+    sent = [] if sent is None else sent
+    requested = False
+
+    async def receive():
+        nonlocal requested
+        if requested:
+            # Client stays connected
+            await asyncio.Event().wait()
+        requested = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
+
+
+def _headers(message: dict) -> dict[str, str]:
+    return {k.decode(): v.decode() for k, v in message["headers"]}
+
+
+class TestNegotiate:
+    def test_prefers_server_order_among_accepted(self):
+        assert negotiate("gzip, deflate") == "gzip"
+        assert negotiate("identity") is None
+        assert negotiate("") is None
+
+    def test_q_values(self):
+        assert negotiate("gzip;q=0") is None
+        assert negotiate("*;q=0.5") is not None
+        assert negotiate("br;q=1, gzip;q=0", {"gzip": object}) is None
+
+
+class TestCompressionMiddleware:
+    @pytest.mark.asyncio
+    async def test_large_response_is_compressed(self):
+        async with AsyncClient(transport=ASGITransport(app=_create_app()), base_url="http://test") as client:
+            response = await client.get("/big", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(BIG_TEXT) / 10
+        assert response.text == BIG_TEXT
+
+    @pytest.mark.asyncio
+    async def test_small_and_unaccepted_responses_pass_through(self):
+        async with AsyncClient(transport=ASGITransport(app=_create_app()), base_url="http://test") as client:
+            small = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+            identity = await client.get("/big", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in small.headers
+        assert small.headers["vary"] == "Accept-Encoding"
+        assert small.json() == {"ok": True}
+        assert "content-encoding" not in identity.headers
+
+    @pytest.mark.asyncio
+    async def test_already_encoded_response_untouched(self):
+        sent = await _call(_create_app(), "/encoded")
+        assert gzip.decompress(sent[1]["body"]).decode() == BIG_TEXT
+
+    @pytest.mark.asyncio
+    async def test_sse_flushes_every_frame(self):
+        sent = await _call(_create_app(), "/sse")
+        assert _headers(sent[0])["content-encoding"] == "gzip"
+
+        decoder = zlib.decompressobj(31)
+        bodies = [m for m in sent[1:] if m["body"]]
+        # Every frame can be decoded as soon as its message arrives
+        for frame, message in zip(FRAMES, bodies):
+            assert decoder.decompress(message["body"]).decode() == frame
+
+    @pytest.mark.asyncio
+    async def test_sse_compression_can_be_disabled(self):
+        sent = await _call(_create_app(compress_streams=False), "/sse")
+        assert "content-encoding" not in _headers(sent[0])
+
+    @pytest.mark.asyncio
+    async def test_ndjson_headers_are_not_held_back(self):
+        app = _create_app()
+        app.state.gate.clear()
+        sent = []
+        call = asyncio.create_task(_call(app, "/ndjson", sent=sent))
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        # Headers go out before the first line is produced
+        assert [m["type"] for m in sent] == ["http.response.start"]
+        assert _headers(sent[0])["content-encoding"] == "gzip"
+        assert _headers(sent[0])["vary"] == "Accept-Encoding"
+
+        app.state.gate.set()
+        await call
+        body = b"".join(m.get("body", b"") for m in sent[1:])
+        assert gzip.decompress(body).decode() == "".join(LINES)
+
+    @pytest.mark.asyncio
+    async def test_cpu_budget_exhausted(self):
+        app = _create_app(cpu_budget=0.0)
+        sent = await _call(app, "/big")
+        assert "content-encoding" not in _headers(sent[0])
+        assert _headers(sent[0])["vary"] == "Accept-Encoding"
+        assert sent[1]["body"].decode() == BIG_TEXT
+
+    @pytest.mark.asyncio
+    async def test_metrics_recorded(self):
+        bytes_total = REGISTRY.get("llm_hub_response_compression_bytes_total")
+        ratio = REGISTRY.get("llm_hub_response_compression_ratio").labels("gzip")
+        bytes_in = bytes_total.labels("gzip", "in").value
+        observed = ratio.count
+
+        await _call(_create_app(), "/big")
+
+        assert bytes_total.labels("gzip", "in").value - bytes_in == len(BIG_TEXT)
+        assert ratio.count == observed + 1
+        assert ratio.sum > 10
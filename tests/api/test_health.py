@@ -51,3 +51,23 @@ class TestHealthEndpoints:
         for provider, status in data.items():
             if status:
                 assert "valid" in status
+
+    @pytest.mark.asyncio
+    async def test_health_served_from_cache(self, client, mock_providers, monkeypatch):
+        """GET /health/detailed and /health/tokens - Providers are probed once, not per request"""
+        calls = []
+        health_check = mock_providers["claude"].health_check
+
+        async def counting_health_check():
+            calls.append(1)
+            return await health_check()
+
+        monkeypatch.setattr(mock_providers["claude"], "health_check", counting_health_check)
+
+        for _ in range(3):
+            assert (await client.get("/health/detailed")).status_code == 200
+            assert (await client.get("/health/tokens")).status_code == 200
+
+        assert len(calls) == 1
+        component = (await client.get("/health/detailed")).json()["components"]["claude"]
+        assert component["last_success"] is not None
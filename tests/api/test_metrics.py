@@ -0,0 +1,88 @@
+"""Tests for the Prometheus metrics endpoint"""
+import re
+
+import pytest
+
+
+def _sample(text: str, name: str, **labels: str) -> float:
+    """Value of one sample in exposition text (0 if absent)"""
+    label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    pattern = re.escape(f"{name}{{{label_text}}}" if labels else name) + r" (\S+)"
+    match = re.search(f"^{pattern}$", text, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+class TestMetricsEndpoint:
+    """Test /metrics endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_exposition_format(self, client):
+        response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE llm_hub_chat_duration_seconds histogram" in response.text
+        assert "# TYPE llm_hub_errors_total counter" in response.text
+
+    @pytest.mark.asyncio
+    async def test_chat_pipeline_metrics(self, client):
+        before = (await client.get("/metrics")).text
+        labels = {"provider": "claude", "model": "claude-sonnet-4-5-20250929"}
+
+        session_id = (await client.post("/v1/sessions", json={"provider": "claude"})).json()["session_id"]
+        await client.post(
+            "/v1/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hi"}], "provider": "claude", "model": "sonnet"},
+            headers={"X-Session-ID": session_id},
+        )
+        await client.post(
+            "/v1/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hi"}], "provider": "claude", "model": "sonnet", "stream": True},
+        )
+        await client.post(
+            "/v1/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hi"}], "provider": "claude", "model": "bogus"},
+        )
+        after = (await client.get("/metrics")).text
+
+        def delta(name: str, **labels: str) -> float:
+            return _sample(after, name, **labels) - _sample(before, name, **labels)
+
+        assert delta("llm_hub_chat_duration_seconds_count", **labels) == 1
+        assert delta("llm_hub_stream_duration_seconds_count", **labels) == 1
+        assert delta("llm_hub_time_to_first_token_seconds_count", **labels) == 1
+        assert delta("llm_hub_admission_wait_seconds_count", **labels) == 2
+        assert delta("llm_hub_errors_total", code="INVALID_MODEL") == 1
+        for operation in ("create", "get_header", "get", "update"):
+            assert delta("llm_hub_session_store_operations_total", operation=operation) >= 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_models_are_not_labels(self, client):
+        response = await client.post(
+            "/v1/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hi"}], "provider": "claude", "model": "junk-1"},
+        )
+        assert response.json()["detail"]["code"] == "INVALID_MODEL"
+
+        # A stream reports the error as an event
+        response = await client.post(
+            "/v1/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hi"}], "provider": "claude", "model": "junk-2", "stream": True},
+        )
+        assert "INVALID_MODEL" in response.text
+
+        assert "junk-" not in (await client.get("/metrics")).text
+
+    @pytest.mark.asyncio
+    async def test_etag_cache_lookups(self, client):
+        before = (await client.get("/metrics")).text
+        etag = (await client.get("/v1/providers")).headers["etag"]
+        await client.get("/v1/providers", headers={"If-None-Match": etag})
+        await client.get("/v1/providers", headers={"If-None-Match": 'W/"stale"'})
+        after = (await client.get("/metrics")).text
+
+        for result in ("hit", "miss"):
+            labels = {"cache": "etag", "result": result}
+            assert _sample(after, "llm_hub_cache_lookups_total", **labels) - _sample(
+                before, "llm_hub_cache_lookups_total", **labels
+            ) == 1
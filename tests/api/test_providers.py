@@ -105,3 +105,26 @@ class TestProviderEndpoints:
         assert response.status_code == 404
         data = response.json()
         assert data["detail"]["code"] == "PROVIDER_NOT_FOUND"
+
+    @pytest.mark.asyncio
+    async def test_list_providers_not_modified(self, client):
+        """GET /v1/providers - If-None-Match with the current ETag gets 304"""
+        response = await client.get("/v1/providers")
+        etag = response.headers["etag"]
+
+        response = await client.get("/v1/providers", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+        response = await client.get("/v1/providers", headers={"If-None-Match": 'W/"stale"'})
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_get_provider_not_modified(self, client):
+        """GET /v1/providers/claude - ETag differs per provider"""
+        claude = (await client.get("/v1/providers/claude")).headers["etag"]
+        gemini = (await client.get("/v1/providers/gemini")).headers["etag"]
+        assert claude != gemini
+
+        response = await client.get("/v1/providers/claude", headers={"If-None-Match": claude})
+        assert response.status_code == 304
@@ -0,0 +1,152 @@
+"""Tests for in-flight request API endpoints"""
+import asyncio
+import json
+
+import pytest
+
+from llm_mcp_hub.core.exceptions import RequestIdInUseError
+from llm_mcp_hub.services import RequestRegistry
+
+
+@pytest.fixture
+def hanging_claude(mock_providers, monkeypatch):
+    """Claude mock that hangs until cancelled; records cleanup"""
+    state = {"stopped": False}
+
+    async def chat(prompt, **kwargs):
+        try:
+            await asyncio.sleep(3600)
+        finally:
+            state["stopped"] = True
+
+    async def chat_stream(prompt, **kwargs):
+        try:
+            yield "partial "
+            await asyncio.sleep(3600)
+        finally:
+            state["stopped"] = True
+
+    monkeypatch.setattr(mock_providers["claude"], "chat", chat)
+    monkeypatch.setattr(mock_providers["claude"], "chat_stream", chat_stream)
+    return state
+
+
+async def _wait_in_flight(client, count: int = 1) -> list[dict]:
+    for _ in range(200):
+        response = await client.get("/v1/requests")
+        if len(response.json()) >= count:
+            return response.json()
+        await asyncio.sleep(0.01)
+    raise AssertionError("request never became in flight")
+
+
+class TestRequestEndpoints:
+    """Test /v1/requests endpoints"""
+
+    @pytest.mark.asyncio
+    async def test_list_empty(self, client):
+        response = await client.get("/v1/requests")
+        assert response.status_code == 200
+        assert response.json() == []
+
+    @pytest.mark.asyncio
+    async def test_cancel_unknown_request(self, client):
+        response = await client.delete("/v1/requests/req_missing")
+        assert response.status_code == 404
+        assert response.json()["detail"]["code"] == "REQUEST_NOT_FOUND"
+
+    @pytest.mark.asyncio
+    async def test_completion_returns_request_id(self, client):
+        response = await client.post(
+            "/v1/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hi"}]},
+            headers={"X-Request-ID": "my-request"},
+        )
+        assert response.status_code == 200
+        assert response.headers["x-request-id"] == "my-request"
+
+        response = await client.post("/v1/chat/completions", json={"messages": [{"role": "user", "content": "Hi"}]})
+        assert response.headers["x-request-id"].startswith("req_")
+
+    @pytest.mark.asyncio
+    async def test_cancel_completion(self, client, chat_service, hanging_claude):
+        pending = asyncio.create_task(
+            client.post(
+                "/v1/chat/completions",
+                json={"messages": [{"role": "user", "content": "Hi"}], "provider": "claude"},
+                headers={"X-Request-ID": "long-run"},
+            )
+        )
+        in_flight = await _wait_in_flight(client)
+        assert in_flight[0]["request_id"] == "long-run"
+        assert in_flight[0]["stream"] is False
+        assert chat_service._admission.in_flight("claude") == 1
+
+        response = await client.delete("/v1/requests/long-run")
+        assert response.status_code == 200
+        assert response.json() == {"request_id": "long-run", "cancelled": True}
+
+        cancelled = await asyncio.wait_for(pending, 5)
+        assert cancelled.status_code == 409
+        assert cancelled.json()["detail"]["code"] == "REQUEST_CANCELLED"
+        assert hanging_claude["stopped"]
+        assert chat_service._admission.in_flight("claude") == 0
+        assert (await client.get("/v1/requests")).json() == []
+
+    @pytest.mark.asyncio
+    async def test_cancel_stream(self, client, chat_service, hanging_claude):
+        pending = asyncio.create_task(
+            client.post(
+                "/v1/chat/completions",
+                json={"messages": [{"role": "user", "content": "Hi"}], "stream": True},
+                headers={"X-Request-ID": "long-stream"},
+            )
+        )
+        in_flight = await _wait_in_flight(client)
+        assert in_flight[0]["stream"] is True
+
+        response = await client.delete("/v1/requests/long-stream")
+        assert response.status_code == 200
+
+        streamed = await asyncio.wait_for(pending, 5)
+        assert streamed.headers["x-request-id"] == "long-stream"
+        last = json.loads(streamed.text.strip().split("\n\n")[-1].split("data: ", 1)[1])
+        assert last["type"] == "error"
+        assert last["code"] == "REQUEST_CANCELLED"
+        assert hanging_claude["stopped"]
+        assert chat_service._admission.in_flight("claude") == 0
+
+    @pytest.mark.asyncio
+    async def test_duplicate_request_id_rejected(self, client, hanging_claude):
+        pending = asyncio.create_task(
+            client.post(
+                "/v1/chat/completions",
+                json={"messages": [{"role": "user", "content": "Hi"}]},
+                headers={"X-Request-ID": "same"},
+            )
+        )
+        await _wait_in_flight(client)
+
+        response = await client.post(
+            "/v1/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hi"}]},
+            headers={"X-Request-ID": "same"},
+        )
+        assert response.status_code == 409
+        assert response.json()["detail"]["code"] == "REQUEST_ID_IN_USE"
+
+        await client.delete("/v1/requests/same")
+        await asyncio.wait_for(pending, 5)
+
+    @pytest.mark.asyncio
+    async def test_registry_claims_ids(self):
+        registry = RequestRegistry()
+        first = await registry.register("claimed")
+
+        with pytest.raises(RequestIdInUseError):
+            await registry.register("claimed")
+
+        await registry.unregister(first)
+        await registry.unregister(first)
+        assert registry.get("claimed") is None
+        assert (await registry.register("claimed")) is not first
@@ -0,0 +1,124 @@
+"""Tests for resumable SSE streams"""
+import asyncio
+import json
+
+import pytest
+
+
+def _frames(body: str) -> list[tuple[int | None, dict]]:
+    """Parse SSE frames into (id, data) pairs"""
+    frames = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n") if not line.startswith(":"))
+        if "data" in fields:
+            frames.append((int(fields["id"]) if "id" in fields else None, json.loads(fields["data"])))
+    return frames
+
+
+def _text(frames) -> str:
+    return "".join(data["text"] for _, data in frames if data["type"] == "content")
+
+
+STREAM_REQUEST = {
+    "messages": [{"role": "user", "content": "Hi"}],
+    "stream": True,
+    "stream_options": {"resumable": True, "flush_interval_ms": 0},
+}
+
+
+@pytest.fixture
+def gated_stream(mock_providers, monkeypatch):
+    """Claude mock stream that waits for a gate halfway; records completion"""
+    state = {"gate": asyncio.Event(), "finished": False}
+
+    async def chat_stream(prompt, **kwargs):
+        yield "first "
+        await state["gate"].wait()
+        yield "second"
+        state["finished"] = True
+
+    monkeypatch.setattr(mock_providers["claude"], "chat_stream", chat_stream)
+    return state
+
+
+class TestResumableStreams:
+    @pytest.mark.asyncio
+    async def test_frames_carry_event_ids(self, client):
+        response = await client.post("/v1/chat/completions", json=STREAM_REQUEST, headers={"X-Request-ID": "r1"})
+        assert response.status_code == 200
+        frames = _frames(response.text)
+        assert [frame_id for frame_id, _ in frames] == [1, 2, 3, 4, 5]
+        assert _text(frames) == "Mock Claude streaming response"
+        assert frames[-1][1]["type"] == "done"
+
+    @pytest.mark.asyncio
+    async def test_resume_after_last_event_id(self, client):
+        await client.post("/v1/chat/completions", json=STREAM_REQUEST, headers={"X-Request-ID": "r2"})
+
+        response = await client.get("/v1/chat/streams/r2", headers={"Last-Event-ID": "2"})
+        assert response.status_code == 200
+        frames = _frames(response.text)
+        assert _text(frames) == "streaming response"
+        assert frames[-1][0] == 5
+
+        # Re-issuing the same request with Last-Event-ID resumes instead of running again
+        response = await client.post(
+            "/v1/chat/completions",
+            json=STREAM_REQUEST,
+            headers={"X-Request-ID": "r2", "Last-Event-ID": "4"},
+        )
+        frames = _frames(response.text)
+        assert [frame_id for frame_id, _ in frames] == [5]
+
+    @pytest.mark.asyncio
+    async def test_unknown_stream(self, client):
+        response = await client.get("/v1/chat/streams/missing", headers={"Last-Event-ID": "1"})
+        assert response.status_code == 410
+        assert response.json()["detail"]["code"] == "STREAM_NOT_RESUMABLE"
+
+    @pytest.mark.asyncio
+    async def test_request_id_cannot_be_reused(self, client):
+        await client.post("/v1/chat/completions", json=STREAM_REQUEST, headers={"X-Request-ID": "r3"})
+        response = await client.post("/v1/chat/completions", json=STREAM_REQUEST, headers={"X-Request-ID": "r3"})
+        assert response.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_provider_keeps_running_when_client_drops(self, client, test_app, session_store, gated_stream):
+        session = (await client.post("/v1/sessions", json={"provider": "claude"})).json()
+        dropped = asyncio.create_task(
+            client.post(
+                "/v1/chat/completions",
+                json=STREAM_REQUEST,
+                headers={"X-Request-ID": "r4", "X-Session-ID": session["session_id"]},
+            )
+        )
+        while test_app.state.request_registry.get("r4") is None:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        dropped.cancel()
+        await asyncio.gather(dropped, return_exceptions=True)
+        # The producer is kept on app state so shutdown can stop it
+        assert len(test_app.state.stream_recorders) == 1
+
+        gated_stream["gate"].set()
+        response = await client.get("/v1/chat/streams/r4", headers={"Last-Event-ID": "1"})
+        frames = _frames(response.text)
+        assert _text(frames) == "second"
+        assert frames[-1][1]["type"] == "done"
+        assert gated_stream["finished"]
+
+        stored = await session_store.get(session["session_id"])
+        assert stored.messages[-1].content == "first second"
+        assert not stored.messages[-1].metadata.get("aborted")
+
+    @pytest.mark.asyncio
+    async def test_cancel_resumable_stream(self, client, test_app, gated_stream):
+        pending = asyncio.create_task(
+            client.post("/v1/chat/completions", json=STREAM_REQUEST, headers={"X-Request-ID": "r5"})
+        )
+        while test_app.state.request_registry.get("r5") is None:
+            await asyncio.sleep(0.01)
+
+        assert (await client.delete("/v1/requests/r5")).status_code == 200
+        frames = _frames((await asyncio.wait_for(pending, 5)).text)
+        assert frames[-1][1]["code"] == "REQUEST_CANCELLED"
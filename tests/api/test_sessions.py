@@ -1,4 +1,6 @@
 """Tests for Session API endpoints"""
+import json
+
 import pytest
 
 
@@ -147,6 +149,76 @@ class TestSessionEndpoints:
         data = response.json()
         assert data["detail"]["code"] == "SESSION_NOT_FOUND"
 
+    @pytest.mark.asyncio
+    async def test_list_sessions(self, client):
+        """GET /v1/sessions - List sessions with message counts"""
+        create_response = await client.post(
+            "/v1/sessions",
+            json={"provider": "claude"}
+        )
+        session_id = create_response.json()["session_id"]
+
+        await client.post(
+            "/v1/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hello!"}]},
+            headers={"X-Session-ID": session_id},
+        )
+
+        response = await client.get("/v1/sessions")
+
+        assert response.status_code == 200
+        data = response.json()
+        items = {item["session_id"]: item for item in data["sessions"]}
+        assert items[session_id]["message_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_get_session_not_modified(self, client, session_service, monkeypatch):
+        """GET /v1/sessions/{session_id} - If-None-Match answered from the header"""
+        create_response = await client.post("/v1/sessions", json={"provider": "claude"})
+        session_id = create_response.json()["session_id"]
+
+        response = await client.get(f"/v1/sessions/{session_id}")
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+
+        async def no_full_load(session_id):
+            raise AssertionError("conditional GET must not load the session")
+
+        monkeypatch.setattr(session_service, "get_session", no_full_load)
+        response = await client.get(f"/v1/sessions/{session_id}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+        monkeypatch.undo()
+
+        await client.post(
+            "/v1/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hello!"}]},
+            headers={"X-Session-ID": session_id},
+        )
+        response = await client.get(f"/v1/sessions/{session_id}", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_list_sessions_not_modified(self, client):
+        """GET /v1/sessions - ETag changes when a listed session changes"""
+        await client.post("/v1/sessions", json={"provider": "claude"})
+
+        response = await client.get("/v1/sessions")
+        etag = response.headers["etag"]
+
+        response = await client.get("/v1/sessions", headers={"If-None-Match": f'"other", {etag}'})
+        assert response.status_code == 304
+
+        response = await client.get("/v1/sessions?limit=10", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+        await client.post("/v1/sessions", json={"provider": "gemini"})
+        response = await client.get("/v1/sessions", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.json()["sessions"]) == 2
+
     @pytest.mark.asyncio
     async def test_delete_session(self, client):
         """DELETE /v1/sessions/{session_id} - Delete session"""
@@ -279,3 +351,143 @@ class TestSessionEndpoints:
         response = await client.get("/v1/sessions/nonexistent-id/memory")
 
         assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_stream_session_memory(self, client, session_service, memory_service):
+        """GET /v1/sessions/{session_id}/memory/stream - Markdown matches full export"""
+        session = await session_service.create_session(provider="claude", system_prompt="Be brief")
+        session.add_user_message("What is FastAPI?")
+        session.add_assistant_message("A web framework.")
+        await session_service.update_session(session)
+
+        response = await client.get(f"/v1/sessions/{session.id}/memory/stream")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/markdown")
+        assert "content-length" not in response.headers
+        assert response.text == memory_service._format_full_conversation(session)
+
+    @pytest.mark.asyncio
+    async def test_stream_session_memory_ndjson(self, client, session_service):
+        """GET /v1/sessions/{session_id}/memory/stream - NDJSON lines"""
+        session = await session_service.create_session(provider="claude")
+        session.add_user_message("hello")
+        session.add_assistant_message("hi")
+        await session_service.update_session(session)
+
+        response = await client.get(
+            f"/v1/sessions/{session.id}/memory/stream",
+            params={"format": "ndjson"},
+        )
+
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["type"] == "session"
+        assert lines[0]["message_count"] == 2
+        assert [(line["role"], line["content"]) for line in lines[1:]] == [("user", "hello"), ("assistant", "hi")]
+
+    @pytest.mark.asyncio
+    async def test_stream_memory_nonexistent_session(self, client):
+        """GET /v1/sessions/{session_id}/memory/stream - Session not found"""
+        response = await client.get("/v1/sessions/nonexistent-id/memory/stream")
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_upload_session_file(self, client, session_service):
+        """PUT /v1/sessions/{session_id}/files/{name} - Stream reference file"""
+        create_response = await client.post(
+            "/v1/sessions",
+            json={"provider": "claude"}
+        )
+        session_id = create_response.json()["session_id"]
+
+        async def body():
+            yield b"# Spec\n"
+            yield "한글 내용".encode("utf-8")
+
+        response = await client.put(f"/v1/sessions/{session_id}/files/spec.md", content=body())
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["name"] == "spec.md"
+        assert data["size"] == len("# Spec\n한글 내용".encode("utf-8"))
+        assert data["total_bytes"] == data["size"]
+
+        session = await session_service.get_session(session_id)
+        await session_service.resolve_context(session)
+        assert "## spec.md\n# Spec\n한글 내용" in session._build_system_prompt()
+
+    @pytest.mark.asyncio
+    async def test_upload_session_file_replaces(self, client):
+        """PUT /v1/sessions/{session_id}/files/{name} - Same name replaces file"""
+        create_response = await client.post(
+            "/v1/sessions",
+            json={"provider": "claude"}
+        )
+        session_id = create_response.json()["session_id"]
+
+        await client.put(f"/v1/sessions/{session_id}/files/a.txt", content=b"first version")
+        response = await client.put(f"/v1/sessions/{session_id}/files/a.txt", content=b"v2")
+
+        assert response.status_code == 200
+        assert response.json()["total_bytes"] == 2
+
+    @pytest.mark.asyncio
+    async def test_upload_session_file_quota(self, client, session_service):
+        """PUT /v1/sessions/{session_id}/files/{name} - Quota exceeded"""
+        session_service._max_context_bytes = 8
+        create_response = await client.post(
+            "/v1/sessions",
+            json={"provider": "claude"}
+        )
+        session_id = create_response.json()["session_id"]
+
+        response = await client.put(f"/v1/sessions/{session_id}/files/big.txt", content=b"x" * 9)
+
+        assert response.status_code == 413
+        assert response.json()["detail"]["code"] == "CONTEXT_QUOTA_EXCEEDED"
+
+    @pytest.mark.asyncio
+    async def test_upload_session_file_invalid_utf8(self, client):
+        """PUT /v1/sessions/{session_id}/files/{name} - Binary content rejected"""
+        create_response = await client.post(
+            "/v1/sessions",
+            json={"provider": "claude"}
+        )
+        session_id = create_response.json()["session_id"]
+
+        response = await client.put(f"/v1/sessions/{session_id}/files/a.bin", content=b"\xff\xfe")
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_upload_file_nonexistent_session(self, client):
+        """PUT /v1/sessions/{session_id}/files/{name} - Session not found"""
+        response = await client.put("/v1/sessions/nonexistent-id/files/a.txt", content=b"a")
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_bulk_export(self, client, session_service):
+        """POST /v1/sessions/export - NDJSON progress stream"""
+        session = await session_service.create_session(provider="claude")
+        session.add_user_message("hello")
+        await session_service.update_session(session)
+
+        response = await client.post(
+            "/v1/sessions/export",
+            json={"compression": "none", "filter": {"provider": "claude"}},
+        )
+
+        assert response.status_code == 200
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [e["type"] for e in events] == ["start", "session", "done"]
+        assert events[1]["session_id"] == session.id
+
+    @pytest.mark.asyncio
+    async def test_bulk_export_directory_requires_config(self, client):
+        """POST /v1/sessions/export - Directory output needs export_dir"""
+        response = await client.post("/v1/sessions/export", json={"output": "directory"})
+
+        assert response.status_code == 400
@@ -0,0 +1,149 @@
+"""Tests for SSE stream encoding"""
+import asyncio
+import json
+
+import pytest
+
+from llm_mcp_hub.api.v1.streaming import encode_sse, stop_on_disconnect
+
+
+async def _events(*items, delay=0.0):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+async def _frames(events, **kwargs):
+    return [frame async for frame in encode_sse(events, **kwargs)]
+
+
+def _data(frame: str) -> dict:
+    return json.loads(frame.split("data: ", 1)[1])
+
+
+class TestEncodeSSE:
+    @pytest.mark.asyncio
+    async def test_coalesces_ready_chunks(self):
+        events = _events(*({"type": "content", "text": c} for c in "abc"), {"type": "done", "model": "m"})
+
+        frames = await _frames(events)
+
+        assert frames[0].startswith("event: message\n")
+        assert _data(frames[0]) == {"type": "content", "text": "abc"}
+        assert frames[1].startswith("event: done\n")
+        assert _data(frames[1]) == {"type": "done", "model": "m"}
+
+    @pytest.mark.asyncio
+    async def test_size_limit_forces_frame(self):
+        events = _events(*({"type": "content", "text": "xx"} for _ in range(4)))
+
+        frames = await _frames(events, max_chunk_bytes=4)
+
+        assert [_data(f)["text"] for f in frames] == ["xxxx", "xxxx"]
+
+    @pytest.mark.asyncio
+    async def test_size_limit_counts_bytes(self):
+        events = _events(*({"type": "content", "text": "한"} for _ in range(4)))
+
+        frames = await _frames(events, max_chunk_bytes=6)
+
+        assert [_data(f)["text"] for f in frames] == ["한한", "한한"]
+
+    @pytest.mark.asyncio
+    async def test_slow_reader_stops_pump(self):
+        pulled = 0
+
+        async def source():
+            nonlocal pulled
+            for _ in range(1000):
+                pulled += 1
+                yield {"type": "status"}
+
+        stream = encode_sse(source())
+        await anext(stream)
+        await asyncio.sleep(0.01)
+
+        assert pulled < 100
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_zero_interval_sends_every_chunk(self):
+        events = _events(*({"type": "content", "text": c} for c in "ab"))
+
+        frames = await _frames(events, flush_interval=0)
+
+        assert [_data(f)["text"] for f in frames] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_window_flushes_slow_chunks(self):
+        events = _events({"type": "content", "text": "a"}, {"type": "content", "text": "b"}, delay=0.05)
+
+        frames = await _frames(events, flush_interval=0.01)
+
+        assert [_data(f)["text"] for f in frames] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_keepalive_when_idle(self):
+        events = _events({"type": "done"}, delay=0.05)
+
+        frames = await _frames(events, keepalive=0.01)
+
+        assert frames[0] == ": keepalive\n\n"
+        assert frames[-1].startswith("event: done\n")
+
+    @pytest.mark.asyncio
+    async def test_unicode_and_escapes(self):
+        text = '한글 "quoted"\nline'
+        frames = await _frames(_events({"type": "content", "text": text}))
+
+        assert "한글" in frames[0]
+        assert frames[0].count("\n") == 3
+        assert _data(frames[0])["text"] == text
+
+    @pytest.mark.asyncio
+    async def test_source_error_propagates(self):
+        async def failing():
+            yield {"type": "content", "text": "a"}
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await _frames(failing())
+
+
+class _Request:
+    """Minimal request whose client disconnects after a delay"""
+
+    def __init__(self, delay: float):
+        self._delay = delay
+
+    async def receive(self):
+        await asyncio.sleep(self._delay)
+        return {"type": "http.disconnect"}
+
+
+class TestStopOnDisconnect:
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_stream(self):
+        cleaned_up = asyncio.Event()
+
+        async def frames():
+            try:
+                yield "first"
+                await asyncio.sleep(3600)
+                yield "never"
+            finally:
+                cleaned_up.set()
+
+        relayed = [f async for f in stop_on_disconnect(_Request(0.01), frames())]
+
+        assert relayed == ["first"]
+        assert cleaned_up.is_set()
+
+    @pytest.mark.asyncio
+    async def test_connected_stream_is_relayed(self):
+        async def frames():
+            for frame in ("a", "b"):
+                yield frame
+
+        assert [f async for f in stop_on_disconnect(_Request(3600), frames())] == ["a", "b"]
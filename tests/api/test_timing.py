@@ -0,0 +1,96 @@
+"""Tests for Server-Timing headers and the access log"""
+import json
+import logging
+import re
+
+import pytest
+
+from llm_mcp_hub.api.timing import access_logger
+
+
+def _server_timing(header: str) -> dict[str, float]:
+    """Parse a Server-Timing header into phase durations"""
+    phases = {}
+    for entry in header.split(","):
+        name, _, duration = entry.strip().partition(";dur=")
+        phases[name] = float(duration)
+    return phases
+
+
+class _Lines(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(record.getMessage())
+
+
+@pytest.fixture
+def access_log():
+    handler = _Lines()
+    level = access_logger.level
+    access_logger.addHandler(handler)
+    access_logger.setLevel(logging.INFO)
+    yield handler.lines
+    access_logger.removeHandler(handler)
+    access_logger.setLevel(level)
+
+
+class TestServerTiming:
+    """Test per-request phase timings"""
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_phases(self, client, access_log):
+        session_id = (await client.post("/v1/sessions", json={"provider": "claude"})).json()["session_id"]
+
+        response = await client.post(
+            "/v1/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hi"}], "model": "sonnet"},
+            headers={"X-Session-ID": session_id, "X-Request-ID": "req-timing"},
+        )
+
+        assert response.status_code == 200
+        phases = _server_timing(response.headers["server-timing"])
+        assert {"validation", "session_load", "queue_wait", "store_write", "total"} <= set(phases)
+        assert all(duration >= 0 for duration in phases.values())
+
+        entry = json.loads(access_log[-1])
+        assert entry["request_id"] == "req-timing"
+        assert entry["method"] == "POST"
+        assert entry["path"] == "/v1/chat/completions"
+        assert entry["status"] == 200
+        assert entry["session_id"] == session_id
+        assert entry["provider"] == "claude"
+        assert entry["model"] == "claude-sonnet-4-5-20250929"
+        assert entry["bytes"] == len(response.content)
+        assert {"first_byte", "total"} <= set(entry["timings_ms"])
+
+    @pytest.mark.asyncio
+    async def test_stream_done_event_has_timings(self, client, access_log):
+        response = await client.post(
+            "/v1/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hi"}], "provider": "claude", "stream": True},
+        )
+
+        # The header only has phases finished before the stream started
+        assert "validation" in _server_timing(response.headers["server-timing"])
+
+        done = re.search(r"^event: done\ndata: (.+)$", response.text, re.MULTILINE)
+        timings = json.loads(done.group(1))["timings_ms"]
+        assert {"validation", "session_load", "queue_wait", "first_byte", "total"} <= set(timings)
+        assert timings["first_byte"] <= timings["total"]
+
+        entry = json.loads(access_log[-1])
+        assert entry["request_id"] == response.headers["x-request-id"]
+        assert entry["timings_ms"]["total"] >= timings["total"]
+
+    @pytest.mark.asyncio
+    async def test_failed_request_is_logged(self, client, access_log):
+        response = await client.get("/v1/sessions/missing")
+
+        assert response.status_code == 404
+        assert "total" in _server_timing(response.headers["server-timing"])
+        entry = json.loads(access_log[-1])
+        assert entry["status"] == 404
+        assert entry["path"] == "/v1/sessions/missing"
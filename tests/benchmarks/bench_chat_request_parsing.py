@@ -0,0 +1,86 @@
+"""
+Chat request parsing benchmark
+
+Compares parsing a large chat completion body the previous way (json.loads
+into dicts, pydantic validation, model_dump of every message, two scans
+for user and system messages) with the current path (validation straight
+from bytes and a single scan). Response serialization is compared too:
+FastAPI's re-validation and json.dumps against model_dump_json.
+
+Usage:
+    python tests/benchmarks/bench_chat_request_parsing.py [--size-mb 1] [--message-size 512]
+"""
+import argparse
+import json
+import time
+
+from fastapi.encoders import jsonable_encoder
+
+from llm_mcp_hub.api.v1.schemas import ChatCompletionRequest, ChatCompletionResponse
+
+
+def _body(size: int, message_size: int) -> bytes:
+    text = "lorem ipsum dolor sit amet " * (message_size // 27 + 1)
+    messages = [{"role": "system", "content": "You are helpful."}]
+    roles = ("user", "assistant")
+    while sum(len(m["content"]) for m in messages) < size:
+        messages.append({"role": roles[len(messages) % 2], "content": text[:message_size]})
+    messages.append({"role": "user", "content": "Summarize the conversation."})
+    return json.dumps({"messages": messages, "provider": "claude", "stream": False}).encode()
+
+
+def _previous(body: bytes) -> tuple[str, str | None]:
+    """json.loads, validation, model_dump and two scans"""
+    request = ChatCompletionRequest.model_validate(json.loads(body))
+    if not [m for m in request.messages if m.role == "user"]:
+        raise ValueError("no user message")
+    messages = [m.model_dump() for m in request.messages]
+    user_messages = [m for m in messages if m.get("role") == "user"]
+    system_messages = [m for m in messages if m.get("role") == "system"]
+    return user_messages[-1]["content"], system_messages[0]["content"] if system_messages else None
+
+
+def _current(body: bytes) -> tuple[str, str | None]:
+    """Validation from bytes and a single scan"""
+    return ChatCompletionRequest.model_validate_json(body).prompts()
+
+
+def _time(fn, arg, repeat: int) -> float:
+    fn(arg)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(arg)
+    return (time.perf_counter() - start) / repeat
+
+
+def run(size_mb: float, message_size: int, repeat: int) -> None:
+    body = _body(int(size_mb * 1024 * 1024), message_size)
+    assert _previous(body) == _current(body)
+    count = len(json.loads(body)["messages"])
+    print(f"Body {len(body) / 1024 / 1024:.2f} MB, {count:,} messages of ~{message_size} B\n")
+
+    print(f"  {'request parsing':<28} {'ms/request':>10} {'MB/s':>8}")
+    for name, fn in (("previous", _previous), ("current", _current)):
+        seconds = _time(fn, body, repeat)
+        print(f"  {name:<28} {seconds * 1e3:>10.2f} {len(body) / 1024 / 1024 / seconds:>8.1f}")
+
+    result = ChatCompletionResponse(response="x" * len(body), session_id=None, provider="claude", model="sonnet")
+    print(f"\n  {'response serialization':<28} {'ms/response':>10}")
+    for name, fn in (
+        ("previous", lambda r: json.dumps(jsonable_encoder(ChatCompletionResponse.model_validate(r))).encode()),
+        ("current", lambda r: r.model_dump_json().encode()),
+    ):
+        print(f"  {name:<28} {_time(fn, result, repeat) * 1e3:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=1.0, help="Approximate body size in MB")
+    parser.add_argument("--message-size", type=int, default=512, help="Characters per message")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed iterations per variant")
+    args = parser.parse_args()
+    run(args.size_mb, args.message_size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
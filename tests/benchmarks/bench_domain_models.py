@@ -0,0 +1,125 @@
+"""
+Domain model benchmark
+
+Compares memory per message and session decode/encode speed of the
+slotted Message/Session models against the previous pydantic models.
+
+Usage:
+    python tests/benchmarks/bench_domain_models.py [--messages 10000]
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from llm_mcp_hub.domain import Message, MessageRole, Session
+
+
+class LegacyMessage(BaseModel):
+    """Previous pydantic message model"""
+
+    role: MessageRole
+    content: str
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    metadata: dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LegacyMessage":
+        return cls(
+            role=MessageRole(data["role"]),
+            content=data["content"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            metadata=data.get("metadata", {}),
+        )
+
+
+class LegacySession(BaseModel):
+    """Previous pydantic session model (fields relevant to decoding)"""
+
+    id: str
+    provider: str
+    model: str
+    messages: list[LegacyMessage] = Field(default_factory=list)
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LegacySession":
+        return cls(
+            id=data["id"],
+            provider=data["provider"],
+            model=data["model"],
+            messages=[LegacyMessage.from_dict(m) for m in data.get("messages", [])],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+        )
+
+
+def _build_session(count: int) -> Session:
+    session = Session(provider="claude", model="claude-sonnet-4-5-20250929")
+    for i in range(count):
+        if i % 2:
+            session.add_assistant_message(f"Answer number {i} with a little bit of text in it.")
+        else:
+            session.add_user_message(f"Question number {i}?")
+    return session
+
+
+def _bytes_per_object(factory, count: int) -> float:
+    """Measure allocated bytes per object created by factory"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory(i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def _best_of(func, repeat: int = 5) -> float:
+    """Best wall time of func in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(count: int) -> None:
+    payload = json.dumps(_build_session(count).to_dict())
+    print(f"Session with {count:,} messages ({len(payload) / 1024:.0f} KB JSON)\n")
+
+    # Messages decoded from storage, as a store would hold them
+    records = json.loads(payload)["messages"]
+    print("Memory per decoded message (excluding content strings)")
+    legacy = _bytes_per_object(lambda i: LegacyMessage.from_dict(records[i]), count)
+    compact = _bytes_per_object(lambda i: Message.from_dict(records[i]), count)
+    print(f"  {'pydantic Message':<32} {legacy:>8.0f} B")
+    print(f"  {'slotted Message':<32} {compact:>8.0f} B")
+
+    print("\nDecode (json.loads + from_dict)")
+    legacy_t = _best_of(lambda: LegacySession.from_dict(json.loads(payload)))
+    compact_t = _best_of(lambda: Session.from_dict(json.loads(payload)))
+    print(f"  {'pydantic Session':<32} {legacy_t * 1e3:>8.1f} ms")
+    print(f"  {'slotted Session':<32} {compact_t * 1e3:>8.1f} ms  ({legacy_t / compact_t:.1f}x)")
+
+    print("\nRe-encode loaded session (to_dict + json.dumps)")
+    loaded = Session.from_dict(json.loads(payload))
+    encode_t = _best_of(lambda: json.dumps(loaded.to_dict()))
+    print(f"  {'slotted Session':<32} {encode_t * 1e3:>8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10_000, help="Messages per session")
+    args = parser.parse_args()
+    run(args.messages)
+
+
+if __name__ == "__main__":
+    main()
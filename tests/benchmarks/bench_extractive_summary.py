@@ -0,0 +1,88 @@
+"""
+Extractive summarizer benchmark
+
+Times the local TF-IDF/TextRank summarizer on a long synthetic session,
+with NumPy scoring (when installed) and with the pure-Python fallback.
+
+Usage:
+    python tests/benchmarks/bench_extractive_summary.py [--messages 10000]
+"""
+import argparse
+import random
+import time
+
+from llm_mcp_hub.domain import Message
+from llm_mcp_hub.services import memory
+from llm_mcp_hub.services.memory import ExtractiveSummarizer
+
+_TOPICS = [
+    "redis session storage", "provider timeout handling", "streaming responses", "docker deployment",
+    "oauth token refresh", "system prompt caching", "reference file uploads", "rate limits",
+    "gemini model selection", "memory compression levels", "health checks", "request cancellation",
+]
+_VERBS = ["configure", "debug", "measure", "document", "replace", "monitor", "explain", "optimize"]
+
+
+def _build_messages(count: int, seed: int = 0) -> list[Message]:
+    rng = random.Random(seed)
+    messages = []
+    for i in range(count):
+        topic = rng.choice(_TOPICS)
+        verb = rng.choice(_VERBS)
+        if i % 2:
+            text = (
+                f"To {verb} {topic}, start with the settings file. "
+                f"Step {i} covers {rng.choice(_TOPICS)} as well. "
+                f"Check the logs after each change to {topic}."
+            )
+            messages.append(Message.assistant(text))
+        else:
+            messages.append(Message.user(f"How should we {verb} {topic} for item {i}?"))
+    return messages
+
+
+def _best_of(func, repeat: int) -> float:
+    """Best wall time of func in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(count: int, repeat: int) -> None:
+    messages = _build_messages(count)
+    summarizer = ExtractiveSummarizer()
+    print(f"Session with {count:,} messages\n")
+
+    numpy_module = memory.np
+    if numpy_module is not None:
+        elapsed = _best_of(lambda: summarizer.summarize(messages, sentences=10, keywords=15), repeat)
+        print(f"  {'numpy scoring':<24} {elapsed * 1e3:>8.1f} ms")
+    else:
+        print(f"  {'numpy scoring':<24} {'(numpy not installed)':>8}")
+
+    memory.np = None
+    try:
+        elapsed = _best_of(lambda: summarizer.summarize(messages, sentences=10, keywords=15), repeat)
+        print(f"  {'pure-Python scoring':<24} {elapsed * 1e3:>8.1f} ms")
+    finally:
+        memory.np = numpy_module
+
+    sentences, keywords = summarizer.summarize(messages, sentences=5, keywords=10)
+    print(f"\nKeywords: {', '.join(keywords)}")
+    for sentence in sentences:
+        print(f"  - {sentence}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10_000, help="Messages per session")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per variant (best is reported)")
+    args = parser.parse_args()
+    run(args.messages, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+MemorySessionStore microbenchmark
+
+Measures listing, get and create latency with a large number of sessions,
+and compares listing against the previous copy-and-sort implementation.
+
+Usage:
+    python tests/benchmarks/bench_memory_session_store.py [--sessions 1000000]
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from llm_mcp_hub.domain import Session
+from llm_mcp_hub.infrastructure.session import MemorySessionStore
+
+
+def _timeit(label: str, func, repeat: int) -> None:
+    """Run func repeat times and print per-call latency"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<40} {elapsed / repeat * 1e6:>12.1f} us/op")
+
+
+async def _atimeit(label: str, func, repeat: int) -> None:
+    """Run coroutine function repeat times and print per-call latency"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<40} {elapsed / repeat * 1e6:>12.1f} us/op")
+
+
+async def run(count: int) -> None:
+    store = MemorySessionStore(ttl=3600)
+    base = datetime.utcnow()
+
+    print(f"Populating {count:,} sessions...")
+    start = time.perf_counter()
+    ids = []
+    for i in range(count):
+        session = Session(
+            provider="claude",
+            model="claude-sonnet-4-5-20250929",
+            created_at=base + timedelta(microseconds=i),
+        )
+        await store.create(session)
+        ids.append(session.id)
+    print(f"  populated in {time.perf_counter() - start:.1f}s\n")
+
+    print("Listing")
+    await _atimeit("list_sessions(limit=50)", lambda: store.list_sessions(limit=50), 1000)
+    await _atimeit(
+        "list_sessions(limit=50, offset=500000)",
+        lambda: store.list_sessions(limit=50, offset=min(500_000, count // 2)),
+        1000,
+    )
+
+    def legacy_list() -> list[Session]:
+        sessions = list(store._sessions.values())
+        sessions.sort(key=lambda s: s.created_at, reverse=True)
+        return sessions[:50]
+
+    _timeit("legacy copy+sort (limit=50)", legacy_list, 3)
+
+    print("\nPoint operations")
+    probe = ids[count // 2]
+    await _atimeit("get", lambda: store.get(probe), 100_000)
+    await _atimeit("exists", lambda: store.exists(probe), 100_000)
+
+    async def create_delete() -> None:
+        session = Session(provider="claude", model="claude-sonnet-4-5-20250929")
+        await store.create(session)
+        await store.delete(session.id)
+
+    await _atimeit("create + delete (newest)", create_delete, 10_000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=1_000_000, help="Number of sessions to populate")
+    args = parser.parse_args()
+    asyncio.run(run(args.sessions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+SSE encoder benchmark
+
+Streams a response delivered in small PTY-sized chunks and compares the
+previous one-frame-per-chunk encoding with the coalescing encoder. Every
+frame is written to a local socket (one send per frame, as the server does
+per ASGI body message); reported are frames, bytes and process CPU time.
+
+Usage:
+    python tests/benchmarks/bench_sse_encoder.py [--chunks 5000] [--chunk-size 256]
+"""
+import argparse
+import asyncio
+import json
+import socket
+import time
+
+from llm_mcp_hub.api.v1.streaming import encode_sse
+
+
+async def _source(chunks: int, chunk_size: int, interval: float):
+    text = "x" * chunk_size
+    for i in range(chunks):
+        yield {"type": "content", "text": text}
+        # PTY reads arrive in bursts; yield to the loop between chunks
+        await asyncio.sleep(interval if i % 8 == 7 else 0)
+    yield {"type": "done", "session_id": None, "provider": "gemini", "model": "gemini-2.5-pro"}
+
+
+async def _per_chunk(events):
+    """Previous encoding: json.dumps and one frame per chunk"""
+    async for event in events:
+        if event["type"] == "content":
+            data = {"type": "content", "text": event["text"]}
+            yield f"event: message\ndata: {json.dumps(data)}\n\n"
+        else:
+            yield f"event: done\ndata: {json.dumps(event)}\n\n"
+
+
+async def _measure(frames) -> tuple[int, int, float]:
+    loop = asyncio.get_running_loop()
+    writer, reader = socket.socketpair()
+    writer.setblocking(False)
+    reader.setblocking(False)
+
+    async def drain():
+        while await loop.sock_recv(reader, 65536):
+            pass
+
+    drainer = asyncio.create_task(drain())
+    count = size = 0
+    start = time.process_time()
+    async for frame in frames:
+        data = frame.encode("utf-8")
+        await loop.sock_sendall(writer, data)
+        count += 1
+        size += len(data)
+    elapsed = time.process_time() - start
+    writer.close()
+    await drainer
+    reader.close()
+    return count, size, elapsed
+
+
+async def run(chunks: int, chunk_size: int, interval: float) -> None:
+    print(f"{chunks:,} chunks of {chunk_size} B, burst interval {interval * 1e3:.1f} ms\n")
+    variants = [
+        ("per-chunk json.dumps", _per_chunk(_source(chunks, chunk_size, interval))),
+        ("coalescing 20 ms", encode_sse(_source(chunks, chunk_size, interval), flush_interval=0.02)),
+        ("coalescing 0 ms", encode_sse(_source(chunks, chunk_size, interval), flush_interval=0)),
+    ]
+    print(f"  {'variant':<24} {'frames':>8} {'bytes':>10} {'CPU ms':>8} {'us/chunk':>9}")
+    for name, frames in variants:
+        count, size, cpu = await _measure(frames)
+        print(f"  {name:<24} {count:>8,} {size:>10,} {cpu * 1e3:>8.1f} {cpu / chunks * 1e6:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=5000, help="Chunks per response")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Characters per chunk")
+    parser.add_argument("--interval", type=float, default=0.001, help="Seconds between chunk bursts")
+    args = parser.parse_args()
+    asyncio.run(run(args.chunks, args.chunk_size, args.interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,19 @@ from httpx import AsyncClient, ASGITransport
 from llm_mcp_hub.core.config import Settings
 from llm_mcp_hub.infrastructure.session import MemorySessionStore
 from llm_mcp_hub.infrastructure.providers.base import ProviderAdapter
-from llm_mcp_hub.services import ChatService, SessionService, MemoryService
+from llm_mcp_hub.services import (
+    BulkExporter,
+    ChatService,
+    HealthMonitor,
+    MemoryReplayLog,
+    MemoryService,
+    RequestRegistry,
+    SessionService,
+)
+from llm_mcp_hub.api.timing import TimingMiddleware
 from llm_mcp_hub.api.v1 import router as api_v1_router
 from llm_mcp_hub.api.v1.health import router as health_router
+from llm_mcp_hub.api.v1.metrics import router as metrics_router
 
 
 class MockClaudeAdapter(ProviderAdapter):
@@ -146,10 +156,12 @@ class MockGeminiAdapter(ProviderAdapter):
 def create_test_app() -> FastAPI:
     """Create test FastAPI application with mock providers"""
     app = FastAPI(title="LLM MCP Hub Test")
+    app.add_middleware(TimingMiddleware)
 
     # Include routers
     app.include_router(api_v1_router)
     app.include_router(health_router)
+    app.include_router(metrics_router)
 
     return app
 
@@ -221,6 +233,11 @@ def test_app(mock_settings, session_store, mock_providers, session_service, chat
     app.state.session_service = session_service
     app.state.chat_service = chat_service
     app.state.memory_service = memory_service
+    app.state.bulk_exporter = BulkExporter(session_service=session_service, memory_service=memory_service)
+    app.state.request_registry = RequestRegistry()
+    app.state.replay_log = MemoryReplayLog()
+    app.state.stream_recorders = set()
+    app.state.health_monitor = HealthMonitor(session_store, mock_providers)
 
     return app
 
@@ -0,0 +1,120 @@
+"""Tests for provider admission control"""
+import asyncio
+
+import pytest
+
+from llm_mcp_hub.services import AdmissionController
+
+
+class TestAdmissionController:
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self):
+        admission = AdmissionController(max_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def call():
+            nonlocal running, peak
+            async with admission.slot("claude"):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+        assert admission.in_flight("claude") == 0
+
+    @pytest.mark.asyncio
+    async def test_providers_are_independent(self):
+        admission = AdmissionController(max_concurrency=1, limits={"gemini": 2})
+        await admission.acquire("claude")
+        await asyncio.wait_for(admission.acquire("gemini"), timeout=1)
+        await asyncio.wait_for(admission.acquire("gemini"), timeout=1)
+
+        assert admission.in_flight("claude") == 1
+        assert admission.in_flight("gemini") == 2
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_fifo(self):
+        admission = AdmissionController(max_concurrency=1)
+        order = []
+        await admission.acquire("claude")
+
+        async def call(i):
+            async with admission.slot("claude"):
+                order.append(i)
+
+        tasks = [asyncio.create_task(call(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        admission.release("claude")
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        admission = AdmissionController(max_concurrency=1)
+        await admission.acquire("claude")
+
+        waiter = asyncio.create_task(admission.acquire("claude"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        admission.release("claude")
+
+        assert admission.in_flight("claude") == 0
+        assert admission.waiting("claude") == 0
+
+    @pytest.mark.asyncio
+    async def test_low_priority_leaves_reserve(self):
+        admission = AdmissionController(max_concurrency=3, reserve=1)
+        await admission.acquire("claude", low_priority=True)
+        await admission.acquire("claude", low_priority=True)
+
+        waiter = asyncio.create_task(admission.acquire("claude", low_priority=True))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        # Regular traffic still gets the reserved slot
+        await asyncio.wait_for(admission.acquire("claude"), timeout=1)
+        waiter.cancel()
+
+    @pytest.mark.asyncio
+    async def test_regular_waiters_go_first(self):
+        admission = AdmissionController(max_concurrency=2, reserve=0)
+        await admission.acquire("claude")
+        await admission.acquire("claude")
+        order = []
+
+        async def call(name, low_priority):
+            async with admission.slot("claude", low_priority):
+                order.append(name)
+
+        background = asyncio.create_task(call("background", True))
+        await asyncio.sleep(0)
+        regular = asyncio.create_task(call("regular", False))
+        await asyncio.sleep(0)
+        admission.release("claude")
+        await asyncio.gather(background, regular)
+
+        assert order == ["regular", "background"]
+
+    @pytest.mark.asyncio
+    async def test_unlimited_by_default(self):
+        admission = AdmissionController(low_priority_concurrency=2)
+        for _ in range(10):
+            await asyncio.wait_for(admission.acquire("claude"), timeout=1)
+        assert admission.in_flight("claude") == 10
+
+        # Background work still waits while calls are in flight
+        waiter = asyncio.create_task(admission.acquire("claude", low_priority=True))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        for _ in range(9):
+            admission.release("claude")
+        await asyncio.wait_for(waiter, timeout=1)
+        assert admission.in_flight("claude") == 2
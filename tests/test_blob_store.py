@@ -0,0 +1,214 @@
+"""Tests for blob store and blob-backed session context"""
+import pytest
+
+from llm_mcp_hub.infrastructure.blob import BlobStore, FileBlobStore, MemoryBlobStore
+from llm_mcp_hub.infrastructure.session import MemorySessionStore
+from llm_mcp_hub.services import SessionService
+
+
+@pytest.fixture(params=["memory", "file"])
+def blob_store(request, tmp_path) -> BlobStore:
+    if request.param == "memory":
+        return MemoryBlobStore()
+    return FileBlobStore(str(tmp_path / "blobs"))
+
+
+class TestBlobStore:
+    @pytest.mark.asyncio
+    async def test_put_and_get(self, blob_store):
+        digest = await blob_store.put(b"hello")
+        assert digest == BlobStore.digest(b"hello")
+        assert await blob_store.get(digest) == b"hello"
+
+    @pytest.mark.asyncio
+    async def test_get_many_skips_missing(self, blob_store):
+        digest = await blob_store.put(b"a")
+        assert await blob_store.get_many([digest, "missing"]) == {digest: b"a"}
+
+    @pytest.mark.asyncio
+    async def test_reference_counting(self, blob_store):
+        first = await blob_store.put(b"shared")
+        second = await blob_store.put(b"shared")
+        assert first == second
+        assert await blob_store.acquire(first) is True
+
+        await blob_store.release(first)
+        await blob_store.release(first)
+        assert await blob_store.get(first) == b"shared"
+
+        await blob_store.release(first)
+        assert await blob_store.get(first) is None
+
+    @pytest.mark.asyncio
+    async def test_acquire_missing(self, blob_store):
+        assert await blob_store.acquire("missing") is False
+
+    @pytest.mark.asyncio
+    async def test_writer(self, blob_store):
+        existing = await blob_store.put(b"abcdef")
+
+        writer = blob_store.open_writer()
+        await writer.write(b"abc")
+        await writer.write(b"def")
+        assert writer.size == 6
+        assert await writer.commit() == existing
+        assert await blob_store.get(existing) == b"abcdef"
+
+        # Two references now; both must be released
+        await blob_store.release(existing)
+        assert await blob_store.get(existing) == b"abcdef"
+
+    @pytest.mark.asyncio
+    async def test_writer_abort(self, blob_store):
+        writer = blob_store.open_writer()
+        await writer.write(b"partial")
+        await writer.abort()
+        assert await blob_store.get(writer.digest) is None
+
+
+class TestBlobBackedContext:
+    @pytest.fixture
+    def blob_store(self):
+        return MemoryBlobStore()
+
+    @pytest.fixture
+    def session_store(self):
+        return MemorySessionStore(ttl=3600)
+
+    @pytest.fixture
+    def service(self, session_store, blob_store, mock_providers):
+        return SessionService(
+            session_store=session_store,
+            providers=mock_providers,
+            blob_store=blob_store,
+        )
+
+    @pytest.mark.asyncio
+    async def test_files_stored_by_hash(self, service, blob_store):
+        spec = "# Spec\n" + "x" * 1000
+        sessions = [
+            await service.create_session(
+                provider="claude",
+                context={"files": [{"name": "spec.md", "content": spec}]},
+            )
+            for _ in range(3)
+        ]
+
+        digest = BlobStore.digest(spec.encode())
+        for session in sessions:
+            assert session.context.files == [{"name": "spec.md", "sha256": digest, "size": len(spec)}]
+        assert blob_store._refs[digest] == 3
+
+    @pytest.mark.asyncio
+    async def test_prompt_resolves_blobs(self, service, session_store):
+        session = await service.create_session(
+            provider="claude",
+            context={"files": [{"name": "main.py", "content": "print('hi')"}]},
+        )
+
+        # Reload as a store would, without attached contents
+        loaded = session.__class__.from_dict(session.to_dict())
+        assert "print('hi')" not in (loaded._build_system_prompt() or "")
+
+        await service.resolve_context(loaded)
+        prompt = loaded._build_system_prompt()
+        assert "## main.py\nprint('hi')" in prompt
+
+    @pytest.mark.asyncio
+    async def test_delete_releases_blobs(self, service, blob_store):
+        session = await service.create_session(
+            provider="claude",
+            context={"files": [{"name": "a.txt", "content": "a"}]},
+        )
+        digest = session.context.file_digests[0]
+
+        assert await service.delete_session(session.id) is True
+        assert await blob_store.get(digest) is None
+
+    @pytest.mark.asyncio
+    async def test_eviction_releases_blobs(self, blob_store, mock_providers):
+        import asyncio
+
+        store = MemorySessionStore(ttl=3600, max_sessions=1)
+        service = SessionService(session_store=store, providers=mock_providers, blob_store=blob_store)
+        store.set_removal_listener(service.on_session_removed)
+
+        first = await service.create_session(provider="claude", context={"files": [{"name": "a", "content": "a"}]})
+        await service.create_session(provider="claude")
+        await asyncio.sleep(0)
+
+        assert await blob_store.get(first.context.file_digests[0]) is None
+
+    @pytest.mark.asyncio
+    async def test_streaming_upload(self, service, blob_store):
+        session = await service.create_session(provider="claude")
+
+        async def chunks():
+            for part in (b"line 1\n", b"line 2\n"):
+                yield part
+
+        result = await service.attach_file(session.id, "notes.txt", chunks())
+        assert result["sha256"] == BlobStore.digest(b"line 1\nline 2\n")
+        assert await blob_store.get(result["sha256"]) == b"line 1\nline 2\n"
+
+        # Replacing the file releases the old blob
+        async def replacement():
+            yield b"new"
+
+        await service.attach_file(session.id, "notes.txt", replacement())
+        assert await blob_store.get(result["sha256"]) is None
+
+    @pytest.mark.asyncio
+    async def test_upload_keeps_concurrent_changes(self, service):
+        session = await service.create_session(provider="claude")
+
+        async def chunks():
+            yield b"data"
+            # Another replica writes its own copy while the file uploads
+            latest = session.__class__.from_dict((await service.get_session(session.id)).to_dict())
+            latest.add_user_message("hello")
+            await service.update_session(latest)
+
+        await service.attach_file(session.id, "notes.txt", chunks())
+
+        stored = await service.get_session(session.id)
+        assert [m.content for m in stored.messages] == ["hello"]
+        assert [f["name"] for f in stored.context.files] == ["notes.txt"]
+
+    @pytest.mark.asyncio
+    async def test_expiry_releases_blobs(self, blob_store, mock_providers):
+        import asyncio
+        from datetime import datetime, timedelta
+
+        store = MemorySessionStore(ttl=3600)
+        service = SessionService(session_store=store, providers=mock_providers, blob_store=blob_store)
+        store.set_removal_listener(service.on_session_removed)
+
+        session = await service.create_session(provider="claude", context={"files": [{"name": "a", "content": "a"}]})
+        session.expires_at = datetime.utcnow() - timedelta(seconds=1)
+        await service.update_session(session)
+
+        assert await store.cleanup_expired() == 1
+        await asyncio.sleep(0)
+        assert await blob_store.get(session.context.file_digests[0]) is None
+
+    @pytest.mark.asyncio
+    async def test_blobs_kept_for_session_lifetime(self, session_store, mock_providers):
+        class TouchRecorder(MemoryBlobStore):
+            def __init__(self):
+                super().__init__()
+                self.touched: list[tuple[list[str], int]] = []
+
+            async def touch(self, digests: list[str], ttl: int) -> None:
+                self.touched.append((digests, ttl))
+
+        blob_store = TouchRecorder()
+        service = SessionService(session_store=session_store, providers=mock_providers, blob_store=blob_store)
+
+        session = await service.create_session(
+            provider="claude", ttl=30 * 86400, context={"files": [{"name": "a", "content": "a"}]}
+        )
+
+        digests, ttl = blob_store.touched[-1]
+        assert digests == session.context.file_digests
+        assert 30 * 86400 - 5 <= ttl <= 30 * 86400
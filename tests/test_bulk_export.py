@@ -0,0 +1,173 @@
+"""Tests for bulk memory export"""
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from llm_mcp_hub.domain import SessionStatus
+from llm_mcp_hub.services import BulkExporter, ExportFilter
+from llm_mcp_hub.services.memory import CompressionLevel
+
+
+@pytest.fixture
+def exporter(session_service, memory_service):
+    return BulkExporter(session_service=session_service, memory_service=memory_service)
+
+
+async def _session(session_service, *contents, provider="claude"):
+    session = await session_service.create_session(provider=provider)
+    for content in contents:
+        session.add_user_message(content)
+    await session_service.update_session(session)
+    return session
+
+
+async def _run(exporter, **kwargs):
+    return [event async for event in exporter.run(**kwargs)]
+
+
+class TestBulkExporter:
+    @pytest.mark.asyncio
+    async def test_exports_matching_sessions(self, session_service, exporter):
+        claude = await _session(session_service, "one")
+        await _session(session_service, "two", provider="gemini")
+        await _session(session_service)  # no messages
+
+        events = await _run(exporter, export_filter=ExportFilter(provider="claude"), compression=CompressionLevel.NONE)
+
+        assert events[0] == {"type": "start", "compression": "none", "output_dir": None}
+        assert events[1]["session_id"] == claude.id
+        assert events[1]["status"] == "exported"
+        assert "one" in events[1]["content"]
+        assert events[1]["done"] == 1
+        assert events[-1]["type"] == "done"
+        assert events[-1]["total"] == 1
+        assert events[-1]["exported"] == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_conversations_are_rendered_once(self, session_service, exporter, mock_providers, monkeypatch):
+        calls = []
+        original = mock_providers["claude"].chat
+
+        async def chat(prompt, **kwargs):
+            calls.append(prompt)
+            await asyncio.sleep(0.01)
+            return await original(prompt, **kwargs)
+
+        monkeypatch.setattr(mock_providers["claude"], "chat", chat)
+        first = await _session(session_service, "same question")
+        second = await _session(session_service, "same question")
+        await _session(session_service, "other question")
+
+        events = await _run(exporter, export_filter=ExportFilter(), compression=CompressionLevel.MEDIUM)
+
+        sessions = {e["session_id"]: e for e in events if e["type"] == "session"}
+        statuses = sorted(e["status"] for e in sessions.values())
+        assert statuses == ["duplicate", "exported", "exported"]
+        duplicate = next(e for e in sessions.values() if e["status"] == "duplicate")
+        assert duplicate["duplicate_of"] in {first.id, second.id} - {duplicate["session_id"]}
+        assert len(calls) == 2
+        assert events[-1]["duplicate"] == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicates_do_not_hold_workers(self, session_service, exporter, memory_service, monkeypatch):
+        others = asyncio.Event()
+        rendered = []
+        original = memory_service.render_memory
+
+        async def render(session, *args, **kwargs):
+            content = session.messages[0].content
+            if content == "same":
+                # Only finishes once other sessions got a worker
+                await asyncio.wait_for(others.wait(), 1)
+            else:
+                rendered.append(content)
+                if len(rendered) == 2:
+                    others.set()
+            return await original(session, *args, **kwargs)
+
+        monkeypatch.setattr(memory_service, "render_memory", render)
+        for content in ("other 1", "other 2", "same", "same", "same"):
+            await _session(session_service, content)
+
+        events = await _run(exporter, export_filter=ExportFilter(), compression=CompressionLevel.NONE, concurrency=2)
+
+        assert events[-1]["exported"] == 3
+        assert events[-1]["duplicate"] == 2
+
+    @pytest.mark.asyncio
+    async def test_closed_sessions(self, session_service, exporter):
+        session = await _session(session_service, "hello")
+        await session_service.close_session(session.id)
+
+        events = await _run(
+            exporter,
+            export_filter=ExportFilter(session_ids=[session.id], status=SessionStatus.CLOSED),
+            compression=CompressionLevel.NONE,
+        )
+
+        assert events[1]["status"] == "exported"
+        assert "hello" in events[1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, session_service, exporter, memory_service, monkeypatch):
+        running = 0
+        peak = 0
+        original = memory_service.render_memory
+
+        async def render(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return await original(*args, **kwargs)
+
+        monkeypatch.setattr(memory_service, "render_memory", render)
+        for i in range(6):
+            await _session(session_service, f"question {i}")
+
+        await _run(exporter, export_filter=ExportFilter(), compression=CompressionLevel.NONE, concurrency=2)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_idle_filter(self, session_service, exporter):
+        idle = await _session(session_service, "old")
+        idle.updated_at = datetime.utcnow() - timedelta(hours=1)
+        await _session(session_service, "new")
+
+        events = await _run(
+            exporter,
+            export_filter=ExportFilter(idle_seconds=600),
+            compression=CompressionLevel.NONE,
+        )
+
+        assert [e["session_id"] for e in events if e["type"] == "session"] == [idle.id]
+
+    @pytest.mark.asyncio
+    async def test_writes_directory(self, session_service, exporter, tmp_path):
+        session = await _session(session_service, "hello")
+        output_dir = tmp_path / "job"
+
+        await _run(exporter, export_filter=ExportFilter(), compression=CompressionLevel.NONE, output_dir=output_dir)
+
+        assert "hello" in (output_dir / f"{session.id}.md").read_text()
+        manifest = [json.loads(line) for line in (output_dir / "manifest.ndjson").read_text().splitlines()]
+        assert [e["type"] for e in manifest] == ["start", "session", "done"]
+        assert "content" not in manifest[1]
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported(self, session_service, exporter, memory_service, monkeypatch):
+        async def fail(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(memory_service, "render_memory", fail)
+        await _session(session_service, "hello")
+
+        events = await _run(exporter, export_filter=ExportFilter(), compression=CompressionLevel.NONE)
+
+        assert events[1]["status"] == "failed"
+        assert events[1]["error"] == "boom"
+        assert events[-1]["failed"] == 1
@@ -0,0 +1,116 @@
+"""Tests for chat service"""
+import asyncio
+
+import pytest
+
+from llm_mcp_hub.core.exceptions import SessionExpiredError, SessionNotFoundError
+from llm_mcp_hub.domain import Session, SessionStatus
+
+
+@pytest.fixture
+def hanging_stream(mock_providers, monkeypatch):
+    """Claude mock stream that sends one chunk and then hangs; records cleanup"""
+    state = {"closed": False}
+
+    async def chat_stream(prompt, **kwargs):
+        try:
+            yield "partial "
+            await asyncio.sleep(3600)
+            yield "never"
+        finally:
+            state["closed"] = True
+
+    monkeypatch.setattr(mock_providers["claude"], "chat_stream", chat_stream)
+    return state
+
+
+class TestChatStreamAbort:
+    @pytest.mark.asyncio
+    async def test_closed_stream_records_aborted_turn(self, session_service, chat_service, hanging_stream):
+        session = await session_service.create_session(provider="claude")
+
+        stream = chat_service.chat_stream(prompt="hello", session_id=session.id)
+        first = await anext(stream)
+        await stream.aclose()
+
+        assert first["text"] == "partial "
+        assert hanging_stream["closed"]
+        last = session.messages[-1]
+        assert last.content == "partial "
+        assert last.metadata == {"aborted": True}
+        assert chat_service._admission.in_flight("claude") == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_stream_records_aborted_turn(self, session_service, chat_service, hanging_stream):
+        session = await session_service.create_session(provider="claude")
+        received = []
+
+        async def consume():
+            async for event in chat_service.chat_stream(prompt="hello", session_id=session.id):
+                received.append(event)
+
+        task = asyncio.create_task(consume())
+        while not received:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert hanging_stream["closed"]
+        assert session.messages[-1].metadata == {"aborted": True}
+        assert chat_service._admission.in_flight("claude") == 0
+
+    @pytest.mark.asyncio
+    async def test_completed_stream_is_not_aborted(self, session_service, chat_service):
+        session = await session_service.create_session(provider="claude")
+
+        events = [e async for e in chat_service.chat_stream(prompt="hello", session_id=session.id)]
+
+        assert events[-1]["type"] == "done"
+        assert session.messages[-1].metadata == {}
+
+
+class TestConversation:
+    async def _turn(self, chat_service, conversation, prompt="hello"):
+        return [e async for e in chat_service.stream_conversation(conversation, prompt)]
+
+    @pytest.mark.asyncio
+    async def test_deleted_session_is_not_resurrected(self, session_service, session_store, chat_service):
+        session = await session_service.create_session(provider="claude")
+        conversation = await chat_service.open_conversation(session.id)
+        await session_service.delete_session(session.id)
+
+        with pytest.raises(SessionNotFoundError):
+            await self._turn(chat_service, conversation)
+
+        assert await session_store.get(session.id) is None
+
+    @pytest.mark.asyncio
+    async def test_closed_session_is_rejected(self, session_service, session_store, chat_service):
+        session = await session_service.create_session(provider="claude")
+        conversation = await chat_service.open_conversation(session.id)
+        await session_service.close_session(session.id)
+
+        with pytest.raises(SessionExpiredError):
+            await self._turn(chat_service, conversation)
+
+        stored = await session_store.get(session.id)
+        assert stored.status == SessionStatus.CLOSED
+        assert stored.messages == []
+
+    @pytest.mark.asyncio
+    async def test_stale_session_is_reloaded(self, session_service, session_store, chat_service):
+        session = await session_service.create_session(provider="claude")
+        conversation = await chat_service.open_conversation(session.id)
+
+        # Another writer stores its own copy (as a Redis-backed replica would)
+        other = Session.from_dict(session.to_dict())
+        other.add_user_message("from REST")
+        await session_store.update(other)
+
+        events = await self._turn(chat_service, conversation)
+
+        assert events[-1]["type"] == "done"
+        stored = await session_store.get(session.id)
+        assert [m.content for m in stored.messages] == ["from REST", "hello", "Mock Claude streaming response"]
+        assert conversation.session.revision == stored.revision
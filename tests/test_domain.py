@@ -1,7 +1,7 @@
 """Tests for domain models"""
 import pytest
 from datetime import datetime, timedelta
-from llm_mcp_hub.domain import Message, MessageRole, Session, SessionContext, SessionStatus
+from llm_mcp_hub.domain import Message, MessageRole, Session, SessionContext, SessionHeader, SessionStatus
 
 
 class TestMessage:
@@ -38,6 +38,22 @@ class TestMessage:
         assert msg.role == MessageRole.ASSISTANT
         assert msg.content == "Response"
 
+    def test_message_lazy_timestamp(self):
+        data = {
+            "role": "user",
+            "content": "Hi",
+            "timestamp": "2024-01-01T12:30:00",
+            "metadata": {"k": "v"},
+        }
+        msg = Message.from_dict(data)
+        # Unparsed timestamps are written back unchanged
+        assert msg.to_dict() == data
+        assert msg.timestamp == datetime(2024, 1, 1, 12, 30)
+
+    def test_message_round_trip(self):
+        msg = Message.assistant("Answer", source="test")
+        assert Message.from_dict(msg.to_dict()) == msg
+
 
 class TestSessionContext:
     def test_empty_context(self):
@@ -62,6 +78,41 @@ class TestSessionContext:
         assert "file.py" in prompt
 
 
+class TestSystemPromptCache:
+    def test_prompt_is_cached(self):
+        session = Session(
+            provider="claude",
+            model="sonnet",
+            system_prompt="You are helpful",
+            context=SessionContext(memory="# Memory"),
+        )
+        first = session._build_system_prompt()
+        assert session._build_system_prompt() is first
+
+    def test_system_prompt_change_invalidates(self):
+        session = Session(provider="claude", model="sonnet", system_prompt="A")
+        assert session._build_system_prompt() == "A"
+
+        session.system_prompt = "B"
+        assert session._build_system_prompt() == "B"
+
+    def test_context_change_invalidates(self):
+        session = Session(provider="claude", model="sonnet", context=SessionContext(memory="old"))
+        assert "old" in session._build_system_prompt()
+
+        session.context.memory = "new"
+        assert "new" in session._build_system_prompt()
+
+        session.context = SessionContext(previous_summary="summary")
+        prompt = session._build_system_prompt()
+        assert "summary" in prompt
+        assert "new" not in prompt
+
+    def test_no_prompt(self):
+        session = Session(provider="claude", model="sonnet")
+        assert session._build_system_prompt() is None
+
+
 class TestSession:
     def test_create_session(self):
         session = Session(
@@ -128,6 +179,22 @@ class TestSession:
         assert session.provider == "gemini"
         assert len(session.messages) == 1
 
+    def test_session_round_trip(self):
+        session = Session(
+            provider="claude",
+            model="sonnet",
+            system_prompt="Be brief",
+            context=SessionContext(memory="# Memory", files=[{"name": "a.py", "content": "x = 1"}]),
+            expires_at=datetime.utcnow() + timedelta(hours=1),
+        )
+        session.add_user_message("Hello")
+        session.add_assistant_message("Hi!")
+
+        loaded = Session.from_dict(session.to_dict())
+        assert loaded.to_dict() == session.to_dict()
+        assert loaded.messages == session.messages
+        assert loaded.get_conversation_for_llm() == session.get_conversation_for_llm()
+
     def test_get_conversation_for_llm(self):
         session = Session(
             provider="claude",
@@ -141,3 +208,29 @@ class TestSession:
         assert conv[0]["role"] == "system"
         assert conv[1]["role"] == "user"
         assert conv[2]["role"] == "assistant"
+
+
+class TestSessionHeader:
+    def test_from_session(self):
+        session = Session(provider="claude", model="sonnet")
+        session.add_user_message("Hello")
+        header = SessionHeader.from_session(session)
+
+        assert header.id == session.id
+        assert header.provider == "claude"
+        assert header.model == "sonnet"
+        assert header.status == SessionStatus.ACTIVE
+        assert header.message_count == 1
+
+    def test_header_round_trip(self):
+        session = Session(
+            provider="gemini",
+            model="gemini-2.5-pro",
+            expires_at=datetime.utcnow() + timedelta(hours=1),
+        )
+        header = SessionHeader.from_dict(SessionHeader.from_session(session).to_dict())
+
+        assert header.id == session.id
+        assert header.created_at == session.created_at
+        assert header.expires_at == session.expires_at
+        assert header.is_active() is True
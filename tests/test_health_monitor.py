@@ -0,0 +1,94 @@
+"""Tests for background health probing"""
+import asyncio
+
+import pytest
+
+from llm_mcp_hub.services import HealthMonitor
+
+
+class _Probe:
+    """Health check stub with scripted results"""
+
+    def __init__(self, *results, delay: float = 0.0):
+        self.results = list(results)
+        self.delay = delay
+        self.calls = 0
+
+    async def health_check(self) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        result = self.results[min(self.calls, len(self.results)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestHealthMonitor:
+    @pytest.mark.asyncio
+    async def test_probes_in_parallel(self):
+        providers = {
+            "claude": _Probe({"status": "healthy"}, delay=0.1),
+            "gemini": _Probe({"status": "healthy"}, delay=0.1),
+        }
+        store = _Probe({"status": "healthy", "latency_ms": 3, "details": {"pool": {"in_use": 1}}}, delay=0.1)
+        monitor = HealthMonitor(store, providers)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        components = await monitor.probe()
+
+        assert loop.time() - started < 0.25
+        assert set(components) == {"redis", "claude", "gemini"}
+        assert components["redis"].latency_ms == 3
+        assert components["redis"].details == {"pool": {"in_use": 1}}
+        assert components["claude"].latency_ms >= 100
+
+    @pytest.mark.asyncio
+    async def test_components_are_cached(self):
+        claude = _Probe({"status": "healthy", "supported_models": ["sonnet"]})
+        monitor = HealthMonitor(object(), {"claude": claude})
+
+        for _ in range(5):
+            components = await monitor.components()
+
+        assert claude.calls == 1
+        assert components["claude"].supported_models == ["sonnet"]
+        assert "redis" not in components
+
+    @pytest.mark.asyncio
+    async def test_last_success_survives_failures(self):
+        claude = _Probe({"status": "healthy"}, RuntimeError("spawn failed"))
+        monitor = HealthMonitor(object(), {"claude": claude})
+
+        first = (await monitor.probe())["claude"]
+        second = (await monitor.probe())["claude"]
+
+        assert first.status == "healthy"
+        assert second.status == "unhealthy"
+        assert second.error == "spawn failed"
+        assert second.last_success == first.last_success
+        assert second.checked_at >= first.checked_at
+
+    @pytest.mark.asyncio
+    async def test_probe_timeout(self):
+        monitor = HealthMonitor(object(), {"claude": _Probe({"status": "healthy"}, delay=1)}, timeout=0.01)
+
+        component = (await monitor.probe())["claude"]
+
+        assert component.status == "unhealthy"
+        assert "timed out" in component.error
+        assert component.last_success is None
+
+    @pytest.mark.asyncio
+    async def test_background_probing(self):
+        claude = _Probe({"status": "healthy"})
+        monitor = HealthMonitor(object(), {"claude": claude}, interval=0.01)
+
+        monitor.start()
+        await asyncio.sleep(0.05)
+        await monitor.close()
+        calls = claude.calls
+
+        assert calls >= 2
+        await asyncio.sleep(0.03)
+        assert claude.calls == calls
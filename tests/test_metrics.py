@@ -0,0 +1,85 @@
+"""Tests for in-process metrics"""
+import math
+
+import pytest
+
+from llm_mcp_hub.core.metrics import MetricsRegistry, RollingQuantiles
+
+
+class TestMetricsRegistry:
+    def test_counter_with_labels(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests", ("method",))
+        counter.labels("GET").inc()
+        counter.labels(method="GET").inc(2)
+        counter.labels("POST").inc()
+
+        values = {labels["method"]: child.value for labels, child in counter.children()}
+        assert values == {"GET": 3, "POST": 1}
+
+    def test_get_or_create(self):
+        registry = MetricsRegistry()
+        assert registry.counter("c", "C") is registry.counter("c", "C")
+        with pytest.raises(ValueError):
+            registry.histogram("c", "C")
+
+    def test_label_count_checked(self):
+        counter = MetricsRegistry().counter("c", "C", ("a", "b"))
+        with pytest.raises(ValueError):
+            counter.labels("only-one")
+
+    def test_histogram_buckets(self):
+        histogram = MetricsRegistry().histogram("h", "H", buckets=(1.0, 2.0))
+        for value in (0.5, 1.0, 1.5, 3.0):
+            histogram.observe(value)
+
+        child = histogram.labels()
+        assert child.cumulative() == [(1.0, 2), (2.0, 3), (math.inf, 4)]
+        assert child.sum == 6.0
+        assert child.count == 4
+
+    def test_gauge(self):
+        gauge = MetricsRegistry().gauge("g", "G")
+        gauge.set(5)
+        gauge.labels().dec(2)
+        assert gauge.labels().value == 3
+
+
+class TestRollingQuantiles:
+    def test_percentiles(self):
+        window = RollingQuantiles()
+        assert window.percentiles(50) == {}
+
+        for value in range(1, 101):
+            window.observe(value)
+
+        assert window.percentiles(50, 95, 99, 100) == {"p50": 50, "p95": 95, "p99": 99, "p100": 100}
+
+    def test_keeps_recent_observations(self):
+        window = RollingQuantiles(size=10)
+        for value in range(100):
+            window.observe(value)
+
+        assert len(window) == 10
+        assert window.percentiles(0, 100) == {"p0": 90, "p100": 99}
+
+
+class TestExposition:
+    def test_render(self):
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "Jobs run", ("queue",)).labels('a"b').inc(2)
+        registry.histogram("wait_seconds", "Wait time", buckets=(0.1, 1.0)).observe(0.5)
+
+        assert registry.render() == "\n".join([
+            "# HELP jobs_total Jobs run",
+            "# TYPE jobs_total counter",
+            'jobs_total{queue="a\\"b"} 2',
+            "# HELP wait_seconds Wait time",
+            "# TYPE wait_seconds histogram",
+            'wait_seconds_bucket{le="0.1"} 0',
+            'wait_seconds_bucket{le="1"} 1',
+            'wait_seconds_bucket{le="+Inf"} 1',
+            "wait_seconds_sum 0.5",
+            "wait_seconds_count 1",
+            "",
+        ])
@@ -0,0 +1,100 @@
+"""Tests for stream replay logs"""
+import asyncio
+
+import pytest
+
+from llm_mcp_hub.core.exceptions import StreamNotResumableError
+from llm_mcp_hub.services import MemoryReplayLog
+
+
+async def _collect(log, stream_id, after=0):
+    return [event async for event in log.read(stream_id, after)]
+
+
+def _content(text):
+    return {"type": "content", "text": text}
+
+
+class TestMemoryReplayLog:
+    @pytest.mark.asyncio
+    async def test_create_is_exclusive(self):
+        log = MemoryReplayLog()
+        assert await log.create("s")
+        assert not await log.create("s")
+
+    @pytest.mark.asyncio
+    async def test_read_after_id(self):
+        log = MemoryReplayLog()
+        await log.create("s")
+        for text in "abc":
+            await log.append("s", _content(text))
+        await log.append("s", {"type": "done"})
+
+        events = await _collect(log, "s", after=2)
+        assert [e["id"] for e in events] == [3, 4]
+        assert events[0]["text"] == "c"
+        assert events[-1]["type"] == "done"
+
+    @pytest.mark.asyncio
+    async def test_reader_follows_live_stream(self):
+        log = MemoryReplayLog()
+        await log.create("s")
+        reader = asyncio.create_task(_collect(log, "s"))
+
+        for text in "ab":
+            await asyncio.sleep(0)
+            await log.append("s", _content(text))
+        await log.append("s", {"type": "done"})
+
+        events = await asyncio.wait_for(reader, 1)
+        assert [e.get("text") for e in events] == ["a", "b", None]
+
+    @pytest.mark.asyncio
+    async def test_finish_ends_readers(self):
+        log = MemoryReplayLog()
+        await log.create("s")
+        await log.append("s", _content("a"))
+        reader = asyncio.create_task(_collect(log, "s"))
+        await asyncio.sleep(0)
+        await log.finish("s")
+        assert len(await asyncio.wait_for(reader, 1)) == 1
+
+    @pytest.mark.asyncio
+    async def test_dropped_events_are_not_resumable(self):
+        log = MemoryReplayLog(max_events=2)
+        await log.create("s")
+        for text in "abcd":
+            await log.append("s", _content(text))
+
+        with pytest.raises(StreamNotResumableError):
+            await log.check("s", after=1)
+        await log.check("s", after=2)
+
+    @pytest.mark.asyncio
+    async def test_unknown_and_expired_streams(self):
+        log = MemoryReplayLog(ttl=0)
+        with pytest.raises(StreamNotResumableError):
+            await log.check("missing")
+
+        await log.create("s")
+        await log.finish("s")
+        with pytest.raises(StreamNotResumableError):
+            await log.check("s")
+
+    @pytest.mark.asyncio
+    async def test_record_marks_cancellation(self):
+        log = MemoryReplayLog()
+        await log.create("s")
+
+        async def events():
+            yield _content("partial")
+            await asyncio.sleep(3600)
+
+        recorder = asyncio.create_task(log.record("s", events()))
+        await asyncio.sleep(0.01)
+        recorder.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await recorder
+
+        events = await _collect(log, "s")
+        assert events[-1]["code"] == "REQUEST_CANCELLED"
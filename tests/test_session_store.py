@@ -110,3 +110,171 @@ class TestMemorySessionStore:
         # Active session should remain
         assert await session_store.exists(active.id) is True
         assert await session_store.exists(expired.id) is False
+
+    @pytest.mark.asyncio
+    async def test_list_sessions_newest_first(self, session_store):
+        base = datetime.utcnow()
+        ids = []
+        # Insert out of order to exercise the sorted index
+        for minutes in [2, 0, 4, 1, 3]:
+            session = Session(provider="claude", model="sonnet", created_at=base + timedelta(minutes=minutes))
+            await session_store.create(session)
+            ids.append((minutes, session.id))
+        expected = [sid for _, sid in sorted(ids, reverse=True)]
+
+        sessions = await session_store.list_sessions(limit=10)
+        assert [s.id for s in sessions] == expected
+
+        page = await session_store.list_sessions(limit=2, offset=1)
+        assert [s.id for s in page] == expected[1:3]
+
+        assert await session_store.list_sessions(limit=2, offset=10) == []
+
+    @pytest.mark.asyncio
+    async def test_list_sessions_after_delete(self, session_store):
+        sessions = []
+        for _ in range(3):
+            session = Session(provider="claude", model="sonnet")
+            await session_store.create(session)
+            sessions.append(session)
+
+        await session_store.delete(sessions[1].id)
+        await session_store.cleanup_expired()
+
+        listed = await session_store.list_sessions()
+        assert [s.id for s in listed] == [sessions[2].id, sessions[0].id]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_expired_after_extension(self, session_store):
+        session = Session(
+            provider="claude",
+            model="sonnet",
+            expires_at=datetime.utcnow() - timedelta(seconds=1),
+        )
+        await session_store.create(session)
+
+        # Extending expiry reschedules the session instead of removing it
+        session.expires_at = datetime.utcnow() + timedelta(hours=1)
+        await session_store.update(session)
+
+        assert await session_store.cleanup_expired() == 0
+        assert await session_store.exists(session.id) is True
+
+    @pytest.mark.asyncio
+    async def test_cleanup_task(self, session_store):
+        import asyncio
+
+        expired = Session(
+            provider="claude",
+            model="sonnet",
+            expires_at=datetime.utcnow() - timedelta(seconds=1),
+        )
+        await session_store.create(expired)
+
+        session_store.start_cleanup_task(interval=0.01)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            await session_store.stop_cleanup_task()
+
+        assert await session_store.exists(expired.id) is False
+
+
+class TestMemorySessionStoreLimits:
+    @pytest.mark.asyncio
+    async def test_max_sessions_evicts_least_recently_used(self):
+        store = MemorySessionStore(ttl=3600, max_sessions=2)
+        first = Session(provider="claude", model="sonnet")
+        second = Session(provider="claude", model="sonnet")
+        third = Session(provider="claude", model="sonnet")
+
+        await store.create(first)
+        await store.create(second)
+        await store.get(first.id)  # first becomes most recently used
+        await store.create(third)
+
+        assert await store.exists(first.id) is True
+        assert await store.exists(second.id) is False
+        assert await store.exists(third.id) is True
+        assert len(await store.list_sessions()) == 2
+
+    @pytest.mark.asyncio
+    async def test_max_message_bytes_evicts(self):
+        store = MemorySessionStore(ttl=3600, max_message_bytes=10)
+        old = Session(provider="claude", model="sonnet")
+        await store.create(old)
+        old.add_user_message("123456")
+        await store.update(old)
+
+        new = Session(provider="claude", model="sonnet")
+        await store.create(new)
+        new.add_user_message("abcdef")
+        await store.update(new)
+
+        assert await store.exists(old.id) is False
+        assert await store.exists(new.id) is True
+
+    @pytest.mark.asyncio
+    async def test_single_session_over_limit_is_kept(self):
+        store = MemorySessionStore(ttl=3600, max_message_bytes=4)
+        session = Session(provider="claude", model="sonnet")
+        await store.create(session)
+        session.add_user_message("too large")
+        await store.update(session)
+
+        assert await store.exists(session.id) is True
+
+
+class TestMemorySessionStoreHeaders:
+    @pytest.mark.asyncio
+    async def test_get_header(self, session_store, sample_session):
+        sample_session.add_user_message("Hello")
+        sample_session.add_assistant_message("Hi")
+        await session_store.create(sample_session)
+
+        header = await session_store.get_header(sample_session.id)
+        assert header is not None
+        assert header.id == sample_session.id
+        assert header.provider == "claude"
+        assert header.message_count == 2
+
+        sample_session.add_user_message("More")
+        await session_store.update(sample_session)
+        header = await session_store.get_header(sample_session.id)
+        assert header.message_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_header_nonexistent(self, session_store):
+        assert await session_store.get_header("nonexistent") is None
+
+    @pytest.mark.asyncio
+    async def test_get_header_expired(self, session_store):
+        session = Session(
+            provider="claude",
+            model="sonnet",
+            expires_at=datetime.utcnow() - timedelta(hours=1),
+        )
+        await session_store.create(session)
+
+        header = await session_store.get_header(session.id)
+        assert header.status == SessionStatus.EXPIRED
+        assert header.is_active() is False
+
+    @pytest.mark.asyncio
+    async def test_list_headers(self, session_store):
+        for _ in range(3):
+            await session_store.create(Session(provider="claude", model="sonnet"))
+
+        sessions = await session_store.list_sessions(limit=2)
+        headers = await session_store.list_headers(limit=2)
+        assert [h.id for h in headers] == [s.id for s in sessions]
+
+    @pytest.mark.asyncio
+    async def test_iter_messages(self, session_store, sample_session):
+        sample_session.add_user_message("Hello")
+        sample_session.add_assistant_message("Hi")
+        await session_store.create(sample_session)
+
+        messages = [m async for m in session_store.iter_messages(sample_session.id)]
+        assert [m.content for m in messages] == ["Hello", "Hi"]
+        assert [m async for m in session_store.iter_messages("nonexistent")] == []
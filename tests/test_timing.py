@@ -0,0 +1,55 @@
+"""Tests for per-request phase timings"""
+import asyncio
+
+import pytest
+
+from llm_mcp_hub.core.timing import RequestTimings, collect_timings, current_timings, mark, record, tag, timed
+
+
+class TestRequestTimings:
+    def test_phases_add_up(self):
+        timings = RequestTimings()
+        timings.add("store_write", 0.002)
+        timings.add("store_write", 0.003)
+
+        assert timings.as_dict()["store_write"] == pytest.approx(5.0)
+        assert "total" in timings.as_dict()
+
+    def test_mark_once(self):
+        timings = RequestTimings()
+        timings.mark("first_byte")
+        first = timings.phases["first_byte"]
+        timings.mark("first_byte")
+
+        assert timings.phases["first_byte"] == first
+
+    def test_server_timing(self):
+        timings = RequestTimings()
+        timings.add("queue_wait", 0.0015)
+
+        header = timings.server_timing()
+
+        assert header.startswith("queue_wait;dur=1.5, total;dur=")
+
+    def test_outside_request(self):
+        record("spawn", 1.0)
+        mark("first_byte")
+        tag(provider="claude")
+
+        assert current_timings() is None
+
+    @pytest.mark.asyncio
+    async def test_collected_across_tasks(self):
+        async def spawn():
+            with timed("spawn"):
+                await asyncio.sleep(0.01)
+
+        with collect_timings() as timings:
+            await asyncio.create_task(spawn())
+            await asyncio.to_thread(record, "queue_wait", 0.001)
+            tag(provider="claude")
+
+        assert timings.phases["spawn"] >= 10
+        assert timings.phases["queue_wait"] == pytest.approx(1.0)
+        assert timings.tags == {"provider": "claude"}
+        assert current_timings() is None